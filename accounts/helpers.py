@@ -1,7 +1,14 @@
 # accounts/helpers.py
+import csv
+import json
+
+from django.contrib.auth.models import Permission
+from django.db.models import Prefetch
 from django.utils.timezone import localtime
 from django.utils.dateformat import format as dj_format
 
+from bugettracker.streaming import Echo
+
 def mmt(dt):
     """
     Return Myanmar-time datetime as: 2025-06-26 10:45:30 PM
@@ -12,3 +19,98 @@ def mmt(dt):
     # h = 12-hour (01-12) │ i = minutes │ s = seconds │ A = AM/PM
     return dj_format(localtime(dt), "Y-m-d h:i:s A")
 
+
+
+# ======================================================
+# Effective permissions without per-user queries
+# ======================================================
+
+def with_permissions(users):
+    """
+    Prefetch what EffectivePermissions reads: groups, their permissions and
+    the user's direct permissions (content types joined in). Three queries
+    per evaluated batch of users, whatever the batch size.
+    """
+    return users.prefetch_related(
+        "groups",
+        Prefetch("groups__permissions", queryset=Permission.objects.select_related("content_type")),
+        Prefetch("user_permissions", queryset=Permission.objects.select_related("content_type")),
+    )
+
+
+def permission_name(perm):
+    return f"{perm.content_type.app_label}.{perm.codename}"
+
+
+class EffectivePermissions:
+    """
+    user.get_all_permissions() (ModelBackend rules) from prefetched data:
+    inactive -> none, superuser -> every permission (loaded once),
+    otherwise direct permissions + permissions of the user's groups.
+    """
+
+    def __init__(self):
+        self._everything = None
+
+    def __call__(self, user):
+        if not user.is_active:
+            return set()
+
+        if user.is_superuser:
+            if self._everything is None:
+                self._everything = {
+                    f"{app_label}.{codename}"
+                    for app_label, codename in Permission.objects.values_list("content_type__app_label", "codename")
+                }
+            return set(self._everything)
+
+        perms = {permission_name(p) for p in user.user_permissions.all()}
+        for group in user.groups.all():
+            perms.update(permission_name(p) for p in group.permissions.all())
+        return perms
+
+
+# ======================================================
+# Streamed user export (CSV / NDJSON)
+# ======================================================
+USER_EXPORT_FIELDS = ("id", "username", "email", "phone", "is_active", "groups", "permissions", "created_at")
+
+
+def user_export_rows(users, chunk_size=2000):
+    """
+    Yield one dict per user. `users` should come from with_permissions();
+    iterator() runs its prefetches per chunk, so memory stays at one chunk.
+    """
+    permissions_of = EffectivePermissions()
+    for u in users.iterator(chunk_size=chunk_size):
+        yield {
+            "id": str(u.id),
+            "username": u.username,
+            "email": u.email,
+            "phone": str(u.phone),
+            "is_active": u.is_active,
+            "groups": [g.name for g in u.groups.all()],
+            "permissions": sorted(permissions_of(u)),
+            "created_at": str(u.created_at),
+        }
+
+
+def iter_users_csv(users, chunk_size=2000):
+    writer = csv.writer(Echo())
+    yield writer.writerow(USER_EXPORT_FIELDS)
+    for row in user_export_rows(users, chunk_size):
+        yield writer.writerow([
+            row["id"],
+            row["username"],
+            row["email"],
+            row["phone"],
+            "true" if row["is_active"] else "false",
+            ",".join(row["groups"]),
+            ",".join(row["permissions"]),
+            row["created_at"],
+        ])
+
+
+def iter_users_ndjson(users, chunk_size=2000):
+    for row in user_export_rows(users, chunk_size):
+        yield json.dumps(row, ensure_ascii=False) + "\n"
@@ -1,3 +1,115 @@
-from django.test import TestCase
+import json
+import math
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import Group, Permission
+from django.db import connection
+from django.test import TestCase, tag
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from . import views
+from .helpers import EffectivePermissions, with_permissions
+
+User = get_user_model()
+PASSWORD = make_password("s3cret-pass!")
+
+
+def make_users(count, group, permission):
+    users = User.objects.bulk_create(
+        User(username=f"user{i:06d}", email=f"user{i:06d}@example.com", phone=f"+9594{i:07d}", password=PASSWORD)
+        for i in range(count)
+    )
+    User.groups.through.objects.bulk_create(
+        User.groups.through(customuser_id=u.id, group_id=group.id) for u in users
+    )
+    User.user_permissions.through.objects.bulk_create(
+        User.user_permissions.through(customuser_id=u.id, permission_id=permission.id) for u in users[::2]
+    )
+    return users
+
+
+class UserListQueryTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser(
+            username="admin", email="admin@example.com", phone="+959420000007", password="s3cret-pass!"
+        )
+        cls.group = Group.objects.create(name="auditors")
+        cls.group.permissions.set(Permission.objects.filter(codename__startswith="view_")[:5])
+        cls.permission = Permission.objects.filter(codename__startswith="add_").first()
+        make_users(60, cls.group, cls.permission)
+        User.objects.filter(username="user000003").update(is_active=False)
+
+    def get(self, **params):
+        request = APIRequestFactory().get("/api/auth/users/", params)
+        force_authenticate(request, user=self.admin)
+        with CaptureQueriesContext(connection) as queries:
+            response = views.user_list(request)
+        return response, len(queries)
+
+    def test_query_count_does_not_depend_on_page_size(self):
+        small, small_queries = self.get(page_size=1)
+        large, large_queries = self.get(page_size=50)
+
+        self.assertEqual(small.status_code, 200)
+        self.assertEqual(large.status_code, 200)
+        self.assertEqual(len(large.data["results"]), 50)
+        self.assertEqual(small_queries, large_queries)
+
+    def test_permissions_match_model_backend(self):
+        permissions_of = EffectivePermissions()
+        for user in with_permissions(User.objects.order_by("username")):
+            fresh = User.objects.get(pk=user.pk)
+            self.assertEqual(permissions_of(user), fresh.get_all_permissions(), user.username)
+
+    def test_csv_export(self):
+        response, _ = self.get(format="csv")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        lines = b"".join(response.streaming_content).decode().strip().splitlines()
+        self.assertEqual(len(lines), 1 + User.objects.count())
+
+    def test_ndjson_export(self):
+        response, _ = self.get(format="ndjson", username="user00000")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        rows = [json.loads(line) for line in b"".join(response.streaming_content).decode().splitlines()]
+        self.assertEqual(len(rows), 10)
+        for row in rows:
+            user = User.objects.get(pk=row["id"])
+            self.assertEqual(row["groups"], ["auditors"])
+            self.assertEqual(row["permissions"], sorted(user.get_all_permissions()))
+
+
+@tag("slow")
+class UserExportQueryTests(TestCase):
+    """Creates 50k users (~40s); skip with `manage.py test --exclude-tag slow`."""
+    COUNT = 50_000
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser(
+            username="admin", email="admin@example.com", phone="+959420000008", password="s3cret-pass!"
+        )
+        group = Group.objects.create(name="auditors")
+        group.permissions.set(Permission.objects.filter(codename__startswith="view_")[:5])
+        make_users(cls.COUNT, group, Permission.objects.filter(codename__startswith="add_").first())
+
+    def test_csv_export_query_count_is_bounded(self):
+        request = APIRequestFactory().get("/api/auth/users/", {"format": "csv"})
+        force_authenticate(request, user=self.admin)
+        with CaptureQueriesContext(connection) as queries:
+            response = views.user_list(request)
+            rows = sum(1 for _ in response.streaming_content)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(rows, 1 + self.COUNT + 1)
+        # at most: users + (groups, group permissions, user permissions) per chunk + all permissions once
+        # for the superuser. Django skips a prefetch level when a chunk has nothing to prefetch for.
+        chunks = math.ceil((self.COUNT + 1) / views.USER_EXPORT_CHUNK_SIZE)
+        self.assertLessEqual(len(queries), 1 + 3 * chunks + 1)
@@ -1,4 +1,4 @@
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, permission_classes, renderer_classes
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
@@ -12,15 +12,15 @@ from .serializers import (
     RegisterSerializer, UserProfileSerializer, UserDetailSerializer,
     ResetPasswordSerializer, ForgotPasswordSerializer,GroupWithPermissionsSerializer
 )
-from .helpers import mmt
+from .helpers import mmt, with_permissions, EffectivePermissions, iter_users_csv, iter_users_ndjson
+from rest_framework.settings import api_settings
 from rest_framework.pagination import PageNumberPagination
 from django.db import transaction
 
 from datetime import datetime, time
 from django.utils.dateparse import parse_date
 from django.utils.timezone import make_aware, is_naive
-from django.http import HttpResponse
-import csv
+from bugettracker.streaming import CSVRenderer, NDJSONRenderer, streaming_response
 
 
 
@@ -189,8 +189,13 @@ def user_profile(request):
 # ======================================================
 # ✅ User List (Admin or Staff) + Sorting + Date Filter + CSV Export
 # ======================================================
+USER_EXPORT_CHUNK_SIZE = 2000
+
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
+# ?format=csv|ndjson is DRF's format override, so each needs a renderer or DRF answers 404
+@renderer_classes([*api_settings.DEFAULT_RENDERER_CLASSES, CSVRenderer, NDJSONRenderer])
 def user_list(request):
     # ---------- filters ----------
     search_query = request.query_params.get('search', '').strip()
@@ -207,7 +212,7 @@ def user_list(request):
     ordering = request.query_params.get('ordering', '').strip()  # e.g. username, -username, created_at, -created_at
 
     # ---------- new: export ----------
-    export_format = request.query_params.get('format', '').strip().lower()  # csv
+    export_format = request.query_params.get('format', '').strip().lower()  # csv | ndjson
 
     users = User.objects.all()
 
@@ -268,31 +273,22 @@ def user_list(request):
     else:
         users = users.order_by("-created_at")  # default
 
-    # ✅ CSV EXPORT (no pagination)
-    if export_format == "csv":
-        response = HttpResponse(content_type="text/csv")
-        response["Content-Disposition"] = 'attachment; filename="users.csv"'
-
-        writer = csv.writer(response)
-        writer.writerow(["id", "username", "email", "phone", "is_active", "groups", "permissions", "created_at"])
-
-        for u in users:
-            writer.writerow([
-                str(u.id),
-                u.username,
-                u.email,
-                str(u.phone),
-                "true" if getattr(u, "is_active", True) else "false",
-                ",".join([g.name for g in u.groups.all()]),
-                ",".join(list(u.get_all_permissions())),
-                str(getattr(u, "created_at", "")),
-            ])
+    # ✅ groups + permissions prefetched, effective permissions resolved in memory
+    users = with_permissions(users)
 
+    # ✅ streamed export (no pagination): chunked iteration, prefetch per chunk
+    if export_format in ("csv", "ndjson"):
+        if export_format == "ndjson":
+            response = streaming_response(request, iter_users_ndjson(users, USER_EXPORT_CHUNK_SIZE), "application/x-ndjson")
+        else:
+            response = streaming_response(request, iter_users_csv(users, USER_EXPORT_CHUNK_SIZE), "text/csv")
+        response["Content-Disposition"] = f'attachment; filename="users.{export_format}"'
         return response
 
     # ✅ normal paginated response (your current style)
     paginator = Pagination()
     paginated_users = paginator.paginate_queryset(users, request)
+    permissions_of = EffectivePermissions()
 
     data = []
     for u in paginated_users:
@@ -303,7 +299,7 @@ def user_list(request):
             "phone": str(u.phone),
             "is_active": getattr(u, "is_active", True),
             "groups": [g.name for g in u.groups.all()],
-            "permissions": list(u.get_all_permissions()),
+            "permissions": sorted(permissions_of(u)),
 
             # optional: include dates for frontend filtering UI display
             "created_at": str(getattr(u, "created_at", "")),
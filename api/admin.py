@@ -1,7 +1,115 @@
+from collections import defaultdict
+
 from django.contrib import admin
+from django.contrib.auth import get_user_model
+from django.db import transaction
+
+from . import ledger, sync
 from .models import *
+from .versioning import bump, GOALS, LEDGER
+
+
+class OwnedObjectAdmin(admin.ModelAdmin):
+    """
+    Categories and goals edited here bump their owners' data version in
+    `scope` and leave `sync_kind` tombstones, as the API views do.
+    """
+    sync_kind = None
+    scope = None
+
+    def save_model(self, request, obj, form, change):
+        with transaction.atomic():
+            owners = {obj.user}
+            if change:
+                current = type(obj).objects.select_for_update().select_related("user").get(pk=obj.pk)
+                owners.add(current.user)
+                if current.user_id is not None and current.user_id != obj.user_id:
+                    # gone from the previous owner's point of view
+                    sync.record_deletions(current.user, self.sync_kind, [obj.pk])
+            super().save_model(request, obj, form, change)
+            bump_owners(owners, self.scope)
+
+    def delete_model(self, request, obj):
+        with transaction.atomic():
+            if obj.user_id is not None:
+                sync.record_deletions(obj.user, self.sync_kind, [obj.pk])
+            super().delete_model(request, obj)
+            bump_owners({obj.user}, self.scope)
+
+    def delete_queryset(self, request, queryset):
+        with transaction.atomic():
+            owners = record_owner_deletions(queryset, self.sync_kind)
+            super().delete_queryset(request, queryset)
+            bump_owners(owners, self.scope)
+
+
+@admin.register(Category)
+class CategoryAdmin(OwnedObjectAdmin):
+    sync_kind = sync.CATEGORY
+    scope = LEDGER
+
+
+@admin.register(BudgetGoal)
+class BudgetGoalAdmin(OwnedObjectAdmin):
+    sync_kind = sync.GOAL
+    scope = GOALS
+
+
+@admin.register(Transaction)
+class TransactionAdmin(admin.ModelAdmin):
+    """
+    Admin writes go through the same bookkeeping as the API views: the
+    DailyLedger rollup, sync tombstones and the owners' data versions.
+    """
+
+    def save_model(self, request, obj, form, change):
+        with transaction.atomic():
+            if not change:
+                super().save_model(request, obj, form, change)
+                ledger.record([obj])
+                owners = {obj.user}
+            else:
+                current = Transaction.objects.select_for_update().get(pk=obj.pk)
+                before = ledger.snapshot(current)
+                super().save_model(request, obj, form, change)
+                ledger.record_change(before, obj)
+                owners = {current.user, obj.user}
+                if current.user_id is not None and current.user_id != obj.user_id:
+                    # gone from the previous owner's point of view
+                    sync.record_deletions(current.user, sync.TRANSACTION, [obj.pk])
+            bump_owners(owners)
+
+    def delete_model(self, request, obj):
+        with transaction.atomic():
+            current = Transaction.objects.select_for_update().get(pk=obj.pk)
+            ledger.record([current], sign=-1)
+            if current.user_id is not None:
+                sync.record_deletions(current.user, sync.TRANSACTION, [current.pk])
+            super().delete_model(request, obj)
+            bump_owners({current.user})
+
+    def delete_queryset(self, request, queryset):
+        with transaction.atomic():
+            removed = ledger.add_queryset(ledger.new_deltas(), queryset, sign=-1)
+            owners = record_owner_deletions(queryset, sync.TRANSACTION)
+            super().delete_queryset(request, queryset)
+            ledger.apply(removed)
+            bump_owners(owners)
+
+
+def record_owner_deletions(queryset, kind):
+    """Tombstone every owned row of `queryset`; returns the owners."""
+    ids_by_owner = defaultdict(list)
+    for pk, user_id in queryset.values_list("pk", "user_id"):
+        if user_id is not None:
+            ids_by_owner[user_id].append(pk)
+    owners = get_user_model().objects.in_bulk(list(ids_by_owner))
+    for user_id, ids in ids_by_owner.items():
+        sync.record_deletions(owners[user_id], kind, ids)
+    return owners.values()
 
 
-admin.site.register(Category)
-admin.site.register(Transaction)
-admin.site.register(BudgetGoal)
+def bump_owners(users, scope=LEDGER):
+    for user in users:
+        if user is not None:
+            bump(user, scope)
@@ -0,0 +1,226 @@
+# app/aggregates.py
+"""
+Read-side aggregates over a user's transactions.
+
+Each helper answers from the DailyLedger rollup when the params allow it
+(see filters.can_use_ledger) and falls back to the raw Transaction table.
+"""
+from datetime import timedelta
+from decimal import Decimal
+
+from django.db.models import Count, DecimalField, Max, Q, Sum, Value
+from django.db.models.functions import Coalesce, TruncDay, TruncMonth, TruncWeek, TruncYear
+
+from .filters import can_use_ledger, filter_ledger, filter_transactions
+from .models import DailyLedger, Transaction
+
+INTERVALS = {
+    "day": TruncDay,
+    "week": TruncWeek,
+    "month": TruncMonth,
+    "year": TruncYear,
+}
+
+
+def _source(user, params):
+    """Return (queryset, amount field, count expression) for the cheapest source."""
+    if can_use_ledger(params):
+        qs = filter_ledger(DailyLedger.objects.filter(user=user), params)
+        return qs, "total", Sum("count")
+    qs = filter_transactions(Transaction.objects.filter(user=user), params)
+    return qs, "amount", Count("id")
+
+
+def _income_expense(amount_field, count_expr):
+    return {
+        "income": Sum(amount_field, filter=Q(type="income")),
+        "expense": Sum(amount_field, filter=Q(type="expense")),
+        "count": count_expr,
+    }
+
+
+def _summary_result(totals):
+    income = totals["income"] or 0
+    expense = totals["expense"] or 0
+    return {
+        "income": income,
+        "expense": expense,
+        "balance": income - expense,
+        "count": totals["count"] or 0,
+    }
+
+
+def summary(user, params):
+    qs, amount_field, count_expr = _source(user, params)
+    return _summary_result(qs.aggregate(**_income_expense(amount_field, count_expr)))
+
+
+async def asummary(user, params):
+    qs, amount_field, count_expr = _source(user, params)
+    return _summary_result(await qs.aaggregate(**_income_expense(amount_field, count_expr)))
+
+
+def timeseries(user, params, interval):
+    qs, amount_field, count_expr = _source(user, params)
+    rows = (
+        qs.order_by()
+        .annotate(bucket=INTERVALS[interval]("date"))
+        .values("bucket")
+        .annotate(**_income_expense(amount_field, count_expr))
+        .order_by("bucket")
+    )
+
+    results = []
+    for row in rows:
+        income = row["income"] or 0
+        expense = row["expense"] or 0
+        results.append({
+            "bucket": row["bucket"],
+            "income": income,
+            "expense": expense,
+            "net": income - expense,
+            "count": row["count"] or 0,
+        })
+    return results
+
+
+def _by_category_params(params):
+    """Shares only mean something within one type, so no type (or "all") means expense."""
+    if params.get("type") not in [None, "", "all"]:
+        return params
+    params = params.copy()
+    params["type"] = "expense"
+    return params
+
+
+def _by_category_rows(user, params):
+    qs, amount_field, count_expr = _source(user, params)
+    return (
+        qs.order_by()
+        .values("category_id", "category__name", "category__icon")
+        .annotate(total=Sum(amount_field), count=count_expr)
+        .order_by("-total", "category__name")
+    )
+
+
+def _by_category_result(tx_type, rows, limit):
+    grand_total = sum((row["total"] or 0 for row in rows), Decimal("0"))
+    if limit is not None:
+        rows = rows[:limit]
+
+    return {
+        "type": tx_type,
+        "total": grand_total,
+        "results": [
+            {
+                "id": row["category_id"],
+                "name": row["category__name"],
+                "icon": row["category__icon"],
+                "total": row["total"] or 0,
+                "count": row["count"] or 0,
+                "share": (row["total"] / grand_total).quantize(Decimal("0.0001")) if grand_total else Decimal("0"),
+            }
+            for row in rows
+        ],
+    }
+
+
+def by_category(user, params, limit=None):
+    params = _by_category_params(params)
+    return _by_category_result(params["type"], list(_by_category_rows(user, params)), limit)
+
+
+async def aby_category(user, params, limit=None):
+    params = _by_category_params(params)
+    return _by_category_result(params["type"], [row async for row in _by_category_rows(user, params)], limit)
+
+
+def with_category_stats(qs, params):
+    """
+    Annotate a Category queryset with transaction_count, income, expense and
+    last_used from the ledger (one LEFT JOIN + GROUP BY), limited to the
+    optional from/to window.
+    """
+    window = Q()
+    if params.get("from"):
+        window &= Q(ledger_days__date__gte=params["from"])
+    if params.get("to"):
+        window &= Q(ledger_days__date__lte=params["to"])
+
+    zero = Value(Decimal("0.00"), output_field=DecimalField(max_digits=14, decimal_places=2))
+    return qs.annotate(
+        transaction_count=Coalesce(Sum("ledger_days__count", filter=window), 0),
+        income=Coalesce(Sum("ledger_days__total", filter=window & Q(ledger_days__type="income")), zero),
+        expense=Coalesce(Sum("ledger_days__total", filter=window & Q(ledger_days__type="expense")), zero),
+        last_used=Max("ledger_days__date", filter=window),
+    )
+
+
+def _next_month(day):
+    return (day.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+def goal_progress(user, goals):
+    """
+    Attach the month's actual income/expense to each goal.
+
+    All goal months are answered by one grouped query over the daily ledger.
+    """
+    goals = list(goals)
+    if not goals:
+        return []
+
+    months = [goal.month.replace(day=1) for goal in goals]
+    rows = (
+        DailyLedger.objects.filter(user=user, date__gte=min(months), date__lt=_next_month(max(months)))
+        .annotate(month=TruncMonth("date"))
+        .values("month")
+        .annotate(**_income_expense("total", Sum("count")))
+        .order_by()
+    )
+    actual = {row["month"]: row for row in rows}
+
+    return [progress_of(goal, actual.get(month, {})) for goal, month in zip(goals, months)]
+
+
+def progress_of(goal, totals):
+    """Progress of one goal given its month's {"income", "expense", "count"} totals."""
+    income = totals.get("income") or Decimal("0")
+    spent = totals.get("expense") or Decimal("0")
+    target = goal.target_amount
+    saved = income - spent
+    return {
+        "goal": goal,
+        "income": income,
+        "spent": spent,
+        "remaining": target - spent,
+        "percent_used": (spent * 100 / target).quantize(Decimal("0.01")) if target else None,
+        "over_budget": spent > target,
+        "saved": saved,
+        "goal_reached": saved >= goal.gold_amount,
+        "count": totals.get("count") or 0,
+    }
+
+
+def month_overview(user, month, top=5):
+    """
+    Summary and top spending categories of one calendar month, both from a
+    single ledger query grouped by (category, type).
+    """
+    rows = (
+        DailyLedger.objects.filter(user=user, date__gte=month, date__lt=_next_month(month))
+        .values("category_id", "category__name", "category__icon", "type")
+        .annotate(total=Sum("total"), count=Sum("count"))
+        .order_by()
+    )
+
+    totals = {"income": Decimal("0"), "expense": Decimal("0"), "count": 0}
+    spending = []
+    for row in rows:
+        totals[row["type"]] += row["total"]
+        totals["count"] += row["count"]
+        if row["type"] == "expense":
+            spending.append(row)
+    spending.sort(key=lambda row: (-row["total"], row["category__name"]))
+
+    return {"summary": _summary_result(totals), "top_categories": _by_category_result("expense", spending, top)}
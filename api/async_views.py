@@ -0,0 +1,197 @@
+# app/async_views.py
+"""
+Native async versions of the read-heavy endpoints, served under /api/async/.
+
+DRF 3.15 views are synchronous, so these are plain Django async views.
+They reuse the DRF views for everything that does no I/O (queryset
+building, filters, serializers, paginator, ETag) and await every DB and
+cache access: the JWT user lookup, the data versions, the summary cache
+and the queryset itself. Bodies and ETag semantics match the sync views.
+"""
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+from django.utils.translation import gettext_lazy as _
+from django.views import View
+from rest_framework import exceptions, status
+from rest_framework.request import Request
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+
+from . import aggregates
+from .cache import summary_cache
+from .fastpath import FastRowSerializer
+from .renderers import FastJSONRenderer
+from .search import afts_available
+from .versioning import GOALS, LEDGER, acurrent, etag_matches, request_etag
+from .views import BudgetGoalListView, TransactionByCategoryView, TransactionListView
+
+
+class AsyncJWTAuthentication(JWTAuthentication):
+    """JWTAuthentication with the user lookup done through the async ORM."""
+
+    async def aauthenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+        return await self.aget_user(validated_token), validated_token
+
+    async def aget_user(self, validated_token):
+        try:
+            user_id = validated_token[jwt_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        try:
+            user = await self.user_model.objects.aget(**{jwt_settings.USER_ID_FIELD: user_id})
+        except self.user_model.DoesNotExist:
+            raise exceptions.AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if not user.is_active:
+            raise exceptions.AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if getattr(jwt_settings, "CHECK_REVOKE_TOKEN", False):
+            from rest_framework_simplejwt.utils import get_md5_hash_password
+
+            if validated_token.get(jwt_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password):
+                raise exceptions.AuthenticationFailed(
+                    _("The user's password has been changed."), code="password_changed"
+                )
+
+        return user
+
+
+class AsyncReadView(View):
+    """
+    Authenticated async GET with ETag / If-None-Match support.
+
+    Subclasses implement `aget_data(request)`; `request` is a DRF Request
+    carrying the authenticated user, so the DRF view named in `sync_view`
+    can build querysets and serializers for it.
+    """
+    http_method_names = ["get", "head"]
+    etag_scopes = (LEDGER,)
+    cache_kind = None
+    sync_view = None
+    authentication = AsyncJWTAuthentication()
+    renderer = FastJSONRenderer()
+
+    async def get(self, request, *args, **kwargs):
+        try:
+            drf_request = await self.initialize_request(request)
+            self.data_versions = await acurrent(drf_request.user)
+            etag = request_etag(drf_request, {scope: self.data_versions[scope] for scope in self.etag_scopes})
+            if etag_matches(request, etag):
+                return HttpResponse(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+            data = await self.aget_data(drf_request)
+        except exceptions.APIException as exc:
+            return self.handle_exception(request, exc)
+
+        response = self.render(data)
+        response["ETag"] = etag
+        return response
+
+    async def aget_data(self, request):
+        raise NotImplementedError
+
+    async def initialize_request(self, request):
+        auth = await self.authentication.aauthenticate(request)
+        if auth is None:
+            raise exceptions.NotAuthenticated()
+
+        drf_request = Request(request)
+        drf_request.user, drf_request.auth = auth
+        drf_request.accepted_renderer = self.renderer
+        drf_request.accepted_media_type = self.renderer.media_type
+        return drf_request
+
+    def get_sync_view(self, request):
+        view = self.sync_view()
+        view.request = request
+        view.args, view.kwargs = (), {}
+        view.format_kwarg = None
+        view.headers = {}
+        return view
+
+    async def cached(self, request, compute):
+        return await summary_cache.aget_or_compute(
+            request.user, self.data_versions[LEDGER], self.cache_kind, request.query_params, compute
+        )
+
+    def render(self, data, status_code=status.HTTP_200_OK):
+        response = HttpResponse(self.renderer.render(data), status=status_code, content_type="application/json")
+        patch_vary_headers(response, ["Accept"])
+        return response
+
+    def handle_exception(self, request, exc):
+        """Same status codes, bodies and headers as DRF's default exception handler."""
+        headers = {}
+        if isinstance(exc, (exceptions.NotAuthenticated, exceptions.AuthenticationFailed)):
+            exc.status_code = status.HTTP_401_UNAUTHORIZED
+            headers["WWW-Authenticate"] = self.authentication.authenticate_header(request)
+
+        data = exc.detail if isinstance(exc.detail, (list, dict)) else {"detail": exc.detail}
+        response = self.render(data, status_code=exc.status_code)
+        for name, value in headers.items():
+            response[name] = value
+        return response
+
+
+# =========================
+# Transaction
+# =========================
+class TransactionListAsyncView(AsyncReadView):
+    sync_view = TransactionListView
+
+    async def aget_data(self, request):
+        await afts_available()
+        view = self.get_sync_view(request)
+        fast = FastRowSerializer(view.get_serializer())
+        queryset = view.filter_queryset(view.get_queryset())
+        rows = queryset.values(*dict.fromkeys(fast.paths + list(view.fast_required_paths)))
+
+        paginator = view.paginator
+        if view.order_by_relevance():
+            page = await paginator.apaginate_ranked(rows, request, view=view)
+        else:
+            page = await paginator.apaginate_queryset(rows, request, view=view)
+        return paginator.get_paginated_response(fast.serialize(page)).data
+
+
+class TransactionSummaryAsyncView(AsyncReadView):
+    cache_kind = "summary"
+
+    async def aget_data(self, request):
+        await afts_available()
+        return await self.cached(request, lambda: aggregates.asummary(request.user, request.query_params))
+
+
+class TransactionByCategoryAsyncView(AsyncReadView):
+    cache_kind = "by-category"
+
+    async def aget_data(self, request):
+        limit = TransactionByCategoryView.get_limit(request.query_params)
+        await afts_available()
+        return await self.cached(
+            request, lambda: aggregates.aby_category(request.user, request.query_params, limit=limit)
+        )
+
+
+# =========================
+# Goals
+# =========================
+class BudgetGoalListAsyncView(AsyncReadView):
+    sync_view = BudgetGoalListView
+    etag_scopes = (GOALS,)
+
+    async def aget_data(self, request):
+        view = self.get_sync_view(request)
+        fast = FastRowSerializer(view.get_serializer())
+        rows = view.filter_queryset(view.get_queryset()).values(*fast.paths)
+        return fast.serialize([row async for row in rows])
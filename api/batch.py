@@ -0,0 +1,124 @@
+# app/batch.py
+"""
+In-process dispatch of batched sub-requests (see views.BatchView).
+
+Every sub-request becomes a WSGIRequest carrying the batch's already
+authenticated user (DRF forced authentication). It is resolved against the
+root URLconf and handed straight to the view, so N sub-requests cost one
+HTTP round trip and one JWT check. Only synchronous /api/ routes can be
+targeted, and a batch cannot contain another batch.
+"""
+import io
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import unquote_to_bytes
+
+from asgiref.sync import iscoroutinefunction
+from django.core.handlers.wsgi import WSGIRequest
+from django.db import connections
+from django.urls import Resolver404, resolve
+from rest_framework.response import Response
+
+logger = logging.getLogger(__name__)
+
+PREFIX = "/api/"
+SAFE_METHODS = ("GET", "HEAD")
+METHODS = ("GET", "HEAD", "POST", "PUT", "PATCH", "DELETE")
+
+# headers of the batch request that must not leak into its sub-requests
+DROPPED_META = {"CONTENT_LENGTH", "CONTENT_TYPE", "HTTP_AUTHORIZATION", "HTTP_IF_NONE_MATCH", "HTTP_IF_MATCH"}
+RETURNED_HEADERS = ("ETag", "Location", "Content-Type", "Content-Disposition")
+
+
+def build_request(request, item):
+    path, _, query = item["path"].partition("?")
+    body = b"" if item.get("body") is None else json.dumps(item["body"]).encode("utf-8")
+
+    environ = {
+        key: value for key, value in request.META.items()
+        if key not in DROPPED_META and not key.startswith("wsgi.")
+    }
+    environ.update({
+        "REQUEST_METHOD": item["method"],
+        "PATH_INFO": unquote_to_bytes(path).decode("iso-8859-1"),
+        "QUERY_STRING": query,
+        "CONTENT_TYPE": "application/json",
+        "CONTENT_LENGTH": str(len(body)),
+        "HTTP_ACCEPT": "application/json",
+        "wsgi.input": io.BytesIO(body),
+        "wsgi.url_scheme": request.scheme,
+    })
+    for name, value in (item.get("headers") or {}).items():
+        key = "HTTP_" + name.upper().replace("-", "_")
+        if key not in ("HTTP_AUTHORIZATION", "HTTP_CONTENT_TYPE", "HTTP_CONTENT_LENGTH"):
+            environ[key] = value
+
+    sub = WSGIRequest(environ)
+    sub._force_auth_user = request.user
+    sub._force_auth_token = request.auth
+    return sub
+
+
+def envelope(item, status_code, body=None, headers=None):
+    return {"id": item.get("id"), "status": status_code, "headers": headers or {}, "body": body}
+
+
+def is_async_view(func):
+    view_class = getattr(func, "view_class", None)
+    return bool(getattr(view_class, "view_is_async", False)) or iscoroutinefunction(func)
+
+
+def dispatch(request, item):
+    """Run one sub-request and return its envelope; never raises."""
+    try:
+        return _dispatch(request, item)
+    except Exception:
+        logger.exception("Batch sub-request %s %s failed", item["method"], item["path"])
+        return envelope(item, 500, {"detail": "A server error occurred."})
+
+
+def _dispatch(request, item):
+    sub = build_request(request, item)
+    try:
+        match = resolve(sub.path_info)
+    except Resolver404:
+        return envelope(item, 404, {"detail": "Not found."})
+
+    if not sub.path_info.startswith(PREFIX) or match.url_name == "batch":
+        return envelope(item, 400, {"detail": "This path cannot be used in a batch."})
+    if is_async_view(match.func):
+        # it would return a coroutine; the /api/async/ reads have synchronous twins
+        return envelope(item, 400, {"detail": "Async routes cannot be used in a batch; use the synchronous path."})
+
+    response = match.func(sub, *match.args, **match.kwargs)
+    if response.streaming:
+        response.close()
+        return envelope(item, 400, {"detail": "Streaming responses are not supported in a batch."})
+
+    headers = {name: response[name] for name in RETURNED_HEADERS if response.has_header(name)}
+    renderer = getattr(response, "accepted_renderer", None)
+    if isinstance(response, Response) and getattr(renderer, "format", None) == "json":
+        # the batch response renders it, no need to encode and parse it here
+        return envelope(item, response.status_code, response.data, headers)
+
+    if hasattr(response, "render"):
+        response.render()
+        headers = {name: response[name] for name in RETURNED_HEADERS if response.has_header(name)}
+    content = response.content.decode(response.charset or "utf-8")
+    if content and response.get("Content-Type", "").startswith("application/json"):
+        content = json.loads(content)
+    return envelope(item, response.status_code, content or None, headers)
+
+
+def run_parallel(request, items, max_workers):
+    """Dispatch read-only sub-requests on a thread pool; results keep the input order."""
+    def task(item):
+        try:
+            return dispatch(request, item)
+        finally:
+            # each worker thread opened its own DB connections
+            connections.close_all()
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+        return list(pool.map(task, items))
@@ -0,0 +1,193 @@
+# app/cache.py
+"""
+Result cache for the summary / aggregate endpoints.
+
+Keys are (user, ledger version, endpoint, normalized params). Every
+Transaction or Category write bumps the user's ledger version (see
+api.versioning), so stale entries are never read again; they simply age
+out of the in-process LRU and the shared backend's TTL.
+
+Lookups go to a bounded in-process LRU first, then to an optional shared
+Django cache alias (settings.SUMMARY_CACHE["SHARED_ALIAS"], e.g. Redis) so
+results computed by one gunicorn worker are reused by the others.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+
+from .versioning import LEDGER, current
+
+CACHED_PARAMS = ("type", "category", "min", "max", "from", "to", "search", "interval", "limit")
+
+_MISSING = object()
+
+
+class LRUCache:
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                return default
+            return self._data[key]
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+def normalize_params(params):
+    items = []
+    for name in CACHED_PARAMS:
+        value = (params.get(name) or "").strip()
+        if not value or (name == "type" and value == "all"):
+            continue
+        items.append((name, value))
+    return tuple(items)
+
+
+class SummaryCache:
+    stats_prefix = "summary-cache:stats:"
+
+    def __init__(self, max_entries=1024, timeout=300, shared_alias=None):
+        self.local = LRUCache(max_entries)
+        self.timeout = timeout
+        self.shared_alias = shared_alias
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def shared(self):
+        return caches[self.shared_alias] if self.shared_alias else None
+
+    def make_key(self, user, version, kind, params):
+        raw = repr((str(user.pk), version, kind, normalize_params(params)))
+        return "summary-cache:" + hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get_or_compute(self, user, version, kind, params, compute):
+        key = self.make_key(user, version, kind, params)
+
+        value = self.local.get(key, _MISSING)
+        if value is not _MISSING:
+            self._count("hits")
+            return value
+
+        shared = self.shared
+        if shared is not None:
+            value = shared.get(key, _MISSING)
+            if value is not _MISSING:
+                self.local.set(key, value)
+                self._count("hits")
+                return value
+
+        self._count("misses")
+        value = compute()
+        self.local.set(key, value)
+        if shared is not None:
+            shared.set(key, value, self.timeout)
+        return value
+
+    async def aget_or_compute(self, user, version, kind, params, compute):
+        """get_or_compute() for async views; `compute` is a coroutine function."""
+        key = self.make_key(user, version, kind, params)
+
+        value = self.local.get(key, _MISSING)
+        if value is not _MISSING:
+            await self._acount("hits")
+            return value
+
+        shared = self.shared
+        if shared is not None:
+            value = await shared.aget(key, _MISSING)
+            if value is not _MISSING:
+                self.local.set(key, value)
+                await self._acount("hits")
+                return value
+
+        await self._acount("misses")
+        value = await compute()
+        self.local.set(key, value)
+        if shared is not None:
+            await shared.aset(key, value, self.timeout)
+        return value
+
+    def _count(self, name):
+        setattr(self, name, getattr(self, name) + 1)
+        shared = self.shared
+        if shared is not None:
+            key = self.stats_prefix + name
+            # add() is a no-op when the counter already exists
+            shared.add(key, 0, None)
+            try:
+                shared.incr(key)
+            except ValueError:
+                shared.set(key, 1, None)
+
+    async def _acount(self, name):
+        setattr(self, name, getattr(self, name) + 1)
+        shared = self.shared
+        if shared is not None:
+            key = self.stats_prefix + name
+            await shared.aadd(key, 0, None)
+            try:
+                await shared.aincr(key)
+            except ValueError:
+                await shared.aset(key, 1, None)
+
+    def stats(self):
+        data = {"local": {"hits": self.hits, "misses": self.misses, "entries": len(self.local)}}
+        shared = self.shared
+        if shared is not None:
+            data["shared"] = {
+                "hits": shared.get(self.stats_prefix + "hits", 0),
+                "misses": shared.get(self.stats_prefix + "misses", 0),
+            }
+        return data
+
+    def clear(self):
+        self.local.clear()
+        self.hits = self.misses = 0
+
+
+def _build():
+    conf = getattr(settings, "SUMMARY_CACHE", {})
+    return SummaryCache(
+        max_entries=conf.get("MAX_ENTRIES", 1024),
+        timeout=conf.get("TIMEOUT", 300),
+        shared_alias=conf.get("SHARED_ALIAS"),
+    )
+
+
+summary_cache = _build()
+
+
+class CachedAggregateMixin:
+    """For views whose response depends only on the user's ledger and the filter params."""
+    cache_kind = None
+
+    def cached(self, compute, kind=None, params=None):
+        """`params` defaults to the request's query params; only CACHED_PARAMS take part in the key."""
+        request = self.request
+        versions = getattr(self, "data_versions", None) or current(request.user)
+        return summary_cache.get_or_compute(
+            request.user, versions[LEDGER], kind or self.cache_kind,
+            request.query_params if params is None else params, compute,
+        )
@@ -0,0 +1,47 @@
+# app/exporters.py
+import csv
+import json
+
+from django.utils import timezone
+
+from bugettracker.streaming import Echo
+
+EXPORT_FIELDS = (
+    ("id", "id"),
+    ("type", "type"),
+    ("amount", "amount"),
+    ("date", "date"),
+    ("category", "category_id"),
+    ("category_name", "category__name"),
+    ("note", "note"),
+    ("created_at", "created_at"),
+)
+
+
+def export_rows(qs, chunk_size=2000):
+    """Yield one tuple of strings per transaction, streamed from the DB in chunks."""
+    values = qs.values_list(*[source for _, source in EXPORT_FIELDS])
+    for tx_id, tx_type, amount, date, category_id, category_name, note, created_at in values.iterator(chunk_size=chunk_size):
+        yield (
+            str(tx_id),
+            tx_type,
+            str(amount),
+            date.isoformat(),
+            str(category_id),
+            category_name,
+            note,
+            timezone.localtime(created_at).isoformat(),
+        )
+
+
+def iter_csv(qs, chunk_size=2000):
+    writer = csv.writer(Echo())
+    yield writer.writerow([name for name, _ in EXPORT_FIELDS])
+    for row in export_rows(qs, chunk_size):
+        yield writer.writerow(row)
+
+
+def iter_ndjson(qs, chunk_size=2000):
+    names = [name for name, _ in EXPORT_FIELDS]
+    for row in export_rows(qs, chunk_size):
+        yield json.dumps(dict(zip(names, row)), ensure_ascii=False) + "\n"
@@ -0,0 +1,138 @@
+# app/fastpath.py
+"""
+Read-only fast path for list endpoints.
+
+FastRowSerializer looks at a (possibly sparse) DRF serializer once, maps
+each readable field to a values() path plus a converter, and then builds
+output rows straight from values() dicts, skipping model instantiation and
+per-field to_representation() calls. Its output must stay identical to the
+DRF serializer; api.tests.FastPathParityTests enforces that.
+"""
+from decimal import Decimal
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.fields import ISO_8601
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+
+def _identity(value):
+    return value
+
+
+def _decimal_converter(field):
+    coerce_to_string = getattr(field, "coerce_to_string", api_settings.COERCE_DECIMAL_TO_STRING)
+    if (
+        not coerce_to_string
+        or field.localize
+        or field.decimal_places is None
+        or getattr(field, "normalize_output", False)
+    ):
+        return field.to_representation
+
+    exponent = -field.decimal_places
+
+    def convert(value):
+        # DB values already carry the column's scale, so quantize() would be a no-op
+        if isinstance(value, Decimal) and value.as_tuple().exponent == exponent:
+            return "{:f}".format(value)
+        return field.to_representation(value)
+
+    return convert
+
+
+def _date_converter(field):
+    output_format = getattr(field, "format", api_settings.DATE_FORMAT)
+    if output_format is None or output_format.lower() != ISO_8601:
+        return field.to_representation
+
+    def convert(value):
+        return value.isoformat() if value else None
+
+    return convert
+
+
+def _datetime_converter(field):
+    output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+    if output_format is None or output_format.lower() != ISO_8601 or getattr(field, "timezone", None):
+        return field.to_representation
+
+    field_timezone = timezone.get_current_timezone() if settings.USE_TZ else None
+    if field_timezone is None:
+        return field.to_representation
+
+    def convert(value):
+        if not value:
+            return None
+        if timezone.is_naive(value):
+            return field.to_representation(value)
+        value = value.astimezone(field_timezone).isoformat()
+        if value.endswith("+00:00"):
+            value = value[:-6] + "Z"
+        return value
+
+    return convert
+
+
+def _uuid_converter(field):
+    if field.uuid_format != "hex_verbose":
+        return field.to_representation
+    return str
+
+
+def converter_for(field):
+    if isinstance(field, serializers.DecimalField):
+        return _decimal_converter(field)
+    if isinstance(field, serializers.DateTimeField):
+        return _datetime_converter(field)
+    if isinstance(field, serializers.DateField):
+        return _date_converter(field)
+    if isinstance(field, serializers.UUIDField):
+        return _uuid_converter(field)
+    if isinstance(field, serializers.PrimaryKeyRelatedField) and field.pk_field is None:
+        # DRF returns the raw pk object here (a UUID), the renderer stringifies it
+        return _identity
+    if isinstance(field, (serializers.ChoiceField, serializers.CharField)):
+        return str
+    return field.to_representation
+
+
+class FastRowSerializer:
+    def __init__(self, serializer):
+        self.columns = []
+        for field in serializer._readable_fields:
+            if field.source == "*" or isinstance(field, serializers.SerializerMethodField):
+                raise ValueError(f"{type(serializer).__name__}.{field.field_name} has no fast path")
+            path = "__".join(field.source_attrs)
+            self.columns.append((field.field_name, path, converter_for(field)))
+
+    @property
+    def paths(self):
+        return list(dict.fromkeys(path for _, path, _ in self.columns))
+
+    def serialize(self, rows):
+        columns = self.columns
+        return [
+            {name: None if row[path] is None else convert(row[path]) for name, path, convert in columns}
+            for row in rows
+        ]
+
+
+class FastListMixin:
+    """
+    ListAPIView.list() over values() rows. `fast_required_paths` are extra
+    columns the view itself needs, e.g. the keyset pagination keys.
+    """
+    fast_required_paths = ()
+
+    def list(self, request, *args, **kwargs):
+        fast = FastRowSerializer(self.get_serializer())
+        queryset = self.filter_queryset(self.get_queryset())
+        rows = queryset.values(*dict.fromkeys(fast.paths + list(self.fast_required_paths)))
+
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(fast.serialize(page))
+        return Response(fast.serialize(rows))
@@ -0,0 +1,77 @@
+# app/fieldsets.py
+"""
+Sparse fieldsets: ?fields=a,b (include) and ?omit=c (exclude) on GET.
+
+SparseFieldsetsMixin drops serializer fields and rejects names the
+serializer does not render with a 400; SparseQuerysetMixin narrows the
+view's SELECT with only() and skips joins nobody asked for.
+"""
+from rest_framework.exceptions import ValidationError
+
+
+def _names(raw):
+    return {name.strip() for name in (raw or "").split(",") if name.strip()}
+
+
+def requested_fields(request, available, strict=False):
+    """
+    Names from `available` that the request wants, or None when it wants
+    everything. With `strict`, asking for a name outside `available` is a
+    ValidationError.
+    """
+    if request is None or request.method not in ("GET", "HEAD"):
+        return None
+
+    include = _names(request.query_params.get("fields"))
+    omit = _names(request.query_params.get("omit"))
+    if not include and not omit:
+        return None
+
+    if strict:
+        for param, names in (("fields", include), ("omit", omit)):
+            unknown = names.difference(available)
+            if unknown:
+                raise ValidationError({
+                    param: f"Unknown field(s): {', '.join(sorted(unknown))}. Choose from: {', '.join(available)}."
+                })
+
+    wanted = [name for name in available if (not include or name in include) and name not in omit]
+    return wanted
+
+
+class SparseFieldsetsMixin:
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        readable = [name for name, field in self.fields.items() if not field.write_only]
+        wanted = requested_fields(self.context.get("request"), readable, strict=True)
+        if wanted is None:
+            return
+        for name in list(self.fields):
+            if name not in wanted and not self.fields[name].write_only:
+                self.fields.pop(name)
+
+
+class SparseQuerysetMixin:
+    """
+    `sparse_sources` maps serializer field -> model paths it reads.
+    `sparse_required` are model fields the view itself needs (e.g. pagination keys).
+    `sparse_related` is the select_related() applied only when a wanted path crosses it.
+    """
+    sparse_sources = {}
+    sparse_required = ("id",)
+    sparse_related = ()
+
+    def narrow_queryset(self, qs):
+        # unknown names are the serializer's to reject; here they only select nothing
+        wanted = requested_fields(self.request, list(self.sparse_sources))
+        if wanted is None:
+            return qs.select_related(*self.sparse_related) if self.sparse_related else qs
+
+        paths = list(self.sparse_required)
+        for name in wanted:
+            paths.extend(self.sparse_sources[name])
+
+        related = [rel for rel in self.sparse_related if any(p.startswith(rel + "__") for p in paths)]
+        if related:
+            qs = qs.select_related(*related)
+        return qs.only(*dict.fromkeys(paths))
@@ -0,0 +1,71 @@
+# app/filters.py
+from .search import search_transactions
+
+
+def filter_transactions(qs, params, rank=False):
+    """
+    Apply the list/summary query params (type, category, min, max, from, to, search)
+    to a Transaction queryset.
+    """
+    tx_type = params.get("type")
+    category = params.get("category")
+    min_amount = params.get("min")
+    max_amount = params.get("max")
+    date_from = params.get("from")
+    date_to = params.get("to")
+    search = (params.get("search") or "").strip()
+
+    if tx_type and tx_type != "all":
+        qs = qs.filter(type=tx_type)
+
+    if category:
+        qs = qs.filter(category_id=category)
+
+    if min_amount not in [None, ""]:
+        qs = qs.filter(amount__gte=min_amount)
+
+    if max_amount not in [None, ""]:
+        qs = qs.filter(amount__lte=max_amount)
+
+    if date_from:
+        qs = qs.filter(date__gte=date_from)
+
+    if date_to:
+        qs = qs.filter(date__lte=date_to)
+
+    if search:
+        qs = search_transactions(qs, search, rank=rank)
+
+    return qs
+
+
+def can_use_ledger(params):
+    """
+    The daily ledger only keeps per (day, category, type) totals, so it can
+    answer a query unless it filters on amount or free text.
+    """
+    if (params.get("search") or "").strip():
+        return False
+    return params.get("min") in [None, ""] and params.get("max") in [None, ""]
+
+
+def filter_ledger(qs, params):
+    """Apply the ledger-compatible subset of the transaction params to a DailyLedger queryset."""
+    tx_type = params.get("type")
+    category = params.get("category")
+    date_from = params.get("from")
+    date_to = params.get("to")
+
+    if tx_type and tx_type != "all":
+        qs = qs.filter(type=tx_type)
+
+    if category:
+        qs = qs.filter(category_id=category)
+
+    if date_from:
+        qs = qs.filter(date__gte=date_from)
+
+    if date_to:
+        qs = qs.filter(date__lte=date_to)
+
+    return qs
@@ -0,0 +1,154 @@
+# app/importers.py
+import csv
+from decimal import Decimal, InvalidOperation
+
+from django.db import transaction
+from django.utils.dateparse import parse_date
+
+from . import ledger
+from .models import Category, Transaction
+from .versioning import bump, LEDGER
+
+
+class TransactionCSVImporter:
+    """
+    Stream a bank statement CSV into Transaction rows.
+
+    Expected header: date, amount, category and optionally type and note.
+    Without a type column (or with an empty value) the sign of the amount
+    decides: negative -> expense, positive -> income.
+
+    `run()` reads the file row by row and inserts fixed-size chunks with
+    bulk_create, yielding a progress dict after each chunk. Each chunk is
+    committed on its own, so a failure keeps the rows already imported.
+    """
+    required_columns = ("date", "amount", "category")
+    tx_types = {choice for choice, _ in Transaction.TX_CHOICES}
+
+    def __init__(self, user, chunk_size=1000, max_errors=100):
+        self.user = user
+        self.chunk_size = chunk_size
+        self.max_errors = max_errors
+
+        self.processed = 0
+        self.created = 0
+        self.error_count = 0
+        self.errors = []
+        self.categories_created = 0
+        self._categories = None
+
+    def progress(self, done=False):
+        return {
+            "done": done,
+            "processed": self.processed,
+            "created": self.created,
+            "failed": self.error_count,
+            "categories_created": self.categories_created,
+            "errors": self.errors if done else self.errors[-10:],
+        }
+
+    def run(self, stream):
+        reader = csv.DictReader(stream)
+        try:
+            fieldnames = reader.fieldnames or []
+        except csv.Error as exc:
+            raise ValueError(f"Malformed CSV header: {exc}")
+        header = {(name or "").strip().lower() for name in fieldnames}
+        missing = [col for col in self.required_columns if col not in header]
+        if missing:
+            raise ValueError(f"Missing column(s): {', '.join(missing)}")
+
+        self._categories = {
+            name.casefold(): pk
+            for pk, name in Category.objects.filter(user=self.user).values_list("id", "name")
+        }
+
+        chunk = []
+        for line, raw in enumerate(self.rows(reader), start=2):
+            self.processed += 1
+            row = {(k or "").strip().lower(): (v or "").strip() for k, v in raw.items() if k is not None}
+            try:
+                chunk.append(self.build(row))
+            except ValueError as exc:
+                self.add_error(line, str(exc))
+                continue
+
+            if len(chunk) >= self.chunk_size:
+                self.flush(chunk)
+                chunk = []
+                yield self.progress()
+
+        if chunk:
+            self.flush(chunk)
+        yield self.progress(done=True)
+
+    def rows(self, reader):
+        try:
+            yield from reader
+        except csv.Error as exc:
+            # line_num still points at the last record read successfully
+            raise ValueError(f"Malformed CSV after line {reader.line_num}: {exc}")
+
+    def build(self, row):
+        date = parse_date(row.get("date", ""))
+        if date is None:
+            raise ValueError(f"Invalid date {row.get('date')!r}, use YYYY-MM-DD.")
+
+        try:
+            amount = Decimal(row.get("amount", "").replace(",", ""))
+        except InvalidOperation:
+            raise ValueError(f"Invalid amount {row.get('amount')!r}.")
+        if not amount.is_finite():
+            raise ValueError(f"Invalid amount {row.get('amount')!r}.")
+
+        tx_type = row.get("type", "").lower()
+        if not tx_type:
+            tx_type = "expense" if amount < 0 else "income"
+        elif tx_type not in self.tx_types:
+            raise ValueError(f"Invalid type {row.get('type')!r}.")
+
+        # check the magnitude first: quantize() raises InvalidOperation
+        # once the result needs more digits than the context precision
+        if amount.adjusted() >= 10:
+            raise ValueError("Amount has too many digits.")
+        amount = abs(amount).quantize(Decimal("0.01"))
+        if amount >= Decimal("1e10"):
+            raise ValueError("Amount has too many digits.")
+
+        name = row.get("category", "")
+        if not name:
+            raise ValueError("Category is required.")
+        if len(name) > 80:
+            raise ValueError("Category name is longer than 80 characters.")
+
+        return Transaction(
+            user=self.user,
+            type=tx_type,
+            amount=amount,
+            date=date,
+            category_id=self.category_id(name),
+            note=row.get("note", "")[:255],
+        )
+
+    def category_id(self, name):
+        key = name.casefold()
+        pk = self._categories.get(key)
+        if pk is None:
+            with transaction.atomic():
+                pk = Category.objects.create(user=self.user, name=name).id
+                bump(self.user, LEDGER)
+            self._categories[key] = pk
+            self.categories_created += 1
+        return pk
+
+    def add_error(self, line, message):
+        self.error_count += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append({"line": line, "error": message})
+
+    def flush(self, chunk):
+        with transaction.atomic():
+            created = Transaction.objects.bulk_create(chunk)
+            ledger.record(created)
+            bump(self.user, LEDGER)
+        self.created += len(created)
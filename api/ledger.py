@@ -0,0 +1,191 @@
+# app/ledger.py
+"""
+Incremental maintenance of the DailyLedger rollup.
+
+Every write path that touches Transaction rows (single views, bulk endpoints,
+imports) collects signed (amount, count) deltas per ledger key and applies
+them with `apply()` inside the same DB transaction as the write.
+"""
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Sum
+
+from .models import DailyLedger, Transaction
+
+BATCH_SIZE = 500
+
+
+def ledger_key(user_id, date, category_id, tx_type):
+    return (user_id, date, category_id, tx_type)
+
+
+def snapshot(tx):
+    """Ledger key + amount of a Transaction instance (take it before mutating the instance)."""
+    return (ledger_key(tx.user_id, tx.date, tx.category_id, tx.type), Decimal(tx.amount))
+
+
+def new_deltas():
+    return defaultdict(lambda: [Decimal("0"), 0])
+
+
+def add(deltas, key, amount, sign=1):
+    if key[0] is None:
+        # transactions without an owner never show up in per-user reads
+        return
+    entry = deltas[key]
+    entry[0] += sign * Decimal(amount)
+    entry[1] += sign
+
+
+def add_transactions(deltas, transactions, sign=1):
+    for tx in transactions:
+        key, amount = snapshot(tx)
+        add(deltas, key, amount, sign)
+    return deltas
+
+
+def add_queryset(deltas, qs, sign=1):
+    """Collect deltas for every row in a Transaction queryset with one grouped query."""
+    rows = (
+        qs.order_by()
+        .values("user_id", "date", "category_id", "type")
+        .annotate(total=Sum("amount"), n=Count("id"))
+    )
+    for row in rows:
+        key = ledger_key(row["user_id"], row["date"], row["category_id"], row["type"])
+        if key[0] is None:
+            continue
+        entry = deltas[key]
+        entry[0] += sign * (row["total"] or 0)
+        entry[1] += sign * row["n"]
+    return deltas
+
+
+def moved(deltas, category_id=None, tx_type=None):
+    """
+    Deltas for rows re-keyed by a set-based UPDATE: `deltas` are the
+    removal deltas (sign=-1) of the rows before the update.
+    """
+    result = new_deltas()
+    for (user_id, date, old_category, old_type), (amount, count) in deltas.items():
+        key = ledger_key(user_id, date, category_id or old_category, tx_type or old_type)
+        result[key][0] -= amount
+        result[key][1] -= count
+    for key, (amount, count) in deltas.items():
+        result[key][0] += amount
+        result[key][1] += count
+    return result
+
+
+def _locked_rows(keys):
+    """Existing ledger rows for `keys`, locked until the surrounding transaction ends."""
+    dates = defaultdict(set)
+    for user_id, date, _, _ in keys:
+        dates[user_id].add(date)
+
+    rows = {}
+    for user_id, user_dates in dates.items():
+        user_dates = sorted(user_dates)
+        for start in range(0, len(user_dates), BATCH_SIZE):
+            qs = DailyLedger.objects.select_for_update().filter(
+                user_id=user_id, date__in=user_dates[start:start + BATCH_SIZE]
+            )
+            for row in qs:
+                key = ledger_key(row.user_id, row.date, row.category_id, row.type)
+                if key in keys:
+                    rows[key] = row
+    return rows
+
+
+def _apply_one(key, amount, count):
+    user_id, date, category_id, tx_type = key
+    rows = DailyLedger.objects.filter(user_id=user_id, date=date, category_id=category_id, type=tx_type)
+    if rows.update(total=F("total") + amount, count=F("count") + count):
+        return
+    try:
+        with transaction.atomic():
+            DailyLedger.objects.create(
+                user_id=user_id, date=date, category_id=category_id, type=tx_type, total=amount, count=count
+            )
+    except IntegrityError:
+        rows.update(total=F("total") + amount, count=F("count") + count)
+
+
+def apply(deltas):
+    """
+    Apply collected deltas to DailyLedger and drop days that became empty.
+
+    Existing rows are read with select_for_update() and written back with
+    bulk_update(), missing ones are bulk-inserted, so a write spread over
+    many days costs a handful of statements rather than one per key.
+    """
+    pending = {key: (amount, count) for key, (amount, count) in deltas.items() if amount or count}
+    if not pending:
+        return
+
+    existing = _locked_rows(pending)
+    changed, emptied = [], []
+    for key, row in existing.items():
+        amount, count = pending[key]
+        row.total += amount
+        row.count += count
+        (changed if row.count > 0 else emptied).append(row)
+    DailyLedger.objects.bulk_update(changed, ["total", "count"], batch_size=BATCH_SIZE)
+    if emptied:
+        DailyLedger.objects.filter(pk__in=[row.pk for row in emptied]).delete()
+
+    missing = {key: value for key, value in pending.items() if key not in existing and value[1] > 0}
+    if not missing:
+        return
+    try:
+        with transaction.atomic():
+            DailyLedger.objects.bulk_create(
+                (
+                    DailyLedger(user_id=user_id, date=date, category_id=category_id, type=tx_type, total=amount, count=count)
+                    for (user_id, date, category_id, tx_type), (amount, count) in missing.items()
+                ),
+                batch_size=BATCH_SIZE,
+            )
+    except IntegrityError:
+        # a concurrent writer created some of these rows first
+        for key, (amount, count) in missing.items():
+            _apply_one(key, amount, count)
+        DailyLedger.objects.filter(user_id__in={key[0] for key in missing}, count__lte=0).delete()
+
+
+def record(transactions, sign=1):
+    apply(add_transactions(new_deltas(), transactions, sign))
+
+
+def record_change(before, tx):
+    """`before` is a snapshot() taken before the instance was updated."""
+    deltas = new_deltas()
+    key, amount = before
+    add(deltas, key, amount, -1)
+    add_transactions(deltas, [tx], 1)
+    apply(deltas)
+
+
+def rebuild(user_ids=None):
+    """Recompute the ledger from Transaction; returns the number of ledger rows written."""
+    with transaction.atomic():
+        ledger = DailyLedger.objects.all()
+        txs = Transaction.objects.filter(user__isnull=False)
+        if user_ids is not None:
+            ledger = ledger.filter(user_id__in=user_ids)
+            txs = txs.filter(user_id__in=user_ids)
+
+        ledger.delete()
+
+        rows = (
+            txs.order_by()
+            .values("user_id", "date", "category_id", "type")
+            .annotate(total=Sum("amount"), count=Count("id"))
+        )
+        created = DailyLedger.objects.bulk_create(
+            (DailyLedger(**row) for row in rows.iterator(chunk_size=2000)),
+            batch_size=1000,
+        )
+    return len(created)
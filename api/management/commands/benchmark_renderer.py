@@ -0,0 +1,80 @@
+import datetime
+import random
+import timeit
+import uuid
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from api.renderers import FastJSONRenderer, orjson
+
+
+def transaction_page(rows):
+    """A paginated transaction list as the serializers hand it to the renderer."""
+    categories = [uuid.uuid4() for _ in range(20)]
+    start = datetime.date(2024, 1, 1)
+    now = timezone.now()
+    results = [
+        {
+            "id": str(uuid.uuid4()),
+            "user": uuid.uuid4(),
+            "type": random.choice(("income", "expense")),
+            "amount": f"{random.randint(1, 500000) / 100:.2f}",
+            "category": random.choice(categories),
+            "category_name": "Groceries",
+            "category_icon": "🛒",
+            "date": (start + datetime.timedelta(days=i % 365)).isoformat(),
+            "note": f"Payment #{i}",
+            "created_at": (now - datetime.timedelta(seconds=i)).isoformat().replace("+00:00", "Z"),
+        }
+        for i in range(rows)
+    ]
+    return {"next": "http://testserver/api/transactions/?cursor=abc", "previous": None, "results": results}
+
+
+def aggregate_rows(rows):
+    """Raw aggregate output: Decimal totals, UUID ids and dates, no serializer in between."""
+    start = datetime.date(2024, 1, 1)
+    return [
+        {
+            "bucket": start + datetime.timedelta(days=i),
+            "id": uuid.uuid4(),
+            "income": Decimal(random.randint(0, 10**7)) / 100,
+            "expense": Decimal(random.randint(0, 10**7)) / 100,
+            "count": random.randint(0, 50),
+            "updated": timezone.now(),
+        }
+        for i in range(rows)
+    ]
+
+
+class Command(BaseCommand):
+    help = "Compare FastJSONRenderer with DRF's JSONRenderer on large list payloads."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=10000)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args, **options):
+        rows, repeat = options["rows"], options["repeat"]
+        baseline, fast = JSONRenderer(), FastJSONRenderer()
+
+        self.stdout.write(f"backend: {'orjson ' + orjson.__version__ if orjson else 'stdlib json'}")
+        for name, payload in (
+            ("transactions", transaction_page(rows)),
+            ("aggregates", aggregate_rows(rows)),
+        ):
+            expected = baseline.render(payload)
+            actual = fast.render(payload)
+            if actual != expected:
+                self.stderr.write(f"{name}: output differs from JSONRenderer")
+
+            drf = min(timeit.repeat(lambda: baseline.render(payload), number=1, repeat=repeat))
+            ours = min(timeit.repeat(lambda: fast.render(payload), number=1, repeat=repeat))
+            self.stdout.write(
+                f"{name:<13} {rows} rows, {len(expected) / 1024:.0f} KiB: "
+                f"JSONRenderer {drf * 1000:.1f} ms, FastJSONRenderer {ours * 1000:.1f} ms "
+                f"({drf / ours:.1f}x)"
+            )
@@ -0,0 +1,39 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from api.importers import TransactionCSVImporter
+
+
+class Command(BaseCommand):
+    help = "Import a bank statement CSV (date, amount, category[, type, note]) for a user."
+
+    def add_arguments(self, parser):
+        parser.add_argument("username")
+        parser.add_argument("path")
+        parser.add_argument("--chunk-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        User = get_user_model()
+        try:
+            user = User.objects.get(username=options["username"])
+        except User.DoesNotExist:
+            raise CommandError(f"Unknown user: {options['username']}")
+
+        importer = TransactionCSVImporter(user, chunk_size=options["chunk_size"])
+
+        try:
+            with open(options["path"], encoding="utf-8-sig", newline="") as fh:
+                for report in importer.run(fh):
+                    self.stdout.write(
+                        f"processed={report['processed']} created={report['created']} failed={report['failed']}"
+                    )
+        except (OSError, ValueError, UnicodeDecodeError) as exc:
+            raise CommandError(str(exc))
+
+        for error in report["errors"]:
+            self.stderr.write(f"line {error['line']}: {error['error']}")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {report['created']} transaction(s), "
+            f"{report['categories_created']} new categor(ies), {report['failed']} failed row(s)."
+        ))
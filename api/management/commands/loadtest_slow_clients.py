@@ -0,0 +1,161 @@
+import asyncio
+import ssl
+import statistics
+import time
+from urllib.parse import urlsplit
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure request latency while many slow clients hold connections open. "
+        "Run it once against the sync workers (gunicorn bugettracker.wsgi:application) "
+        "and once against the ASGI workers from the Procfile, with the same worker count."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--url", required=True, help="e.g. http://127.0.0.1:8000/api/async/transactions/summary/")
+        auth = parser.add_mutually_exclusive_group(required=True)
+        auth.add_argument("--token", help="JWT access token")
+        auth.add_argument("--user", help="username to mint an access token for (needs DB access)")
+        parser.add_argument("--slow-clients", type=int, default=200)
+        parser.add_argument("--drip", type=float, default=10.0, help="seconds a slow client takes to send its request")
+        parser.add_argument("--requests", type=int, default=200, help="number of measured (fast) requests")
+        parser.add_argument("--concurrency", type=int, default=10, help="concurrent measured requests")
+        parser.add_argument("--timeout", type=float, default=60.0)
+
+    def handle(self, *args, **options):
+        token = options["token"] or self.mint_token(options["user"])
+        url = urlsplit(options["url"])
+        if url.scheme not in ("http", "https"):
+            raise CommandError("--url must be http(s)://host[:port]/path")
+
+        result = asyncio.run(self.run(url, token, options))
+        latencies = sorted(result["latencies"])
+        self.stdout.write(
+            f"slow clients: {options['slow_clients']} (request sent over {options['drip']:.1f}s), "
+            f"slow requests completed: {result['slow_done']}"
+        )
+        self.stdout.write(
+            f"measured: {len(latencies)} ok, {result['errors']} failed in {result['elapsed']:.1f}s "
+            f"({len(latencies) / result['elapsed']:.1f} req/s)"
+        )
+        if latencies:
+            self.stdout.write(
+                "latency ms: "
+                f"p50={percentile(latencies, 50):.0f} p95={percentile(latencies, 95):.0f} "
+                f"p99={percentile(latencies, 99):.0f} max={latencies[-1]:.0f} "
+                f"mean={statistics.mean(latencies):.0f}"
+            )
+
+    def mint_token(self, username):
+        from rest_framework_simplejwt.tokens import AccessToken
+
+        try:
+            user = get_user_model().objects.get(username=username)
+        except get_user_model().DoesNotExist:
+            raise CommandError(f"No user {username!r}.")
+        return str(AccessToken.for_user(user))
+
+    async def run(self, url, token, options):
+        request = build_request(url, token)
+        stop = asyncio.Event()
+        slow_done = [0]
+
+        slow = [
+            asyncio.create_task(slow_client(url, request, options["drip"], stop, slow_done))
+            for _ in range(options["slow_clients"])
+        ]
+        # let the slow clients occupy their connections first
+        await asyncio.sleep(min(1.0, options["drip"] / 2))
+
+        latencies = []
+        errors = [0]
+        remaining = [options["requests"]]
+
+        async def measured():
+            while remaining[0] > 0:
+                remaining[0] -= 1
+                started = time.perf_counter()
+                try:
+                    status = await asyncio.wait_for(fetch(url, request), options["timeout"])
+                except (OSError, asyncio.TimeoutError):
+                    errors[0] += 1
+                    continue
+                if status == 200:
+                    latencies.append((time.perf_counter() - started) * 1000)
+                else:
+                    errors[0] += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(measured() for _ in range(options["concurrency"])))
+        elapsed = time.perf_counter() - started
+
+        stop.set()
+        for task in slow:
+            task.cancel()
+        await asyncio.gather(*slow, return_exceptions=True)
+        return {"latencies": latencies, "errors": errors[0], "elapsed": elapsed, "slow_done": slow_done[0]}
+
+
+def build_request(url, token):
+    path = url.path or "/"
+    if url.query:
+        path += "?" + url.query
+    return (
+        f"GET {path} HTTP/1.1\r\n"
+        f"Host: {url.netloc}\r\n"
+        f"Authorization: Bearer {token}\r\n"
+        "Accept: application/json\r\n"
+        "Connection: close\r\n"
+        "\r\n"
+    ).encode("ascii")
+
+
+async def open_connection(url):
+    port = url.port or (443 if url.scheme == "https" else 80)
+    context = ssl.create_default_context() if url.scheme == "https" else None
+    return await asyncio.open_connection(url.hostname, port, ssl=context)
+
+
+async def fetch(url, request):
+    reader, writer = await open_connection(url)
+    try:
+        writer.write(request)
+        await writer.drain()
+        status_line = await reader.readline()
+        await reader.read()
+        return int(status_line.split()[1]) if status_line else 0
+    finally:
+        writer.close()
+
+
+async def slow_client(url, request, drip, stop, done):
+    """Send the request a few bytes at a time over `drip` seconds, then read the response slowly."""
+    pieces = [request[i:i + 8] for i in range(0, len(request), 8)]
+    pause = drip / len(pieces)
+    while not stop.is_set():
+        try:
+            reader, writer = await open_connection(url)
+        except OSError:
+            await asyncio.sleep(0.5)
+            continue
+        try:
+            for piece in pieces:
+                writer.write(piece)
+                await writer.drain()
+                await asyncio.sleep(pause)
+            while await reader.read(256):
+                await asyncio.sleep(0.05)
+            done[0] += 1
+        except OSError:
+            pass
+        finally:
+            writer.close()
+
+
+def percentile(values, pct):
+    index = min(len(values) - 1, max(0, round(pct / 100 * len(values)) - 1))
+    return values[index]
@@ -0,0 +1,26 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from api import ledger
+
+
+class Command(BaseCommand):
+    help = "Rebuild the DailyLedger rollup from the Transaction table."
+
+    def add_arguments(self, parser):
+        parser.add_argument("usernames", nargs="*", help="Only rebuild these users (default: everyone).")
+
+    def handle(self, *args, **options):
+        usernames = options["usernames"]
+        user_ids = None
+
+        if usernames:
+            User = get_user_model()
+            found = dict(User.objects.filter(username__in=usernames).values_list("username", "id"))
+            missing = sorted(set(usernames) - set(found))
+            if missing:
+                raise CommandError(f"Unknown user(s): {', '.join(missing)}")
+            user_ids = list(found.values())
+
+        rows = ledger.rebuild(user_ids)
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt ledger: {rows} row(s) written."))
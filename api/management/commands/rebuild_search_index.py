@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from api import search
+
+
+class Command(BaseCommand):
+    help = "Repopulate the SQLite FTS5 transaction search index."
+
+    def handle(self, *args, **options):
+        if not search.fts_available():
+            self.stdout.write("No FTS5 search index on this database, nothing to do.")
+            return
+        rows = search.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt search index: {rows} row(s)."))
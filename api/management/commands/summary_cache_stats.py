@@ -0,0 +1,12 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from api.cache import summary_cache
+
+
+class Command(BaseCommand):
+    help = "Show hit/miss counters of the summary cache (shared counters need SUMMARY_CACHE['SHARED_ALIAS'])."
+
+    def handle(self, *args, **options):
+        self.stdout.write(json.dumps(summary_cache.stats(), indent=2))
@@ -0,0 +1,148 @@
+# Generated by Django 5.2.7 on 2026-10-17 10:30
+
+from django.db import OperationalError, migrations
+
+# The documents live in a plain table with a stable INTEGER PRIMARY KEY,
+# one per transaction keyed by its id, that feeds an external-content FTS5
+# table using the trigram tokenizer: any substring of 3+ characters matches,
+# including unsegmented Burmese text. Triggers on api_transaction and
+# api_category keep the documents in sync, so rebuilding either table (see
+# 0008) only needs those triggers recreated.
+#
+# The SQL is frozen here so that later changes to api.search cannot change
+# what this migration does.
+SQLITE_INSTALL = [
+    """
+    CREATE TABLE api_transaction_search_doc (
+        id integer NOT NULL PRIMARY KEY,
+        transaction_id char(32) NOT NULL UNIQUE,
+        note text NOT NULL,
+        category_name text NOT NULL
+    )
+    """,
+    """
+    CREATE VIRTUAL TABLE api_transaction_search USING fts5(
+        transaction_id UNINDEXED, note, category_name,
+        content = 'api_transaction_search_doc', content_rowid = 'id',
+        tokenize = 'trigram'
+    )
+    """,
+    # documents -> FTS index
+    """
+    CREATE TRIGGER api_transaction_search_doc_ai AFTER INSERT ON api_transaction_search_doc BEGIN
+        INSERT INTO api_transaction_search(rowid, transaction_id, note, category_name)
+        VALUES (new.id, new.transaction_id, new.note, new.category_name);
+    END
+    """,
+    """
+    CREATE TRIGGER api_transaction_search_doc_ad AFTER DELETE ON api_transaction_search_doc BEGIN
+        INSERT INTO api_transaction_search(api_transaction_search, rowid, transaction_id, note, category_name)
+        VALUES ('delete', old.id, old.transaction_id, old.note, old.category_name);
+    END
+    """,
+    """
+    CREATE TRIGGER api_transaction_search_doc_au AFTER UPDATE ON api_transaction_search_doc BEGIN
+        INSERT INTO api_transaction_search(api_transaction_search, rowid, transaction_id, note, category_name)
+        VALUES ('delete', old.id, old.transaction_id, old.note, old.category_name);
+        INSERT INTO api_transaction_search(rowid, transaction_id, note, category_name)
+        VALUES (new.id, new.transaction_id, new.note, new.category_name);
+    END
+    """,
+    # transactions / categories -> documents, by transaction id
+    """
+    CREATE TRIGGER api_transaction_search_ai AFTER INSERT ON api_transaction BEGIN
+        INSERT INTO api_transaction_search_doc(transaction_id, note, category_name)
+        VALUES (new.id, new.note, COALESCE((SELECT name FROM api_category WHERE id = new.category_id), ''));
+    END
+    """,
+    """
+    CREATE TRIGGER api_transaction_search_au AFTER UPDATE OF note, category_id ON api_transaction BEGIN
+        UPDATE api_transaction_search_doc
+        SET note = new.note,
+            category_name = COALESCE((SELECT name FROM api_category WHERE id = new.category_id), '')
+        WHERE transaction_id = new.id;
+    END
+    """,
+    """
+    CREATE TRIGGER api_transaction_search_ad AFTER DELETE ON api_transaction BEGIN
+        DELETE FROM api_transaction_search_doc WHERE transaction_id = old.id;
+    END
+    """,
+    """
+    CREATE TRIGGER api_category_search_au AFTER UPDATE OF name ON api_category BEGIN
+        UPDATE api_transaction_search_doc SET category_name = new.name
+        WHERE transaction_id IN (SELECT id FROM api_transaction WHERE category_id = new.id);
+    END
+    """,
+    """
+    INSERT INTO api_transaction_search_doc(transaction_id, note, category_name)
+    SELECT t.id, t.note, COALESCE(c.name, '')
+    FROM api_transaction t LEFT JOIN api_category c ON c.id = t.category_id
+    """,
+]
+
+SQLITE_UNINSTALL = [
+    "DROP TRIGGER IF EXISTS api_category_search_au",
+    "DROP TRIGGER IF EXISTS api_transaction_search_ad",
+    "DROP TRIGGER IF EXISTS api_transaction_search_au",
+    "DROP TRIGGER IF EXISTS api_transaction_search_ai",
+    "DROP TRIGGER IF EXISTS api_transaction_search_doc_au",
+    "DROP TRIGGER IF EXISTS api_transaction_search_doc_ad",
+    "DROP TRIGGER IF EXISTS api_transaction_search_doc_ai",
+    "DROP TABLE IF EXISTS api_transaction_search",
+    "DROP TABLE IF EXISTS api_transaction_search_doc",
+]
+
+POSTGRES_INSTALL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    'CREATE INDEX IF NOT EXISTS tx_note_trgm_idx ON api_transaction USING gin (UPPER("note"::text) gin_trgm_ops)',
+    'CREATE INDEX IF NOT EXISTS category_name_trgm_idx ON api_category USING gin (UPPER("name"::text) gin_trgm_ops)',
+]
+
+POSTGRES_UNINSTALL = [
+    "DROP INDEX IF EXISTS category_name_trgm_idx",
+    "DROP INDEX IF EXISTS tx_note_trgm_idx",
+]
+
+
+def sqlite_has_trigram_fts5(connection):
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("CREATE VIRTUAL TABLE temp.fts5_probe USING fts5(x, tokenize = 'trigram')")
+            cursor.execute("DROP TABLE temp.fts5_probe")
+    except OperationalError:
+        return False
+    return True
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        if not sqlite_has_trigram_fts5(schema_editor.connection):
+            # SQLite without FTS5 or older than 3.34 (no trigram tokenizer):
+            # search keeps using icontains
+            return
+        statements = SQLITE_INSTALL
+    elif vendor == 'postgresql':
+        statements = POSTGRES_INSTALL
+    else:
+        return
+    for sql in statements:
+        schema_editor.execute(sql)
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    for sql in {'sqlite': SQLITE_UNINSTALL, 'postgresql': POSTGRES_UNINSTALL}.get(vendor, []):
+        schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_dailyledger'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
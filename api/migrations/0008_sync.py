@@ -0,0 +1,121 @@
+# Generated by Django 5.2.7 on 2026-10-17 12:00
+
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+# Adding NOT NULL columns makes SQLite rebuild api_category / api_transaction,
+# which drops the triggers that feed the search documents (0006). The
+# documents are keyed by transaction id, so they stay valid: drop the
+# triggers before the rebuild and recreate them afterwards. The SQL is the
+# triggers exactly as 0006 creates them, frozen for the same reason.
+SQLITE_TRIGGERS = [
+    """
+    CREATE TRIGGER api_transaction_search_ai AFTER INSERT ON api_transaction BEGIN
+        INSERT INTO api_transaction_search_doc(transaction_id, note, category_name)
+        VALUES (new.id, new.note, COALESCE((SELECT name FROM api_category WHERE id = new.category_id), ''));
+    END
+    """,
+    """
+    CREATE TRIGGER api_transaction_search_au AFTER UPDATE OF note, category_id ON api_transaction BEGIN
+        UPDATE api_transaction_search_doc
+        SET note = new.note,
+            category_name = COALESCE((SELECT name FROM api_category WHERE id = new.category_id), '')
+        WHERE transaction_id = new.id;
+    END
+    """,
+    """
+    CREATE TRIGGER api_transaction_search_ad AFTER DELETE ON api_transaction BEGIN
+        DELETE FROM api_transaction_search_doc WHERE transaction_id = old.id;
+    END
+    """,
+    """
+    CREATE TRIGGER api_category_search_au AFTER UPDATE OF name ON api_category BEGIN
+        UPDATE api_transaction_search_doc SET category_name = new.name
+        WHERE transaction_id IN (SELECT id FROM api_transaction WHERE category_id = new.id);
+    END
+    """,
+]
+
+SQLITE_DROP_TRIGGERS = [
+    "DROP TRIGGER IF EXISTS api_category_search_au",
+    "DROP TRIGGER IF EXISTS api_transaction_search_ad",
+    "DROP TRIGGER IF EXISTS api_transaction_search_au",
+    "DROP TRIGGER IF EXISTS api_transaction_search_ai",
+]
+
+
+def has_search_documents(connection):
+    # 0006 skips the index when SQLite has no trigram tokenizer
+    return connection.vendor == 'sqlite' and 'api_transaction_search_doc' in connection.introspection.table_names()
+
+
+def drop_search_triggers(apps, schema_editor):
+    if has_search_documents(schema_editor.connection):
+        for sql in SQLITE_DROP_TRIGGERS:
+            schema_editor.execute(sql)
+
+
+def create_search_triggers(apps, schema_editor):
+    if has_search_documents(schema_editor.connection):
+        for sql in SQLITE_TRIGGERS:
+            schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_dataversion'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_search_triggers, create_search_triggers),
+        migrations.AddField(
+            model_name='category',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='transaction',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='budgetgoal',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddIndex(
+            model_name='category',
+            index=models.Index(fields=['user', 'updated_at', 'id'], name='category_user_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['user', 'updated_at', 'id'], name='tx_user_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='budgetgoal',
+            index=models.Index(fields=['user', 'updated_at', 'id'], name='goal_user_updated_idx'),
+        ),
+        migrations.CreateModel(
+            name='Tombstone',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('kind', models.CharField(choices=[('transaction', 'Transaction'), ('category', 'Category'), ('goal', 'Budget goal')], max_length=12)),
+                ('object_id', models.UUIDField()),
+                ('deleted_at', models.DateTimeField(auto_now_add=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tombstones', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['user', 'kind', 'deleted_at', 'id'], name='tombstone_user_kind_idx')],
+            },
+        ),
+        migrations.RunPython(create_search_triggers, drop_search_triggers),
+    ]
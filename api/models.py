@@ -8,6 +8,13 @@ class Category(models.Model):
     name = models.CharField(max_length=80)
     icon = models.CharField(max_length=80, blank=True, default="")
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            # delta sync (api.sync)
+            models.Index(fields=["user", "updated_at", "id"], name="category_user_updated_idx"),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.user})"
@@ -23,6 +30,19 @@ class Transaction(models.Model):
     category = models.ForeignKey(Category, on_delete=models.PROTECT, related_name="transactions")
     note = models.CharField(max_length=255, blank=True, default="")
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            # list view: user filter + (-date, -created_at, -id) keyset ordering
+            models.Index(fields=["user", "date", "created_at", "id"], name="tx_user_date_created_idx"),
+            # summary income/expense sums
+            models.Index(fields=["user", "type", "date"], name="tx_user_type_date_idx"),
+            # category filter
+            models.Index(fields=["user", "category", "date"], name="tx_user_category_date_idx"),
+            # delta sync (api.sync)
+            models.Index(fields=["user", "updated_at", "id"], name="tx_user_updated_idx"),
+        ]
 
     def __str__(self):
         return f" {self.type}Transaction {self.category} for {self.amount}"
@@ -34,6 +54,67 @@ class BudgetGoal(models.Model):
     target_amount = models.DecimalField(max_digits=12, decimal_places=2)
     gold_amount = models.DecimalField(max_digits=12, decimal_places=2)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            # delta sync (api.sync)
+            models.Index(fields=["user", "updated_at", "id"], name="goal_user_updated_idx"),
+        ]
 
     def __str__(self):
         return f"{self.user} {self.month} target={self.target_amount} gold={self.gold_amount}"
+
+
+class DailyLedger(models.Model):
+    """Per user / day / category / type rollup of Transaction, kept in sync by api.ledger."""
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="ledger_days")
+    date = models.DateField()
+    category = models.ForeignKey(Category, on_delete=models.CASCADE, related_name="ledger_days")
+    type = models.CharField(max_length=10, choices=Transaction.TX_CHOICES)
+    total = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["user", "date", "category", "type"], name="ledger_user_day_cat_type_uniq"),
+        ]
+        indexes = [
+            models.Index(fields=["user", "type", "date"], name="ledger_user_type_date_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.user} {self.date} {self.type} {self.category_id} total={self.total} count={self.count}"
+
+
+class DataVersion(models.Model):
+    """
+    Per-user write counters, bumped by every write in api.views.
+    `ledger` covers Transaction and Category, `goals` covers BudgetGoal.
+    """
+    user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, primary_key=True, related_name="data_version")
+    ledger = models.PositiveBigIntegerField(default=0)
+    goals = models.PositiveBigIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.user} ledger={self.ledger} goals={self.goals}"
+
+
+class Tombstone(models.Model):
+    """A deleted Transaction, Category or BudgetGoal, reported to clients by the delta sync (api.sync)."""
+    KIND_CHOICES = [("transaction", "Transaction"), ("category", "Category"), ("goal", "Budget goal")]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="tombstones")
+    kind = models.CharField(max_length=12, choices=KIND_CHOICES)
+    object_id = models.UUIDField()
+    deleted_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", "kind", "deleted_at", "id"], name="tombstone_user_kind_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.user} {self.kind} {self.object_id} deleted {self.deleted_at}"
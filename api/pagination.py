@@ -0,0 +1,263 @@
+# app/pagination.py
+import base64
+import json
+import uuid
+from decimal import Decimal, InvalidOperation
+
+from django.db.models import Case, DecimalField, F, Q, Sum, When, Window
+from django.db.models.expressions import RowRange
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+def signed_amount():
+    return Case(
+        When(type="income", then=F("amount")),
+        default=-F("amount"),
+        output_field=DecimalField(max_digits=14, decimal_places=2),
+    )
+
+
+def running_total(descending):
+    """Cumulative signed amount in page order, over the rows the WHERE clause keeps."""
+    order = [F(name).desc() if descending else F(name).asc() for name in ("date", "created_at", "id")]
+    return Window(Sum(signed_amount()), order_by=order, frame=RowRange(start=None, end=0))
+
+
+class TransactionCursorPagination(BasePagination):
+    """
+    Keyset pagination over (-date, -created_at, -id).
+
+    The cursor stores the (date, created_at, id) of the row at the page
+    boundary, so every page is a `WHERE (date, created_at, id) < (...)`
+    range seek instead of an OFFSET scan.
+
+    With ?running_balance=1 every row gets `running_balance`, the balance
+    after that transaction (within the active filters). The page's window
+    sum is offset by an opening balance carried in the cursor: for forward
+    cursors the balance before the boundary row, for reverse cursors the
+    balance after it. The first page (or a cursor without a balance) pays
+    for one SUM over the older rows instead.
+    """
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 500
+    cursor_query_param = "cursor"
+    running_balance_query_param = "running_balance"
+    ordering = ("-date", "-created_at", "-id")
+    invalid_cursor_message = "Invalid cursor."
+
+    def paginate_queryset(self, queryset, request, view=None):
+        page = self.page_queryset(queryset, request)
+        opening = self.opening_queryset(queryset)
+        if opening is not None:
+            self.opening_balance = opening.aggregate(total=Sum(signed_amount()))["total"] or Decimal("0")
+        return self.build_page(list(page))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """paginate_queryset() evaluated with the async ORM."""
+        page = self.page_queryset(queryset, request)
+        opening = self.opening_queryset(queryset)
+        if opening is not None:
+            totals = await opening.aaggregate(total=Sum(signed_amount()))
+            self.opening_balance = totals["total"] or Decimal("0")
+        return self.build_page([row async for row in page])
+
+    def page_queryset(self, queryset, request):
+        """The requested page as a sliced queryset, with one extra row to detect more."""
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.base_url = request.build_absolute_uri()
+
+        self.cursor = self.decode_cursor(request)
+        self.reverse = bool(self.cursor and self.cursor["reverse"])
+        self.running_balance = request.query_params.get(self.running_balance_query_param) in ["1", "true"]
+        self.opening_balance = self.cursor["balance"] if self.cursor else None
+
+        if self.reverse:
+            qs = queryset.order_by("date", "created_at", "id")
+        else:
+            qs = queryset.order_by(*self.ordering)
+
+        if self.cursor:
+            qs = qs.filter(self.keyset_filter(self.cursor["position"], descending=not self.reverse))
+
+        if self.running_balance:
+            qs = qs.annotate(signed_amount=signed_amount(), running_total=running_total(not self.reverse))
+
+        return qs[: self.page_size + 1]
+
+    def opening_queryset(self, queryset):
+        """Rows whose SUM is the opening balance, or None when the cursor already carries it."""
+        if not self.running_balance or self.opening_balance is not None:
+            return None
+        qs = queryset.order_by()
+        if not self.cursor:
+            return qs
+        position = self.cursor["position"]
+        if self.reverse:
+            # balance after the boundary row: everything up to and including it
+            return qs.exclude(self.keyset_filter(position, descending=False))
+        # balance before the boundary row: everything older
+        return qs.filter(self.keyset_filter(position, descending=True))
+
+    def build_page(self, rows):
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+
+        if self.reverse:
+            rows.reverse()
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = self.cursor is not None
+
+        self.page = rows
+        self.balances = self.balances_of(rows) if self.running_balance else None
+        return rows
+
+    def balances_of(self, rows):
+        balances = []
+        for row in rows:
+            running, signed = self.value_of(row, "running_total"), self.value_of(row, "signed_amount")
+            if self.reverse:
+                balances.append(self.opening_balance + running)
+            else:
+                balances.append(self.opening_balance - running + signed)
+        return balances
+
+    def paginate_ranked(self, queryset, request, view=None):
+        """
+        Relevance ordering has no stable keyset, so it returns a single
+        page of the best matches with no next/previous cursors.
+        """
+        if "search_rank" not in queryset.query.annotations:
+            return self.paginate_queryset(queryset, request, view)
+
+        self.page = list(self.ranked_queryset(queryset, request))
+        return self.page
+
+    async def apaginate_ranked(self, queryset, request, view=None):
+        if "search_rank" not in queryset.query.annotations:
+            return await self.apaginate_queryset(queryset, request, view)
+
+        self.page = [row async for row in self.ranked_queryset(queryset, request)]
+        return self.page
+
+    def ranked_queryset(self, queryset, request):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.base_url = request.build_absolute_uri()
+        self.has_next = self.has_previous = False
+        # relevance order is not chronological, so there is no running balance
+        self.running_balance = False
+        self.balances = None
+        return queryset.order_by("-search_rank", *self.ordering)[: self.page_size]
+
+    def get_page_size(self, request):
+        raw = request.query_params.get(self.page_size_query_param)
+        if raw:
+            try:
+                size = int(raw)
+            except (TypeError, ValueError):
+                size = 0
+            if size > 0:
+                return min(size, self.max_page_size)
+        return self.page_size
+
+    # -------------------------
+    # Cursor encoding
+    # -------------------------
+    @staticmethod
+    def value_of(row, name):
+        return row[name] if isinstance(row, dict) else getattr(row, name)
+
+    @staticmethod
+    def position_of(row):
+        if isinstance(row, dict):
+            return (row["date"], row["created_at"], row["id"])
+        return (row.date, row.created_at, row.id)
+
+    @staticmethod
+    def keyset_filter(position, descending=True):
+        date, created_at, pk = position
+        op = "lt" if descending else "gt"
+        return (
+            Q(**{f"date__{op}": date})
+            | Q(date=date, **{f"created_at__{op}": created_at})
+            | Q(date=date, created_at=created_at, **{f"id__{op}": pk})
+        )
+
+    def encode_cursor(self, position, reverse=False, balance=None):
+        date, created_at, pk = position
+        payload = {"d": date.isoformat(), "c": created_at.isoformat(), "i": str(pk)}
+        if reverse:
+            payload["r"] = 1
+        if balance is not None:
+            payload["b"] = str(balance)
+        token = base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode("ascii"))
+        return replace_query_param(self.base_url, self.cursor_query_param, token.decode("ascii"))
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode("ascii")))
+            date = parse_date(payload["d"])
+            created_at = parse_datetime(payload["c"])
+            pk = uuid.UUID(payload["i"])
+            balance = Decimal(payload["b"]) if "b" in payload else None
+        except (TypeError, ValueError, KeyError, UnicodeEncodeError, InvalidOperation):
+            raise NotFound(self.invalid_cursor_message)
+
+        if date is None or created_at is None or (balance is not None and not balance.is_finite()):
+            raise NotFound(self.invalid_cursor_message)
+
+        return {"position": (date, created_at, pk), "reverse": bool(payload.get("r")), "balance": balance}
+
+    # -------------------------
+    # Links / response
+    # -------------------------
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        balance = None
+        if self.balances:
+            # balance before the last row = opening balance of the next page
+            balance = self.balances[-1] - self.value_of(self.page[-1], "signed_amount")
+        return self.encode_cursor(self.position_of(self.page[-1]), balance=balance)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        balance = self.balances[0] if self.balances else None
+        return self.encode_cursor(self.position_of(self.page[0]), reverse=True, balance=balance)
+
+    def get_paginated_response(self, data):
+        if self.balances:
+            for item, balance in zip(data, self.balances):
+                item["running_balance"] = "{:.2f}".format(balance)
+        return Response({
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
@@ -0,0 +1,97 @@
+# app/renderers.py
+import decimal
+import json
+import math
+import uuid
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # optional accelerated backend
+    orjson = None
+
+
+_drf_encoder = JSONEncoder()
+
+
+def _default(obj):
+    # same results as rest_framework's JSONEncoder, with the hot types first
+    if isinstance(obj, decimal.Decimal):
+        return float(obj)
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    return _drf_encoder.default(obj)
+
+
+def _has_non_finite(obj):
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, decimal.Decimal):
+        return not obj.is_finite()
+    if isinstance(obj, dict):
+        return any(_has_non_finite(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(item) for item in obj)
+    return False
+
+
+def _stdlib_dumps(obj):
+    return json.dumps(
+        obj, default=_default, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+if orjson is not None:
+    # datetimes go through _default so they match DRF's ISO-8601/"Z" formatting exactly
+    _ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj):
+        try:
+            encoded = orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits; the stdlib handles (or rejects) them like DRF does
+            return _stdlib_dumps(obj)
+        if b"null" in encoded and _has_non_finite(obj):
+            # orjson writes NaN / Infinity as null; the stdlib raises ValueError like DRF
+            return _stdlib_dumps(obj)
+        return encoded
+else:
+    dumps = _stdlib_dumps
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    Drop-in replacement for DRF's JSONRenderer with the same output (floats
+    aside, where orjson writes exponents as 1e16 instead of 1e+16).
+
+    Decimal and UUID are encoded by a plain function instead of DRF's
+    encoder class, using orjson when it is installed. The document is
+    encoded in one call; endpoints that must not hold a whole large body in
+    memory stream it themselves (see the CSV / NDJSON exports).
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        renderer_context = renderer_context or {}
+        if (
+            self.get_indent(accepted_media_type, renderer_context)
+            or not api_settings.COMPACT_JSON
+            or not api_settings.UNICODE_JSON
+            or not api_settings.STRICT_JSON
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        return self._escape(dumps(data))
+
+    @staticmethod
+    def _escape(encoded):
+        # mirror JSONRenderer: U+2028/U+2029 are valid JSON but not valid JavaScript
+        if b"\xe2\x80\xa8" in encoded or b"\xe2\x80\xa9" in encoded:
+            encoded = encoded.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+        return encoded
+
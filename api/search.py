@@ -0,0 +1,105 @@
+# app/search.py
+"""
+Transaction text search over `note` and the category name.
+
+On SQLite the api_transaction_search FTS5 table (migration 0006) indexes
+the documents in api_transaction_search_doc, one per transaction keyed by
+its id. Triggers on api_transaction / api_category keep them in sync,
+including bulk writes. The trigram tokenizer matches any substring of 3+
+characters, like icontains did; shorter words fall back to icontains.
+
+The index is shared by all users: MATCH returns every user's matching
+documents and `id IN (...)` then keeps the caller's rows. That is accepted
+on purpose. Its cost follows the number of matching documents, not the
+table size. FTS5 has no way to narrow a MATCH to one user's rows first:
+an UNINDEXED user column is only checked after the match, and an indexed
+one would tokenize into trigrams that every user shares. The SQLite
+deployment this targets is small enough. Larger installs run PostgreSQL,
+where the pg_trgm indexes can be combined with the user index.
+Elsewhere the search is icontains, which on PostgreSQL is backed by pg_trgm
+GIN indexes on UPPER(note) and UPPER(name).
+"""
+from asgiref.sync import sync_to_async
+from django.db import connection
+from django.db.models import F, FloatField, Func, Q, Value
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Greatest
+
+FTS_TABLE = "api_transaction_search"
+DOC_TABLE = "api_transaction_search_doc"
+
+# the trigram tokenizer cannot match anything shorter
+MIN_WORD_LENGTH = 3
+
+_fts_available = None
+
+
+def fts_available():
+    global _fts_available
+    if _fts_available is None:
+        _fts_available = connection.vendor == "sqlite" and FTS_TABLE in connection.introspection.table_names()
+    return _fts_available
+
+
+async def afts_available():
+    """fts_available() for async views: the one-time table introspection runs in a thread."""
+    if _fts_available is None:
+        await sync_to_async(fts_available)()
+    return _fts_available
+
+
+def fts_query(term):
+    """
+    Turn free text into an FTS5 query: every whitespace-separated word must
+    occur as a substring. "" when a word is too short for trigrams.
+    """
+    words = term.split()
+    if not words or any(len(word) < MIN_WORD_LENGTH for word in words):
+        return ""
+    return " ".join('"' + word.replace('"', '""') + '"' for word in words)
+
+
+def search_transactions(qs, term, rank=False):
+    term = (term or "").strip()
+    if not term:
+        return qs
+
+    match = fts_query(term) if fts_available() else ""
+    if match:
+        qs = qs.filter(id__in=RawSQL(
+            f"SELECT transaction_id FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s",
+            [match],
+        ))
+        if rank:
+            qs = qs.annotate(search_rank=RawSQL(
+                f"SELECT -bm25({FTS_TABLE}) FROM {FTS_TABLE} "
+                f"WHERE {FTS_TABLE} MATCH %s AND {FTS_TABLE}.rowid = "
+                f"(SELECT id FROM {DOC_TABLE} WHERE transaction_id = api_transaction.id)",
+                [match],
+                output_field=FloatField(),
+            ))
+        return qs
+
+    qs = qs.filter(Q(note__icontains=term) | Q(category__name__icontains=term))
+    if rank and connection.vendor == "postgresql":
+        qs = qs.annotate(search_rank=Greatest(
+            Func(F("note"), Value(term), function="similarity", output_field=FloatField()),
+            Func(F("category__name"), Value(term), function="similarity", output_field=FloatField()),
+        ))
+    return qs
+
+
+def rebuild():
+    """Re-derive the search documents from api_transaction and rebuild the FTS index from them."""
+    if not fts_available():
+        return 0
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {DOC_TABLE}")
+        cursor.execute(
+            f"INSERT INTO {DOC_TABLE}(transaction_id, note, category_name) "
+            f"SELECT t.id, t.note, COALESCE(c.name, '') "
+            f"FROM api_transaction t LEFT JOIN api_category c ON c.id = t.category_id"
+        )
+        cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+        cursor.execute(f"SELECT COUNT(*) FROM {DOC_TABLE}")
+        return cursor.fetchone()[0]
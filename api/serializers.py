@@ -1,17 +1,30 @@
 # app/serializers.py
 from rest_framework import serializers
+from .batch import METHODS, SAFE_METHODS
+from .fieldsets import SparseFieldsetsMixin
 from .models import Category, Transaction, BudgetGoal
 
 
-class CategorySerializer(serializers.ModelSerializer):
+class CategorySerializer(SparseFieldsetsMixin, serializers.ModelSerializer):
     user = serializers.HiddenField(default=serializers.CurrentUserDefault())
     class Meta:
         model = Category
-        fields = ["id", "user", "name", "icon", "created_at"]
-        read_only_fields = ["id", "created_at"]
+        fields = ["id", "user", "name", "icon", "created_at", "updated_at"]
+        read_only_fields = ["id", "created_at", "updated_at"]
 
 
-class TransactionSerializer(serializers.ModelSerializer):
+class CategoryStatsSerializer(CategorySerializer):
+    """Category list with ?with_stats=1; the values come from aggregates.with_category_stats."""
+    transaction_count = serializers.IntegerField(read_only=True)
+    income = serializers.DecimalField(max_digits=14, decimal_places=2, read_only=True)
+    expense = serializers.DecimalField(max_digits=14, decimal_places=2, read_only=True)
+    last_used = serializers.DateField(read_only=True)
+
+    class Meta(CategorySerializer.Meta):
+        fields = CategorySerializer.Meta.fields + ["transaction_count", "income", "expense", "last_used"]
+
+
+class TransactionSerializer(SparseFieldsetsMixin, serializers.ModelSerializer):
     user = serializers.HiddenField(default=serializers.CurrentUserDefault())
     # read for FE
     category_name = serializers.CharField(source="category.name", read_only=True)
@@ -30,16 +43,117 @@ class TransactionSerializer(serializers.ModelSerializer):
             "category_icon",
             "note",
             "created_at",
+            "updated_at",
         ]
-        read_only_fields = ["id", "created_at"]
+        read_only_fields = ["id", "created_at", "updated_at"]
 
 
-class BudgetGoalSerializer(serializers.ModelSerializer):
+class BudgetGoalSerializer(SparseFieldsetsMixin, serializers.ModelSerializer):
     class Meta:
         model = BudgetGoal
-        fields = ["id", "user", "month", "target_amount", "gold_amount", "created_at"]
-        read_only_fields = ["id", "created_at"]
+        fields = ["id", "user", "month", "target_amount", "gold_amount", "created_at", "updated_at"]
+        read_only_fields = ["id", "created_at", "updated_at"]
 
     def validate_month(self, value):
         # optional: always store first day of month
         return value.replace(day=1)
+
+
+class CategoryMergeSerializer(serializers.Serializer):
+    """Ownership of `sources` and `target` is checked by the view in one query."""
+    sources = serializers.ListField(child=serializers.UUIDField(), allow_empty=False, max_length=100)
+    target = serializers.UUIDField()
+
+    def validate(self, attrs):
+        attrs["sources"] = list(dict.fromkeys(attrs["sources"]))
+        if attrs["target"] in attrs["sources"]:
+            raise serializers.ValidationError({"sources": "The target cannot be one of the sources."})
+        return attrs
+
+
+class BatchItemSerializer(serializers.Serializer):
+    id = serializers.CharField(max_length=64, required=False)
+    method = serializers.ChoiceField(choices=METHODS)
+    path = serializers.CharField(max_length=2000)
+    body = serializers.JSONField(required=False, allow_null=True)
+    headers = serializers.DictField(child=serializers.CharField(max_length=2000), required=False)
+
+    def to_internal_value(self, data):
+        if isinstance(data, dict) and isinstance(data.get("method"), str):
+            data = {**data, "method": data["method"].upper()}
+        return super().to_internal_value(data)
+
+
+class BatchSerializer(serializers.Serializer):
+    requests = serializers.ListField(child=BatchItemSerializer(), allow_empty=False, max_length=20)
+    parallel = serializers.BooleanField(default=False)
+    atomic = serializers.BooleanField(default=False)
+
+    def validate(self, attrs):
+        methods = {item["method"] for item in attrs["requests"]}
+        if attrs["parallel"] and attrs["atomic"]:
+            raise serializers.ValidationError("Use either parallel or atomic, not both.")
+        if attrs["parallel"] and not methods <= set(SAFE_METHODS):
+            raise serializers.ValidationError({"parallel": "Only GET/HEAD batches can run in parallel."})
+        if attrs["atomic"] and methods & set(SAFE_METHODS):
+            # a read inside a transaction that is later rolled back would cache / tag
+            # data under a version number that gets reused by the next real write
+            raise serializers.ValidationError({"atomic": "Atomic batches can only contain writes."})
+        return attrs
+
+
+class TransactionBulkItemSerializer(serializers.Serializer):
+    """
+    One row of a bulk create. `category` is validated against the user's
+    categories in a single query by the view, not per row.
+    """
+    type = serializers.ChoiceField(choices=Transaction.TX_CHOICES)
+    amount = serializers.DecimalField(max_digits=12, decimal_places=2)
+    date = serializers.DateField()
+    category = serializers.UUIDField()
+    note = serializers.CharField(max_length=255, required=False, allow_blank=True, default="")
+
+
+class TransactionBulkUpdateSerializer(serializers.Serializer):
+    """Fields a bulk update may set; `category` is checked against the user's categories by the view."""
+    type = serializers.ChoiceField(choices=Transaction.TX_CHOICES, required=False)
+    category = serializers.UUIDField(required=False)
+    note = serializers.CharField(max_length=255, required=False, allow_blank=True)
+
+    def validate(self, attrs):
+        if not attrs:
+            raise serializers.ValidationError("Nothing to update: set type, category and/or note.")
+        return attrs
+
+
+class TransactionFilterSerializer(serializers.Serializer):
+    """
+    The `filter` object of a bulk update/delete: the transaction list params,
+    typed. Null values are dropped and unknown keys rejected, so a typo can
+    never widen the filter to every row.
+    """
+    type = serializers.ChoiceField(choices=Transaction.TX_CHOICES + [("all", "All")], required=False)
+    category = serializers.UUIDField(required=False)
+    min = serializers.DecimalField(max_digits=12, decimal_places=2, required=False)
+    max = serializers.DecimalField(max_digits=12, decimal_places=2, required=False)
+    date_from = serializers.DateField(required=False)
+    date_to = serializers.DateField(required=False)
+    search = serializers.CharField(required=False)
+
+    def get_fields(self):
+        # "from" / "to" are keywords, so they are declared under other names
+        fields = super().get_fields()
+        fields["from"] = fields.pop("date_from")
+        fields["to"] = fields.pop("date_to")
+        return fields
+
+    def to_internal_value(self, data):
+        unknown = sorted(set(data) - set(self.fields))
+        if unknown:
+            raise serializers.ValidationError({key: ["Unknown filter."] for key in unknown})
+        return super().to_internal_value({key: value for key, value in data.items() if value is not None})
+
+    def validate(self, attrs):
+        if not attrs:
+            raise serializers.ValidationError("Filter matches every transaction; give at least one value.")
+        return attrs
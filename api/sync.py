@@ -0,0 +1,142 @@
+# app/sync.py
+"""
+Delta sync for offline clients.
+
+Transaction, Category and BudgetGoal carry `updated_at` (auto_now, or set
+explicitly by set-based updates) indexed on (user, updated_at, id), and
+every delete path leaves a Tombstone. A sync reads one "changed" and one
+"deleted" stream per model with keyset pagination on (timestamp, id). All
+pages of one sync are bounded by the same `until` instant, so paging stays
+stable while the user keeps writing.
+
+The sync token is opaque to clients (base64 JSON). While paging it holds
+`until` and the per-stream positions; after the last page every stream
+restarts at `until - OVERLAP`, so rows written by a transaction that
+committed late with an older updated_at are still picked up. Clients apply
+changes by id, so seeing a row twice is harmless.
+"""
+import base64
+import binascii
+import json
+import uuid
+from datetime import datetime, timedelta
+
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from .fastpath import FastRowSerializer
+from .models import BudgetGoal, Category, Tombstone, Transaction
+from .serializers import BudgetGoalSerializer, CategorySerializer, TransactionSerializer
+
+TRANSACTION, CATEGORY, GOAL = "transaction", "category", "goal"
+
+# response key -> (model, tombstone kind, serializer)
+STREAMS = {
+    "categories": (Category, CATEGORY, CategorySerializer),
+    "transactions": (Transaction, TRANSACTION, TransactionSerializer),
+    "goals": (BudgetGoal, GOAL, BudgetGoalSerializer),
+}
+
+OVERLAP = timedelta(seconds=5)
+
+
+def record_deletions(user, kind, ids):
+    """Write tombstones for deleted rows; call it in the same DB transaction as the delete."""
+    Tombstone.objects.bulk_create(
+        (Tombstone(user=user, kind=kind, object_id=object_id) for object_id in ids),
+        batch_size=1000,
+    )
+
+
+def encode_token(state):
+    raw = json.dumps(state, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_token(token):
+    try:
+        state = json.loads(base64.urlsafe_b64decode(token.encode("ascii")))
+        positions = state["p"]
+        for name in positions:
+            timestamp, pk = positions[name]
+            positions[name] = (datetime.fromisoformat(timestamp), pk and uuid.UUID(pk))
+        if state.get("u"):
+            state["u"] = datetime.fromisoformat(state["u"])
+    except (TypeError, ValueError, KeyError, AttributeError, UnicodeEncodeError, binascii.Error):
+        raise ValidationError({"token": "Invalid sync token."})
+    return state
+
+
+def _position(timestamp, pk=None):
+    return [timestamp.isoformat(), str(pk) if pk is not None else None]
+
+
+def _after(qs, field, position):
+    """Rows after a keyset position; a position without pk is inclusive (restart point)."""
+    if position is None:
+        return qs
+    timestamp, pk = position
+    if pk is None:
+        return qs.filter(**{f"{field}__gte": timestamp})
+    return qs.filter(Q(**{f"{field}__gt": timestamp}) | Q(**{field: timestamp, "id__gt": pk}))
+
+
+def _page(qs, field, position, columns, page_size):
+    rows = list(_after(qs, field, position).order_by(field, "id").values(*columns)[:page_size + 1])
+    return rows[:page_size], len(rows) > page_size
+
+
+def changes(user, token=None, page_size=500):
+    """
+    One page of changes for `user` since `token` (None = full sync):
+    {"sync_token", "has_more", "<stream>": {"changed": [...], "deleted": [ids]}}.
+    """
+    if token:
+        state = decode_token(token)
+    else:
+        # a full sync has nothing to delete on the client
+        state = {"p": {}, "f": True}
+
+    until = state.get("u") or timezone.now()
+    positions = state["p"]
+    full = state.get("f", False)
+
+    data = {}
+    has_more = False
+    for name, (model, kind, serializer_class) in STREAMS.items():
+        fast = FastRowSerializer(serializer_class(context={}))
+        columns = dict.fromkeys(fast.paths + ["id", "updated_at"])
+        rows, more = _page(
+            model.objects.filter(user=user, updated_at__lte=until),
+            "updated_at", positions.get(name), columns, page_size,
+        )
+        has_more |= more
+        if rows:
+            positions[name] = (rows[-1]["updated_at"], rows[-1]["id"])
+
+        deleted = []
+        if not full:
+            key = name + ":deleted"
+            tombstones, more = _page(
+                Tombstone.objects.filter(user=user, kind=kind, deleted_at__lte=until),
+                "deleted_at", positions.get(key), ["id", "object_id", "deleted_at"], page_size,
+            )
+            has_more |= more
+            if tombstones:
+                positions[key] = (tombstones[-1]["deleted_at"], tombstones[-1]["id"])
+            deleted = [str(row["object_id"]) for row in tombstones]
+
+        data[name] = {"changed": fast.serialize(rows), "deleted": deleted}
+
+    if has_more:
+        next_state = {
+            "u": until.isoformat(),
+            "p": {name: _position(*position) for name, position in positions.items()},
+            "f": full,
+        }
+    else:
+        restart = _position(until - OVERLAP)
+        next_state = {"p": {key: restart for name in STREAMS for key in (name, name + ":deleted")}}
+
+    return {"sync_token": encode_token(next_state), "has_more": has_more, **data}
@@ -1,3 +1,1338 @@
-from django.test import TestCase
+import csv
+import io
+import itertools
+import json
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from urllib.parse import parse_qs, urlsplit
 
-# Create your tests here.
+from asgiref.sync import sync_to_async
+from django.contrib import admin
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.http import QueryDict
+from django.test import AsyncRequestFactory, RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, force_authenticate
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from bugettracker.streaming import streaming_response
+
+from . import aggregates, ledger, search, sync, versioning
+from .admin import BudgetGoalAdmin, CategoryAdmin, TransactionAdmin
+from .cache import summary_cache
+from .fastpath import FastRowSerializer
+from .importers import TransactionCSVImporter
+from .renderers import FastJSONRenderer
+from .models import BudgetGoal, Category, DailyLedger, Tombstone, Transaction
+from .serializers import BudgetGoalSerializer, CategorySerializer, TransactionSerializer
+from .views import (
+    BatchView,
+    BudgetGoalProgressView,
+    CategoryListView,
+    CategoryMergeView,
+    DashboardView,
+    SyncView,
+    TransactionBulkCreateView,
+    TransactionBulkDeleteView,
+    TransactionBulkUpdateView,
+    TransactionByCategoryView,
+    TransactionCreateView,
+    TransactionDeleteView,
+    TransactionDetailView,
+    TransactionExportView,
+    TransactionImportView,
+    TransactionListView,
+    TransactionTimeSeriesView,
+    TransactionUpdateView,
+)
+
+User = get_user_model()
+_phones = itertools.count(1)
+
+
+def make_user(name):
+    return User.objects.create_user(
+        username=name, email=f"{name}@example.com", phone=f"+9594200{next(_phones):05d}", password="s3cret-pass!"
+    )
+
+
+class TransactionIndexPlanTests(TestCase):
+    """EXPLAIN QUERY PLAN checks for the per-user transaction query shapes."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = make_user("planner")
+        cls.category = Category.objects.create(user=cls.user, name="Food")
+        Transaction.objects.create(
+            user=cls.user, type="expense", amount="12.50", date=date(2026, 1, 5), category=cls.category
+        )
+
+    def setUp(self):
+        if connection.vendor != "sqlite":
+            self.skipTest("EXPLAIN QUERY PLAN is SQLite specific")
+
+    def list_queryset(self, **params):
+        request = Request(APIRequestFactory().get("/api/transactions/", params))
+        request.user = self.user
+        view = TransactionListView()
+        view.request = request
+        view.format_kwarg = None
+        return view.get_queryset()
+
+    def assertUsesIndex(self, queryset, index_name):
+        plan = queryset.explain()
+        self.assertIn(index_name, plan)
+        self.assertNotIn("USE TEMP B-TREE FOR ORDER BY", plan)
+
+    def test_list_uses_user_date_index(self):
+        self.assertUsesIndex(self.list_queryset(), "tx_user_date_created_idx")
+
+    def test_list_with_date_range_uses_user_date_index(self):
+        self.assertUsesIndex(
+            self.list_queryset(**{"from": "2026-01-01", "to": "2026-01-31"}), "tx_user_date_created_idx"
+        )
+
+    def source_queryset(self, query):
+        queryset, _, _ = aggregates._source(self.user, QueryDict(query))
+        return queryset
+
+    def test_summary_reads_ledger_index(self):
+        self.assertIn("ledger_user_type_date_idx", self.source_queryset("type=income&from=2026-01-01").explain())
+
+    def test_raw_summary_by_type_uses_user_type_index(self):
+        # min/max/search can't be answered from the ledger; with a type the
+        # raw fallback still narrows on (user, type, date)
+        queryset = self.source_queryset("type=income&min=5&from=2026-01-01")
+        self.assertIn("tx_user_type_date_idx", queryset.explain())
+
+    def test_category_filter_uses_composite_index(self):
+        qs = Transaction.objects.filter(user=self.user, category_id=self.category.id, date__gte="2026-01-01")
+        self.assertIn("tx_user_category_date_idx", qs.explain())
+
+
+class FastJSONRendererTests(TestCase):
+    def test_rejects_non_finite_numbers_like_drf(self):
+        for value in [float("nan"), float("inf"), float("-inf"), Decimal("NaN"), Decimal("-Infinity")]:
+            for data in [{"results": [{"amount": value, "note": None}]}, [None, (value,)]]:
+                with self.subTest(data=data):
+                    with self.assertRaises(ValueError):
+                        JSONRenderer().render(data)
+                    with self.assertRaises(ValueError):
+                        FastJSONRenderer().render(data)
+
+    def test_nulls_render_like_drf(self):
+        data = {"amount": Decimal("1.50"), "icon": None, "rows": [1.5, None, {"x": None}]}
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+class FastPathParityTests(TestCase):
+    """FastRowSerializer must render byte-for-byte what the DRF serializers render."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = make_user("parity")
+        food = Category.objects.create(user=cls.user, name="Food & Drinks", icon="🍜")
+        salary = Category.objects.create(user=cls.user, name="Salary")
+        rows = [
+            ("expense", "0.10", date(2026, 1, 1), food, "morning coffee ☕"),
+            ("expense", "1234567890.12", date(2026, 1, 2), food, ""),
+            ("income", "5.00", date(2025, 12, 31), salary, 'quotes "and" \\ backslash'),
+            ("income", "100", date(2024, 2, 29), salary, "\u2028 separators \u2029"),
+        ]
+        for tx_type, amount, day, category, note in rows:
+            Transaction.objects.create(
+                user=cls.user, type=tx_type, amount=amount, date=day, category=category, note=note
+            )
+        # exercise whole-second, UTC-midnight and microsecond timestamps
+        stamps = [
+            datetime(2026, 1, 1, 0, 0, 0, tzinfo=dt_timezone.utc),
+            datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=dt_timezone.utc),
+        ]
+        for tx, stamp in zip(Transaction.objects.order_by("date"), stamps):
+            Transaction.objects.filter(pk=tx.pk).update(created_at=stamp)
+
+        BudgetGoal.objects.create(user=cls.user, month=date(2026, 1, 1), target_amount="500.00", gold_amount="0.5")
+        BudgetGoal.objects.create(user=cls.user, month=date(2025, 12, 1), target_amount="0", gold_amount="99999.99")
+
+    def request(self, **params):
+        request = Request(APIRequestFactory().get("/", params))
+        request.user = self.user
+        return request
+
+    def assertParity(self, serializer_class, queryset, **params):
+        context = {"request": self.request(**params)}
+        expected = serializer_class(queryset, many=True, context=context).data
+
+        fast = FastRowSerializer(serializer_class(context=context))
+        actual = fast.serialize(queryset.values(*fast.paths))
+
+        renderer = JSONRenderer()
+        self.assertEqual(renderer.render(actual), renderer.render(expected))
+
+    def transactions(self):
+        return Transaction.objects.select_related("category").filter(user=self.user).order_by("-date", "-created_at", "-id")
+
+    def test_transaction_rows(self):
+        self.assertParity(TransactionSerializer, self.transactions())
+
+    def test_transaction_rows_in_utc(self):
+        with timezone.override("UTC"):
+            self.assertParity(TransactionSerializer, self.transactions())
+
+    def test_transaction_sparse_fields(self):
+        self.assertParity(TransactionSerializer, self.transactions(), fields="id,amount,date,type")
+
+    def test_transaction_omit(self):
+        self.assertParity(TransactionSerializer, self.transactions(), omit="category_name,category_icon,note")
+
+    def test_category_rows(self):
+        self.assertParity(CategorySerializer, Category.objects.filter(user=self.user).order_by("-created_at"))
+
+    def test_goal_rows(self):
+        self.assertParity(BudgetGoalSerializer, BudgetGoal.objects.filter(user=self.user).order_by("-month"))
+
+    def test_list_endpoint_matches_serializer(self):
+        request = APIRequestFactory().get("/api/transactions/")
+        force_authenticate(request, user=self.user)
+        response = TransactionListView.as_view()(request)
+
+        expected = TransactionSerializer(self.transactions(), many=True, context={"request": self.request()}).data
+        renderer = JSONRenderer()
+        self.assertEqual(renderer.render(response.data["results"]), renderer.render(expected))
+
+
+class CategoryStatsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = make_user("stats")
+        cls.food = Category.objects.create(user=cls.user, name="Food")
+        cls.salary = Category.objects.create(user=cls.user, name="Salary")
+        cls.unused = Category.objects.create(user=cls.user, name="Unused")
+        rows = [
+            ("expense", "12.50", date(2026, 1, 5), cls.food),
+            ("expense", "7.50", date(2026, 2, 1), cls.food),
+            ("income", "1000.00", date(2026, 1, 31), cls.salary),
+        ]
+        ledger.record([
+            Transaction.objects.create(user=cls.user, type=tx_type, amount=amount, date=day, category=category)
+            for tx_type, amount, day, category in rows
+        ])
+
+    def get(self, **params):
+        request = APIRequestFactory().get("/api/categories/", {"with_stats": "1", **params})
+        force_authenticate(request, user=self.user)
+        # data version lookup for the ETag + one aggregated category query
+        with self.assertNumQueries(2):
+            response = CategoryListView.as_view()(request)
+        return {row["name"]: row for row in response.data}
+
+    def test_totals(self):
+        rows = self.get()
+        self.assertEqual(
+            (rows["Food"]["transaction_count"], rows["Food"]["income"], rows["Food"]["expense"], rows["Food"]["last_used"]),
+            (2, "0.00", "20.00", "2026-02-01"),
+        )
+        self.assertEqual((rows["Salary"]["transaction_count"], rows["Salary"]["income"]), (1, "1000.00"))
+        self.assertEqual(
+            (rows["Unused"]["transaction_count"], rows["Unused"]["expense"], rows["Unused"]["last_used"]),
+            (0, "0.00", None),
+        )
+
+    def test_date_window(self):
+        rows = self.get(**{"from": "2026-01-01", "to": "2026-01-31"})
+        self.assertEqual(
+            (rows["Food"]["transaction_count"], rows["Food"]["expense"], rows["Food"]["last_used"]),
+            (1, "12.50", "2026-01-05"),
+        )
+
+    def test_plain_list_has_no_stats(self):
+        request = APIRequestFactory().get("/api/categories/")
+        force_authenticate(request, user=self.user)
+        response = CategoryListView.as_view()(request)
+        self.assertNotIn("income", response.data[0])
+
+
+class RunningBalanceTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = make_user("balance")
+        category = Category.objects.create(user=cls.user, name="General")
+        rows = [
+            ("income", "1000.00", date(2026, 1, 1)),
+            ("expense", "12.50", date(2026, 1, 2)),
+            ("expense", "7.25", date(2026, 1, 2)),
+            ("income", "50.00", date(2026, 1, 3)),
+            ("expense", "300.00", date(2026, 1, 5)),
+            ("expense", "0.99", date(2026, 1, 5)),
+            ("income", "20.00", date(2026, 1, 8)),
+        ]
+        for tx_type, amount, day in rows:
+            Transaction.objects.create(user=cls.user, type=tx_type, amount=amount, date=day, category=category)
+
+    def expected(self):
+        balance = Decimal("0")
+        balances = {}
+        for tx in Transaction.objects.filter(user=self.user).order_by("date", "created_at", "id"):
+            balance += tx.amount if tx.type == "income" else -tx.amount
+            balances[str(tx.id)] = "{:.2f}".format(balance)
+        return balances
+
+    def get(self, url=None, **params):
+        query = {"running_balance": "1", "page_size": "3"}
+        if url:
+            query.update({key: values[0] for key, values in parse_qs(urlsplit(url).query).items()})
+        query.update(params)
+        request = APIRequestFactory().get("/api/transactions/", query)
+        force_authenticate(request, user=self.user)
+        return TransactionListView.as_view()(request).data
+
+    def test_forward_and_back(self):
+        expected = self.expected()
+
+        pages = [self.get()]
+        while pages[-1]["next"]:
+            pages.append(self.get(pages[-1]["next"]))
+        self.assertEqual(len(pages), 3)
+
+        seen = {row["id"]: row["running_balance"] for page in pages for row in page["results"]}
+        self.assertEqual(seen, expected)
+
+        back = self.get(pages[-1]["previous"])
+        self.assertEqual(back["results"], pages[1]["results"])
+
+    def test_cursor_without_balance(self):
+        first = self.get()
+        plain = self.get(first["next"], running_balance="0")
+        self.assertNotIn("running_balance", plain["results"][0])
+        page = self.get(plain["next"], running_balance="1")
+        expected = self.expected()
+        self.assertEqual({row["id"]: row["running_balance"] for row in page["results"]},
+                         {row["id"]: expected[row["id"]] for row in page["results"]})
+
+
+class DashboardTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = make_user("dashboard")
+        food = Category.objects.create(user=cls.user, name="Food")
+        rent = Category.objects.create(user=cls.user, name="Rent")
+        salary = Category.objects.create(user=cls.user, name="Salary")
+        rows = [
+            ("income", "2000.00", date(2026, 1, 1), salary),
+            ("expense", "800.00", date(2026, 1, 2), rent),
+            ("expense", "45.50", date(2026, 1, 10), food),
+            ("expense", "14.50", date(2026, 1, 20), food),
+            ("expense", "99.00", date(2025, 12, 30), food),
+        ]
+        ledger.record([
+            Transaction.objects.create(user=cls.user, type=tx_type, amount=amount, date=day, category=category)
+            for tx_type, amount, day, category in rows
+        ])
+        BudgetGoal.objects.create(user=cls.user, month=date(2026, 1, 1), target_amount="1000.00", gold_amount="500.00")
+
+    def setUp(self):
+        summary_cache.clear()
+
+    def get(self, queries, **headers):
+        request = APIRequestFactory().get("/api/dashboard/", {"month": "2026-01", "top": "1", "recent": "3"}, **headers)
+        force_authenticate(request, user=self.user)
+        with self.assertNumQueries(queries):
+            response = DashboardView.as_view()(request)
+        response.render()
+        return response
+
+    def test_document(self):
+        # data versions, month ledger rows, goal, latest transactions
+        data = self.get(4).data
+
+        self.assertEqual(data["summary"]["income"], Decimal("2000.00"))
+        self.assertEqual(data["summary"]["expense"], Decimal("860.00"))
+        self.assertEqual(data["summary"]["count"], 4)
+        self.assertEqual([row["name"] for row in data["top_categories"]["results"]], ["Rent"])
+        self.assertEqual(data["top_categories"]["type"], "expense")
+        self.assertEqual(data["top_categories"]["total"], Decimal("860.00"))
+        self.assertEqual(data["goal"]["spent"], Decimal("860.00"))
+        self.assertFalse(data["goal"]["over_budget"])
+        self.assertEqual([row["amount"] for row in data["recent_transactions"]], ["14.50", "45.50", "800.00"])
+
+    def test_cached_aggregates(self):
+        self.get(4)
+        self.get(3)
+
+    def test_single_etag(self):
+        etag = self.get(4)["ETag"]
+        response = self.get(1, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+
+class BatchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = make_user("batch")
+        cls.category = Category.objects.create(user=cls.user, name="Food")
+
+    def post(self, payload):
+        request = APIRequestFactory().post("/api/batch/", payload, format="json")
+        force_authenticate(request, user=self.user)
+        response = BatchView.as_view()(request)
+        self.assertEqual(response.status_code, 200, response.data)
+        return response.data
+
+    def tx(self, amount):
+        return {"type": "expense", "amount": amount, "date": "2026-01-05", "category": str(self.category.id)}
+
+    def test_sequential(self):
+        data = self.post({"requests": [
+            {"id": "create", "method": "post", "path": "/api/transactions/create/", "body": self.tx("12.50")},
+            {"id": "summary", "method": "GET", "path": "/api/transactions/summary/?type=expense"},
+            {"id": "missing", "method": "GET", "path": "/api/nope/"},
+            {"id": "nested", "method": "POST", "path": "/api/batch/", "body": {"requests": []}},
+            {"id": "async", "method": "GET", "path": "/api/async/goals/"},
+        ]})
+        statuses = {item["id"]: item["status"] for item in data["responses"]}
+        self.assertEqual(statuses, {"create": 201, "summary": 200, "missing": 404, "nested": 400, "async": 400})
+        self.assertEqual(data["responses"][1]["body"]["expense"], Decimal("12.50"))
+        self.assertIn("ETag", data["responses"][1]["headers"])
+
+    def test_atomic_rolls_back(self):
+        data = self.post({"atomic": True, "requests": [
+            {"method": "POST", "path": "/api/transactions/create/", "body": self.tx("12.50")},
+            {"method": "POST", "path": "/api/transactions/create/", "body": self.tx("not a number")},
+            {"method": "POST", "path": "/api/transactions/create/", "body": self.tx("1.00")},
+        ]})
+        self.assertTrue(data["rolled_back"])
+        self.assertEqual([item["status"] for item in data["responses"]], [201, 400, 424])
+        self.assertFalse(Transaction.objects.filter(user=self.user).exists())
+
+
+class LedgerTests(TestCase):
+    """Every write path must leave DailyLedger equal to a rebuild from Transaction."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = make_user("ledger")
+        cls.food = Category.objects.create(user=cls.user, name="Food")
+        cls.rent = Category.objects.create(user=cls.user, name="Rent")
+
+    def call(self, view, method, path, data=None, **kwargs):
+        request = getattr(APIRequestFactory(), method)(path, data, format="json")
+        force_authenticate(request, user=self.user)
+        response = view.as_view()(request, **kwargs)
+        self.assertLess(response.status_code, 300, getattr(response, "data", None))
+        return response.data
+
+    def tx(self, amount, day, category=None):
+        return {"type": "expense", "amount": amount, "date": day.isoformat(), "category": str((category or self.food).id)}
+
+    def ledger_rows(self):
+        return sorted(
+            DailyLedger.objects.filter(user=self.user).values_list("date", "category_id", "type", "total", "count")
+        )
+
+    def assertLedgerConsistent(self):
+        rows = self.ledger_rows()
+        ledger.rebuild([self.user.id])
+        self.assertEqual(rows, self.ledger_rows())
+
+    def test_single_writes(self):
+        day = date(2026, 1, 5)
+        created = self.call(TransactionCreateView, "post", "/api/transactions/create/", self.tx("10.00", day))
+        self.call(TransactionCreateView, "post", "/api/transactions/create/", self.tx("5.00", day))
+        self.call(
+            TransactionUpdateView, "patch", f"/api/transactions/{created['id']}/update/",
+            {"amount": "7.25", "category": str(self.rent.id)}, id=created["id"],
+        )
+        self.assertLedgerConsistent()
+
+        self.call(TransactionDeleteView, "delete", f"/api/transactions/{created['id']}/delete/", id=created["id"])
+        self.assertEqual(self.ledger_rows(), [(day, self.food.id, "expense", Decimal("5.00"), 1)])
+        self.assertLedgerConsistent()
+
+    def test_bulk_writes(self):
+        days = [date(2025, 1, 1) + timedelta(days=i) for i in range(300)]
+        payload = {"transactions": [self.tx("1.50", day) for day in days]}
+
+        for _ in range(2):
+            # first run inserts the ledger rows, second one updates them
+            with CaptureQueriesContext(connection) as queries:
+                self.call(TransactionBulkCreateView, "post", "/api/transactions/bulk-create/", payload)
+            ledger_queries = [q for q in queries if "dailyledger" in q["sql"].lower()]
+            self.assertLess(len(ledger_queries), 10)
+            self.assertLedgerConsistent()
+
+        self.call(TransactionBulkUpdateView, "post", "/api/transactions/bulk-update/", {
+            "filter": {"from": "2025-03-01"}, "set": {"category": str(self.rent.id)},
+        })
+        self.assertLedgerConsistent()
+
+        self.call(TransactionBulkDeleteView, "post", "/api/transactions/bulk-delete/", {"filter": {"to": "2025-06-30"}})
+        self.assertLedgerConsistent()
+        self.assertEqual(sum(count for *_, count in self.ledger_rows()), 2 * len([d for d in days if d > date(2025, 6, 30)]))
+
+    def test_admin_writes(self):
+        model_admin = TransactionAdmin(Transaction, admin.site)
+        request = RequestFactory().post("/admin/api/transaction/")
+        tx = Transaction(user=self.user, type="expense", amount=Decimal("3.00"), date=date(2026, 2, 1), category=self.food)
+
+        model_admin.save_model(request, tx, None, False)
+        tx.amount = Decimal("4.00")
+        tx.category = self.rent
+        model_admin.save_model(request, tx, None, True)
+        self.assertEqual(self.ledger_rows(), [(date(2026, 2, 1), self.rent.id, "expense", Decimal("4.00"), 1)])
+        self.assertLedgerConsistent()
+
+        model_admin.delete_queryset(request, Transaction.objects.filter(pk=tx.pk))
+        self.assertEqual(self.ledger_rows(), [])
+
+
+class OwnedObjectAdminTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = make_user("admin-owner")
+        cls.other = make_user("admin-other")
+
+    def setUp(self):
+        self.request = RequestFactory().post("/admin/")
+
+    def tombstones(self, user):
+        return sorted(Tombstone.objects.filter(user=user).values_list("kind", "object_id"))
+
+    def test_category_delete_and_reassign(self):
+        model_admin = CategoryAdmin(Category, admin.site)
+        food = Category.objects.create(user=self.user, name="Food")
+        rent = Category.objects.create(user=self.user, name="Rent")
+        expected = sorted([(sync.CATEGORY, food.id), (sync.CATEGORY, rent.id)])
+
+        model_admin.delete_model(self.request, food)
+        rent.user = self.other
+        model_admin.save_model(self.request, rent, None, True)
+
+        self.assertEqual(self.tombstones(self.user), expected)
+        self.assertEqual(versioning.current(self.user)[versioning.LEDGER], 2)
+        self.assertEqual(versioning.current(self.other)[versioning.LEDGER], 1)
+
+    def test_goal_delete_queryset(self):
+        model_admin = BudgetGoalAdmin(BudgetGoal, admin.site)
+        goals = [
+            BudgetGoal.objects.create(user=user, month=date(2026, 1, 1), target_amount="100.00", gold_amount="0.00")
+            for user in (self.user, self.other)
+        ]
+
+        model_admin.delete_queryset(self.request, BudgetGoal.objects.all())
+
+        self.assertFalse(BudgetGoal.objects.exists())
+        for user, goal in zip((self.user, self.other), goals):
+            self.assertEqual(self.tombstones(user), [(sync.GOAL, goal.id)])
+            self.assertEqual(versioning.current(user), {versioning.LEDGER: 0, versioning.GOALS: 1})
+
+
+class ByCategoryTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = make_user("shares")
+        food = Category.objects.create(user=cls.user, name="Food")
+        transport = Category.objects.create(user=cls.user, name="Transport")
+        salary = Category.objects.create(user=cls.user, name="Salary")
+        rows = [
+            ("income", "1000.00", salary),
+            ("expense", "12.50", food),
+            ("expense", "37.50", transport),
+        ]
+        ledger.record([
+            Transaction.objects.create(user=cls.user, type=tx_type, amount=amount, date=date(2026, 1, 5), category=category)
+            for tx_type, amount, category in rows
+        ])
+
+    def setUp(self):
+        summary_cache.clear()
+
+    def get(self, **params):
+        request = APIRequestFactory().get("/api/transactions/by-category/", params)
+        force_authenticate(request, user=self.user)
+        response = TransactionByCategoryView.as_view()(request)
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_defaults_to_expense(self):
+        for params in ({}, {"type": "all"}):
+            data = self.get(**params)
+            self.assertEqual(data["type"], "expense")
+            self.assertEqual(data["total"], Decimal("50.00"))
+            self.assertEqual(
+                [(row["name"], row["share"]) for row in data["results"]],
+                [("Transport", Decimal("0.7500")), ("Food", Decimal("0.2500"))],
+            )
+
+    def test_income(self):
+        data = self.get(type="income")
+        self.assertEqual(data["total"], Decimal("1000.00"))
+        self.assertEqual([(row["name"], row["share"]) for row in data["results"]], [("Salary", Decimal("1.0000"))])
+
+
+class SearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = make_user("search")
+        cls.food = Category.objects.create(user=cls.user, name="Food")
+        cls.transport = Category.objects.create(user=cls.user, name="Transport")
+        cls.coffee, cls.burmese, cls.bus = [
+            Transaction.objects.create(user=cls.user, type="expense", amount="2.00", date=date(2026, 1, 5), category=category, note=note)
+            for note, category in [("Morning coffee", cls.food), ("ကော်ဖီဆိုင်", cls.food), ("Bus fare", cls.transport)]
+        ]
+
+    def setUp(self):
+        if not search.fts_available():
+            self.skipTest("No FTS5 trigram index on this database")
+
+    def ids(self, term):
+        qs = search.search_transactions(Transaction.objects.filter(user=self.user), term)
+        return set(qs.values_list("id", flat=True))
+
+    def test_substrings(self):
+        self.assertEqual(self.ids("offee"), {self.coffee.id})
+        self.assertEqual(self.ids("COFFEE morn"), {self.coffee.id})
+        self.assertEqual(self.ids("ဖီဆိုင်"), {self.burmese.id})
+
+    def test_short_words_fall_back_to_icontains(self):
+        self.assertEqual(search.fts_query("fa"), "")
+        self.assertEqual(self.ids("fa"), {self.bus.id})
+
+    def test_index_follows_writes(self):
+        self.assertEqual(self.ids("transport"), {self.bus.id})
+
+        self.transport.name = "Travel"
+        self.transport.save()
+        self.assertEqual(self.ids("ravel"), {self.bus.id})
+
+        self.coffee.note = "Lunch"
+        self.coffee.category = self.transport
+        self.coffee.save()
+        self.assertEqual(self.ids("offee"), set())
+        self.assertEqual(self.ids("ravel"), {self.bus.id, self.coffee.id})
+
+        self.bus.delete()
+        self.assertEqual(self.ids("ravel"), {self.coffee.id})
+        self.assertEqual(search.rebuild(), 2)
+        self.assertEqual(self.ids("ravel"), {self.coffee.id})
+
+
+class BulkTargetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = make_user("bulk")
+        cls.food = Category.objects.create(user=cls.user, name="Food")
+        cls.rent = Category.objects.create(user=cls.user, name="Rent")
+        rows = [
+            ("expense", "5.00", date(2026, 1, 1)),
+            ("expense", "50.00", date(2026, 1, 2)),
+            ("income", "500.00", date(2026, 1, 3)),
+        ]
+        cls.txs = [
+            Transaction.objects.create(user=cls.user, type=tx_type, amount=amount, date=day, category=cls.food)
+            for tx_type, amount, day in rows
+        ]
+        ledger.record(cls.txs)
+
+    def post(self, view, payload):
+        request = APIRequestFactory().post("/api/transactions/bulk/", payload, format="json")
+        force_authenticate(request, user=self.user)
+        return view.as_view()(request)
+
+    def test_update_by_filter_drops_nulls(self):
+        response = self.post(TransactionBulkUpdateView, {
+            "filter": {"type": "expense", "min": "10", "max": None}, "set": {"category": str(self.rent.id)},
+        })
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertEqual(response.data["updated_count"], 1)
+        self.assertEqual(Transaction.objects.get(category=self.rent).amount, Decimal("50.00"))
+
+    def test_invalid_filters_are_rejected(self):
+        for filters in ({"min": None}, {"from": "yesterday"}, {"amount": "5"}, {"category": "food"}, {"search": ""}):
+            response = self.post(TransactionBulkDeleteView, {"filter": filters})
+            self.assertEqual(response.status_code, 400, filters)
+            self.assertIn("filter", response.data)
+        self.assertEqual(Transaction.objects.filter(user=self.user).count(), 3)
+
+    def test_delete_by_ids_and_filter(self):
+        response = self.post(TransactionBulkDeleteView, {"ids": [str(self.txs[0].id)]})
+        self.assertEqual(response.data["deleted_count"], 1)
+
+        response = self.post(TransactionBulkDeleteView, {"filter": {"from": "2026-01-02", "type": "income"}})
+        self.assertEqual(response.data["deleted_count"], 1)
+
+        response = self.post(TransactionBulkDeleteView, {"filter": {"type": "income"}})
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(list(Transaction.objects.filter(user=self.user).values_list("amount", flat=True)), [Decimal("50.00")])
+
+
+class CategoryMergeTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = make_user("merger")
+        cls.other = make_user("bystander")
+        cls.coffee = Category.objects.create(user=cls.user, name="Coffee")
+        cls.snacks = Category.objects.create(user=cls.user, name="Snacks")
+        cls.food = Category.objects.create(user=cls.user, name="Food")
+        rows = [
+            ("3.00", date(2026, 1, 5), cls.coffee),
+            ("4.50", date(2026, 1, 5), cls.snacks),
+            ("10.00", date(2026, 1, 5), cls.food),
+            ("2.00", date(2026, 1, 6), cls.coffee),
+        ]
+        ledger.record([
+            Transaction.objects.create(user=cls.user, type="expense", amount=amount, date=day, category=category)
+            for amount, day, category in rows
+        ])
+
+    def merge(self, sources, target):
+        request = APIRequestFactory().post(
+            "/api/categories/merge/", {"sources": [str(c.id) for c in sources], "target": str(target.id)}, format="json"
+        )
+        force_authenticate(request, user=self.user)
+        return CategoryMergeView.as_view()(request)
+
+    def ledger_rows(self):
+        return sorted(
+            DailyLedger.objects.filter(user=self.user).values_list("date", "category_id", "type", "total", "count")
+        )
+
+    def test_merge(self):
+        response = self.merge([self.coffee, self.snacks], self.food)
+
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertEqual(response.data["moved_count"], 3)
+        self.assertFalse(Category.objects.filter(id__in=[self.coffee.id, self.snacks.id]).exists())
+        self.assertEqual(set(Transaction.objects.filter(user=self.user).values_list("category_id", flat=True)), {self.food.id})
+        rows = self.ledger_rows()
+        self.assertEqual(rows, [
+            (date(2026, 1, 5), self.food.id, "expense", Decimal("17.50"), 3),
+            (date(2026, 1, 6), self.food.id, "expense", Decimal("2.00"), 1),
+        ])
+        ledger.rebuild([self.user.id])
+        self.assertEqual(self.ledger_rows(), rows)
+
+    def test_source_used_by_another_account(self):
+        foreign = Transaction.objects.create(
+            user=self.other, type="expense", amount="1.00", date=date(2026, 1, 5), category=self.coffee
+        )
+        before = self.ledger_rows()
+
+        response = self.merge([self.coffee], self.food)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertTrue(Category.objects.filter(id=self.coffee.id).exists())
+        foreign.refresh_from_db()
+        self.assertEqual(foreign.category_id, self.coffee.id)
+        self.assertEqual(self.ledger_rows(), before)
+
+
+class StreamingResponseTests(TestCase):
+    def lines(self, produced):
+        for n in range(5):
+            produced.append(n)
+            yield f"{n}\n"
+
+    def test_wsgi_keeps_the_sync_iterator(self):
+        response = streaming_response(RequestFactory().get("/"), self.lines([]), "text/plain")
+        self.assertFalse(response.is_async)
+        self.assertEqual(b"".join(response.streaming_content), b"0\n1\n2\n3\n4\n")
+
+    async def test_asgi_streams_incrementally(self):
+        produced = []
+        response = streaming_response(AsyncRequestFactory().get("/"), self.lines(produced), "text/plain", batch_size=2)
+        self.assertTrue(response.is_async)
+
+        chunks = []
+        async for chunk in response.streaming_content:
+            chunks.append(chunk)
+            if len(chunks) == 1:
+                # only the first batch has been pulled from the iterator
+                self.assertEqual(produced, [0, 1])
+        self.assertEqual(chunks, [b"0\n1\n", b"2\n3\n", b"4\n"])
+
+
+class ImporterTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = make_user("importer")
+        cls.food = Category.objects.create(user=cls.user, name="Food")
+
+    def run_import(self, text, chunk_size=1000):
+        importer = TransactionCSVImporter(self.user, chunk_size=chunk_size)
+        return importer, list(importer.run(io.StringIO(text)))
+
+    def test_bad_rows_are_reported_and_skipped(self):
+        _, reports = self.run_import(
+            "date,amount,category,type\n"
+            "2026-01-05,-12.50,food,\n"
+            "2026-13-01,5,Food,\n"
+            "2026-01-06,abc,Food,\n"
+            "2026-01-07,1e30,Food,\n"
+            "2026-01-08,NaN,Food,\n"
+            "2026-01-09,5,Food,refund\n"
+            "2026-01-10,5,,\n"
+        )
+        report = reports[-1]
+        self.assertEqual((report["processed"], report["created"], report["failed"]), (7, 1, 6))
+        self.assertEqual([error["line"] for error in report["errors"]], [3, 4, 5, 6, 7, 8])
+        self.assertEqual(report["errors"][2]["error"], "Amount has too many digits.")
+
+        tx = Transaction.objects.get(user=self.user)
+        self.assertEqual((tx.type, tx.amount, tx.category_id), ("expense", Decimal("12.50"), self.food.id))
+        self.assertEqual(DailyLedger.objects.get(user=self.user).total, Decimal("12.50"))
+
+    def test_unknown_categories_are_created_once(self):
+        importer, _ = self.run_import(
+            "date,amount,category\n2026-01-05,100,Salary\n2026-01-06,50,salary\n2026-01-07,-3,Food\n"
+        )
+        self.assertEqual(importer.categories_created, 1)
+        self.assertEqual(
+            sorted(Category.objects.filter(user=self.user).values_list("name", flat=True)), ["Food", "Salary"]
+        )
+        self.assertEqual(Transaction.objects.filter(user=self.user, category__name="Salary").count(), 2)
+
+    def test_chunks_are_flushed_as_they_fill(self):
+        rows = "".join(f"2026-01-{day:02d},-1,Food\n" for day in range(1, 6))
+        _, reports = self.run_import("date,amount,category\n" + rows, chunk_size=2)
+        self.assertEqual(
+            [(report["done"], report["created"]) for report in reports],
+            [(False, 2), (False, 4), (True, 5)],
+        )
+
+    def test_missing_column_and_malformed_csv_raise_value_error(self):
+        with self.assertRaisesMessage(ValueError, "Missing column(s): category"):
+            self.run_import("date,amount\n2026-01-05,1\n")
+        with self.assertRaisesMessage(ValueError, "Malformed CSV after line 1"):
+            self.run_import("date,amount,category\n2026-01-05,1," + "x" * (csv.field_size_limit() + 1) + "\n")
+
+    def post(self, text, **params):
+        upload = SimpleUploadedFile("statement.csv", text.encode(), content_type="text/csv")
+        query = "?" + "&".join(f"{key}={value}" for key, value in params.items()) if params else ""
+        request = APIRequestFactory().post(f"/api/transactions/import/{query}", {"file": upload}, format="multipart")
+        force_authenticate(request, user=self.user)
+        return TransactionImportView.as_view()(request)
+
+    def test_view_reports_a_malformed_file_as_400(self):
+        response = self.post("date,amount\n2026-01-05,1\n")
+        self.assertEqual(response.status_code, 400)
+
+    def test_view_streams_progress(self):
+        response = self.post("date,amount,category\n2026-01-05,-1,Food\n2026-01-06,x,Food\n", stream=1)
+        self.assertTrue(response.streaming)
+        lines = [json.loads(line) for line in b"".join(response.streaming_content).splitlines()]
+        self.assertEqual(len(lines), 1)
+        self.assertEqual((lines[0]["done"], lines[0]["created"], lines[0]["failed"]), (True, 1, 1))
+
+    def test_view_streams_fatal_errors_as_the_last_line(self):
+        response = self.post("date,amount\n2026-01-05,1\n", stream=1)
+        lines = [json.loads(line) for line in b"".join(response.streaming_content).splitlines()]
+        self.assertEqual(lines, [{"done": True, "error": "Missing column(s): category"}])
+
+
+class SyncTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = make_user("syncer")
+        cls.other = make_user("sync-other")
+        cls.food = Category.objects.create(user=cls.user, name="Food")
+        cls.rent = Category.objects.create(user=cls.user, name="Rent")
+        cls.transactions = [
+            Transaction.objects.create(user=cls.user, type="expense", amount="1.00", date=date(2026, 1, day), category=cls.food)
+            for day in range(1, 6)
+        ]
+        cls.goal = BudgetGoal.objects.create(user=cls.user, month=date(2026, 1, 1), target_amount="100.00", gold_amount="0.00")
+        Category.objects.create(user=cls.other, name="Not mine")
+
+    def drain(self, token=None, page_size=2):
+        """Follow has_more to the end; returns (pages, {stream: (changed ids, deleted ids)}, final token)."""
+        pages = 0
+        seen = {name: ([], []) for name in sync.STREAMS}
+        while True:
+            page = sync.changes(self.user, token, page_size)
+            pages += 1
+            for name, (changed, deleted) in seen.items():
+                changed.extend(row["id"] for row in page[name]["changed"])
+                deleted.extend(page[name]["deleted"])
+            token = page["sync_token"]
+            if not page["has_more"]:
+                return pages, seen, token
+
+    def age(self):
+        # updated_at is auto_now on save() only, so update() can backdate it
+        # everything written so far to before the next restart point
+        for model in (Transaction, Category, BudgetGoal):
+            model.objects.filter(user=self.user).update(updated_at=timezone.now() - sync.OVERLAP * 2)
+
+    def test_full_sync_pages_through_every_row_once(self):
+        sync.record_deletions(self.user, sync.TRANSACTION, [self.transactions[0].id])
+
+        pages, seen, _ = self.drain()
+
+        self.assertEqual(pages, 3)
+        self.assertEqual(sorted(seen["transactions"][0]), sorted(str(tx.id) for tx in self.transactions))
+        self.assertEqual(sorted(seen["categories"][0]), sorted([str(self.food.id), str(self.rent.id)]))
+        self.assertEqual(seen["goals"][0], [str(self.goal.id)])
+        # nothing to delete on a client that starts from scratch
+        self.assertEqual(seen["transactions"][1], [])
+
+    def test_paging_is_bounded_by_the_first_page(self):
+        first = sync.changes(self.user, None, 2)
+        self.assertTrue(first["has_more"])
+        late = Transaction.objects.create(user=self.user, type="income", amount="9.00", date=date(2026, 2, 1), category=self.rent)
+
+        _, seen, token = self.drain(first["sync_token"])
+        self.assertNotIn(str(late.id), seen["transactions"][0])
+
+        _, seen, _ = self.drain(token)
+        self.assertIn(str(late.id), seen["transactions"][0])
+
+    def test_incremental_sync_restarts_at_the_overlap(self):
+        _, _, token = self.drain()
+        state = sync.decode_token(token)
+        self.assertNotIn("u", state)
+        restart = set(state["p"].values())
+        self.assertEqual(len(restart), 1)
+        (timestamp, pk), = restart
+        self.assertIsNone(pk)
+        self.assertLess(timestamp, timezone.now() - sync.OVERLAP + timedelta(seconds=1))
+
+        self.age()
+        edited = self.transactions[1]
+        edited.note = "edited"
+        edited.save()
+
+        _, seen, _ = self.drain(token)
+        self.assertEqual(seen["transactions"][0], [str(edited.id)])
+        self.assertEqual(seen["categories"], ([], []))
+        self.assertEqual(seen["goals"], ([], []))
+
+    def test_deletions_after_a_delete(self):
+        _, _, token = self.drain()
+        self.age()
+        gone = self.transactions[2]
+
+        request = APIRequestFactory().delete(f"/api/transactions/{gone.id}/delete/")
+        force_authenticate(request, user=self.user)
+        self.assertEqual(TransactionDeleteView.as_view()(request, id=gone.id).status_code, 204)
+
+        pages, seen, _ = self.drain(token, page_size=1)
+        self.assertEqual(pages, 1)
+        self.assertEqual(seen["transactions"], ([], [str(gone.id)]))
+
+    def test_tombstones_page_with_the_other_streams(self):
+        _, _, token = self.drain()
+        self.age()
+        removed = [tx.id for tx in self.transactions[:3]]
+        sync.record_deletions(self.user, sync.TRANSACTION, removed)
+        sync.record_deletions(self.other, sync.TRANSACTION, [self.transactions[3].id])
+
+        pages, seen, _ = self.drain(token, page_size=2)
+        self.assertEqual(pages, 2)
+        self.assertEqual(sorted(seen["transactions"][1]), sorted(str(pk) for pk in removed))
+
+    def test_rejects_a_tampered_token(self):
+        for token in ["not-base64!", sync.encode_token({"p": {"transactions": ["yesterday", None]}})]:
+            request = APIRequestFactory().get("/api/sync/", {"token": token})
+            force_authenticate(request, user=self.user)
+            response = SyncView.as_view()(request)
+            self.assertEqual(response.status_code, 400)
+            self.assertIn("token", response.data)
+
+
+class TimeSeriesTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = make_user("buckets")
+        food = Category.objects.create(user=cls.user, name="Food")
+        salary = Category.objects.create(user=cls.user, name="Salary")
+        rows = [
+            ("expense", "10.00", date(2025, 12, 31), food, "coffee"),
+            ("income", "100.00", date(2026, 1, 1), salary, ""),
+            ("expense", "5.00", date(2026, 1, 1), food, "coffee beans"),
+            ("expense", "20.00", date(2026, 1, 5), food, ""),
+            ("expense", "7.00", date(2026, 2, 3), food, ""),
+        ]
+        ledger.record([
+            Transaction.objects.create(user=cls.user, type=tx_type, amount=amount, date=day, category=category, note=note)
+            for tx_type, amount, day, category, note in rows
+        ])
+
+    def setUp(self):
+        summary_cache.clear()
+
+    def get(self, **params):
+        request = APIRequestFactory().get("/api/transactions/timeseries/", params)
+        force_authenticate(request, user=self.user)
+        return TransactionTimeSeriesView.as_view()(request)
+
+    def buckets(self, interval, **params):
+        response = self.get(interval=interval, **params)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["interval"], interval)
+        return [(row["bucket"], row["income"], row["expense"], row["net"], row["count"]) for row in response.data["results"]]
+
+    def test_buckets_from_ledger_and_raw_rows(self):
+        expected = {
+            "day": [
+                (date(2025, 12, 31), 0, Decimal("10.00"), Decimal("-10.00"), 1),
+                (date(2026, 1, 1), Decimal("100.00"), Decimal("5.00"), Decimal("95.00"), 2),
+                (date(2026, 1, 5), 0, Decimal("20.00"), Decimal("-20.00"), 1),
+                (date(2026, 2, 3), 0, Decimal("7.00"), Decimal("-7.00"), 1),
+            ],
+            "week": [
+                (date(2025, 12, 29), Decimal("100.00"), Decimal("15.00"), Decimal("85.00"), 3),
+                (date(2026, 1, 5), 0, Decimal("20.00"), Decimal("-20.00"), 1),
+                (date(2026, 2, 2), 0, Decimal("7.00"), Decimal("-7.00"), 1),
+            ],
+            "month": [
+                (date(2025, 12, 1), 0, Decimal("10.00"), Decimal("-10.00"), 1),
+                (date(2026, 1, 1), Decimal("100.00"), Decimal("25.00"), Decimal("75.00"), 3),
+                (date(2026, 2, 1), 0, Decimal("7.00"), Decimal("-7.00"), 1),
+            ],
+            "year": [
+                (date(2025, 1, 1), 0, Decimal("10.00"), Decimal("-10.00"), 1),
+                (date(2026, 1, 1), Decimal("100.00"), Decimal("32.00"), Decimal("68.00"), 4),
+            ],
+        }
+        for interval, rows in expected.items():
+            with self.subTest(interval=interval):
+                self.assertEqual(self.buckets(interval), rows)
+                # min forces the raw Transaction path
+                self.assertEqual(self.buckets(interval, min="0"), rows)
+
+    def test_raw_path_applies_search_and_min(self):
+        self.assertEqual(self.buckets("month", search="coffee"), [
+            (date(2025, 12, 1), 0, Decimal("10.00"), Decimal("-10.00"), 1),
+            (date(2026, 1, 1), 0, Decimal("5.00"), Decimal("-5.00"), 1),
+        ])
+        self.assertEqual(self.buckets("year", min="10"), [
+            (date(2025, 1, 1), 0, Decimal("10.00"), Decimal("-10.00"), 1),
+            (date(2026, 1, 1), Decimal("100.00"), Decimal("20.00"), Decimal("80.00"), 2),
+        ])
+
+    def test_defaults_to_month(self):
+        self.assertEqual(self.get().data["interval"], "month")
+
+    def test_rejects_unknown_interval(self):
+        response = self.get(interval="hour")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("interval", response.data)
+
+
+class GoalProgressTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = make_user("goals")
+        food = Category.objects.create(user=cls.user, name="Food")
+        salary = Category.objects.create(user=cls.user, name="Salary")
+        rows = [
+            ("income", "200.00", date(2026, 1, 1), salary),
+            ("expense", "80.00", date(2026, 1, 10), food),
+            ("expense", "40.00", date(2026, 1, 31), food),
+            ("expense", "15.00", date(2026, 2, 14), food),
+            # outside every goal month
+            ("expense", "999.00", date(2025, 12, 31), food),
+        ]
+        ledger.record([
+            Transaction.objects.create(user=cls.user, type=tx_type, amount=amount, date=day, category=category)
+            for tx_type, amount, day, category in rows
+        ])
+        for month, target, gold in [
+            (date(2026, 1, 1), "100.00", "50.00"),
+            (date(2026, 2, 1), "0.00", "0.00"),
+            (date(2026, 3, 1), "300.00", "10.00"),
+        ]:
+            BudgetGoal.objects.create(user=cls.user, month=month, target_amount=target, gold_amount=gold)
+
+    def get(self, **params):
+        request = APIRequestFactory().get("/api/goals/progress/", params)
+        force_authenticate(request, user=self.user)
+        # data version for the ETag, the goals, one grouped ledger query
+        with self.assertNumQueries(3):
+            response = BudgetGoalProgressView.as_view()(request)
+        self.assertEqual(response.status_code, 200)
+        return {row["month"]: row for row in response.data}
+
+    def test_progress(self):
+        rows = self.get()
+        self.assertEqual(list(rows), ["2026-03-01", "2026-02-01", "2026-01-01"])
+
+        january = rows["2026-01-01"]
+        self.assertEqual(
+            (january["income"], january["spent"], january["remaining"], january["percent_used"], january["count"]),
+            (Decimal("200.00"), Decimal("120.00"), Decimal("-20.00"), Decimal("120.00"), 3),
+        )
+        self.assertTrue(january["over_budget"])
+        self.assertTrue(january["goal_reached"])
+
+    def test_zero_target_has_no_percentage(self):
+        february = self.get()["2026-02-01"]
+        self.assertIsNone(february["percent_used"])
+        self.assertEqual(february["spent"], Decimal("15.00"))
+        self.assertTrue(february["over_budget"])
+        self.assertFalse(february["goal_reached"])
+
+    def test_month_without_transactions(self):
+        march = self.get()["2026-03-01"]
+        self.assertEqual(
+            (march["income"], march["spent"], march["remaining"], march["percent_used"], march["count"]),
+            (Decimal("0"), Decimal("0"), Decimal("300.00"), Decimal("0.00"), 0),
+        )
+        self.assertFalse(march["over_budget"])
+        self.assertFalse(march["goal_reached"])
+
+    def test_query_count_does_not_grow_with_goals(self):
+        for month in range(4, 13):
+            BudgetGoal.objects.create(user=self.user, month=date(2026, month, 1), target_amount="1.00", gold_amount="0.00")
+        self.assertEqual(len(self.get()), 12)
+        self.assertEqual(list(self.get(**{"from": "2026-02-01", "to": "2026-03-01"})), ["2026-03-01", "2026-02-01"])
+
+
+class ExportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = make_user("exporter")
+        cls.food = Category.objects.create(user=cls.user, name="Food")
+        cls.salary = Category.objects.create(user=cls.user, name="Salary")
+        cls.lunch = Transaction.objects.create(
+            user=cls.user, type="expense", amount="12.50", date=date(2026, 1, 5), category=cls.food, note="lunch, with tea"
+        )
+        cls.pay = Transaction.objects.create(
+            user=cls.user, type="income", amount="1000.00", date=date(2026, 1, 31), category=cls.salary
+        )
+        cls.snack = Transaction.objects.create(
+            user=cls.user, type="expense", amount="3.00", date=date(2026, 2, 2), category=cls.food, note="snack"
+        )
+        other = make_user("export-other")
+        Transaction.objects.create(
+            user=other, type="expense", amount="1.00", date=date(2026, 1, 5), category=Category.objects.create(user=other, name="Food")
+        )
+
+    def get(self, **params):
+        request = APIRequestFactory().get("/api/transactions/export/", params)
+        force_authenticate(request, user=self.user)
+        response = TransactionExportView.as_view()(request)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        return response
+
+    def test_rows_are_read_while_streaming(self):
+        request = APIRequestFactory().get("/api/transactions/export/")
+        force_authenticate(request, user=self.user)
+        with self.assertNumQueries(0):
+            response = TransactionExportView.as_view()(request)
+        content = iter(response.streaming_content)
+        with self.assertNumQueries(0):
+            next(content)  # header
+        with self.assertNumQueries(1):
+            self.assertEqual(len(list(content)), 3)
+
+    def csv_rows(self, **params):
+        response = self.get(**params)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        self.assertEqual(response["Content-Disposition"], 'attachment; filename="transactions.csv"')
+        return list(csv.reader(io.StringIO(b"".join(response.streaming_content).decode())))
+
+    def test_csv(self):
+        header, *rows = self.csv_rows()
+        self.assertEqual(header, ["id", "type", "amount", "date", "category", "category_name", "note", "created_at"])
+        self.assertEqual([row[0] for row in rows], [str(self.snack.id), str(self.pay.id), str(self.lunch.id)])
+        self.assertEqual(
+            rows[2][1:7], ["expense", "12.50", "2026-01-05", str(self.food.id), "Food", "lunch, with tea"]
+        )
+
+    def test_ndjson(self):
+        response = self.get(format="ndjson")
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        lines = [json.loads(line) for line in b"".join(response.streaming_content).splitlines()]
+        self.assertEqual([line["id"] for line in lines], [str(self.snack.id), str(self.pay.id), str(self.lunch.id)])
+        self.assertEqual(
+            {key: lines[1][key] for key in ("type", "amount", "date", "category", "category_name", "note")},
+            {"type": "income", "amount": "1000.00", "date": "2026-01-31", "category": str(self.salary.id),
+             "category_name": "Salary", "note": ""},
+        )
+
+    def test_filters(self):
+        def ids(**params):
+            return [row[0] for row in self.csv_rows(**params)[1:]]
+
+        self.assertEqual(ids(type="expense"), [str(self.snack.id), str(self.lunch.id)])
+        self.assertEqual(ids(category=str(self.salary.id)), [str(self.pay.id)])
+        self.assertEqual(ids(**{"from": "2026-01-06", "to": "2026-01-31"}), [str(self.pay.id)])
+        self.assertEqual(ids(min="10", type="expense"), [str(self.lunch.id)])
+        self.assertEqual(ids(search="snack"), [str(self.snack.id)])
+
+    def test_rejects_unknown_format(self):
+        # ?format= is DRF's renderer override, so content negotiation answers first
+        request = APIRequestFactory().get("/api/transactions/export/", {"format": "xlsx"})
+        force_authenticate(request, user=self.user)
+        self.assertEqual(TransactionExportView.as_view()(request).status_code, 404)
+
+
+class BulkCreateTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = make_user("bulk-creator")
+        cls.food = Category.objects.create(user=cls.user, name="Food")
+        cls.foreign = Category.objects.create(user=make_user("bulk-other"), name="Theirs")
+
+    def post(self, data, **initkwargs):
+        request = APIRequestFactory().post("/api/transactions/bulk-create/", data, format="json")
+        force_authenticate(request, user=self.user)
+        return TransactionBulkCreateView.as_view(**initkwargs)(request)
+
+    def item(self, amount="5.00", category=None, **fields):
+        return {
+            "type": "expense", "amount": amount, "date": "2026-01-05",
+            "category": str((category or self.food).id), **fields,
+        }
+
+    def test_reports_errors_by_index_and_creates_the_rest(self):
+        response = self.post({"transactions": [
+            self.item(),
+            self.item(amount="1.005"),
+            self.item(category=self.foreign),
+            self.item(amount="7.00", note="ok"),
+            self.item(type="refund"),
+        ]})
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["created"], 2)
+        self.assertEqual([error["index"] for error in response.data["errors"]], [1, 2, 4])
+        self.assertIn("amount", response.data["errors"][0]["errors"])
+        self.assertEqual(list(response.data["errors"][1]["errors"]), ["category"])
+        self.assertIn("type", response.data["errors"][2]["errors"])
+
+        self.assertEqual(
+            sorted(str(pk) for pk in Transaction.objects.filter(user=self.user).values_list("id", flat=True)),
+            sorted(response.data["ids"]),
+        )
+        self.assertEqual(DailyLedger.objects.get(user=self.user).total, Decimal("12.00"))
+        self.assertEqual(versioning.current(self.user)[versioning.LEDGER], 1)
+
+    def test_atomic_rejects_the_whole_batch(self):
+        response = self.post({"atomic": True, "transactions": [self.item(), self.item(amount="abc")]})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual((response.data["created"], response.data["ids"]), (0, []))
+        self.assertEqual([error["index"] for error in response.data["errors"]], [1])
+        self.assertFalse(Transaction.objects.exists())
+
+    def test_foreign_category_only(self):
+        response = self.post([self.item(category=self.foreign)])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data["errors"][0]["index"], 0)
+        self.assertFalse(Transaction.objects.exists())
+
+    def test_max_items(self):
+        response = self.post({"transactions": [self.item()] * 3}, max_items=2)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("transactions", response.data)
+        self.assertEqual(self.post({"transactions": [self.item()] * 2}, max_items=2).status_code, 201)
+
+    def test_rejects_an_empty_or_missing_list(self):
+        for data in [{"transactions": []}, {"transactions": {}}, {}]:
+            with self.subTest(data=data):
+                self.assertEqual(self.post(data).status_code, 400)
+
+
+class AsyncViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = make_user("async-reader")
+        food = Category.objects.create(user=cls.user, name="Food")
+        salary = Category.objects.create(user=cls.user, name="Salary")
+        rows = [
+            ("income", "1000.00", date(2026, 1, 1), salary, ""),
+            ("expense", "12.50", date(2026, 1, 5), food, "lunch"),
+            ("expense", "7.50", date(2026, 2, 1), food, "coffee"),
+        ]
+        ledger.record([
+            Transaction.objects.create(user=cls.user, type=tx_type, amount=amount, date=day, category=category, note=note)
+            for tx_type, amount, day, category, note in rows
+        ])
+        BudgetGoal.objects.create(user=cls.user, month=date(2026, 1, 1), target_amount="100.00", gold_amount="10.00")
+        cls.auth = {"Authorization": f"Bearer {RefreshToken.for_user(cls.user).access_token}"}
+
+    def setUp(self):
+        summary_cache.clear()
+
+    async def test_requires_a_token(self):
+        response = await self.async_client.get("/api/async/transactions/")
+        self.assertEqual(response.status_code, 401)
+        self.assertIn("WWW-Authenticate", response)
+
+        response = await self.async_client.get("/api/async/goals/", headers={"Authorization": "Bearer nope"})
+        self.assertEqual(response.status_code, 401)
+
+    async def test_not_modified(self):
+        response = await self.async_client.get("/api/async/transactions/summary/", headers=self.auth)
+        self.assertEqual(response.status_code, 200)
+
+        cached = await self.async_client.get(
+            "/api/async/transactions/summary/", headers={**self.auth, "If-None-Match": response["ETag"]}
+        )
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(cached["ETag"], response["ETag"])
+
+        await sync_to_async(versioning.bump)(self.user, versioning.LEDGER)
+        stale = await self.async_client.get(
+            "/api/async/transactions/summary/", headers={**self.auth, "If-None-Match": response["ETag"]}
+        )
+        self.assertEqual(stale.status_code, 200)
+
+    async def test_bodies_match_the_sync_views(self):
+        for path, params in [
+            ("transactions/", {}),
+            ("transactions/", {"type": "expense", "search": "lunch"}),
+            ("transactions/summary/", {}),
+            ("transactions/summary/", {"min": "10"}),
+            ("transactions/by-category/", {"limit": "1"}),
+            ("goals/", {}),
+        ]:
+            with self.subTest(path=path, params=params):
+                expected = await sync_to_async(self.client.get)(f"/api/{path}", params, headers=self.auth)
+                response = await self.async_client.get(f"/api/async/{path}", params, headers=self.auth)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.json(), expected.json())
+
+
+class SparseFieldsetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = make_user("sparse")
+        cls.food = Category.objects.create(user=cls.user, name="Food")
+        cls.tx = Transaction.objects.create(
+            user=cls.user, type="expense", amount="12.50", date=date(2026, 1, 5), category=cls.food
+        )
+        ledger.record([cls.tx])
+
+    def get(self, view, path, **params):
+        request = APIRequestFactory().get(path, params)
+        force_authenticate(request, user=self.user)
+        return view.as_view()(request)
+
+    def test_selects_fields(self):
+        response = self.get(TransactionListView, "/api/transactions/", fields="id,amount", omit="id")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["results"], [{"amount": "12.50"}])
+
+    def test_rejects_unknown_fields(self):
+        for params in [{"fields": "bogus"}, {"fields": "id,user"}, {"omit": "nope"}]:
+            with self.subTest(params=params):
+                response = self.get(TransactionListView, "/api/transactions/", **params)
+                self.assertEqual(response.status_code, 400)
+                self.assertIn(next(iter(params)), response.data)
+
+    def test_rejects_unknown_fields_on_detail(self):
+        request = APIRequestFactory().get(f"/api/transactions/{self.tx.id}/", {"fields": "bogus"})
+        force_authenticate(request, user=self.user)
+        self.assertEqual(TransactionDetailView.as_view()(request, id=self.tx.id).status_code, 400)
+
+    def test_stats_fields_are_known_with_stats(self):
+        response = self.get(CategoryListView, "/api/categories/", with_stats="1", fields="name,expense")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, [{"name": "Food", "expense": "12.50"}])
+        self.assertEqual(self.get(CategoryListView, "/api/categories/", fields="name,expense").status_code, 400)
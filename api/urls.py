@@ -1,5 +1,5 @@
 from django.urls import path
-from . import views
+from . import async_views, views
 
 urlpatterns = [
     # -------------------------
@@ -7,6 +7,7 @@ urlpatterns = [
     # -------------------------
     path("categories/", views.CategoryListView.as_view(), name="category-list"),
     path("categories/create/", views.CategoryCreateView.as_view(), name="category-create"),
+    path("categories/merge/", views.CategoryMergeView.as_view(), name="category-merge"),
     path("categories/<uuid:id>/", views.CategoryDetailView.as_view(), name="category-detail"),
     path("categories/<uuid:id>/update/", views.CategoryUpdateView.as_view(), name="category-update"),
     path("categories/<uuid:id>/delete/", views.CategoryDeleteView.as_view(), name="category-delete"),
@@ -16,16 +17,47 @@ urlpatterns = [
     # -------------------------
     path("transactions/", views.TransactionListView.as_view(), name="transaction-list"),
     path("transactions/create/", views.TransactionCreateView.as_view(), name="transaction-create"),
+    path("transactions/bulk-create/", views.TransactionBulkCreateView.as_view(), name="transaction-bulk-create"),
+    path("transactions/bulk-update/", views.TransactionBulkUpdateView.as_view(), name="transaction-bulk-update"),
+    path("transactions/bulk-delete/", views.TransactionBulkDeleteView.as_view(), name="transaction-bulk-delete"),
+    path("transactions/import/", views.TransactionImportView.as_view(), name="transaction-import"),
+    path("transactions/export/", views.TransactionExportView.as_view(), name="transaction-export"),
     path("transactions/<uuid:id>/", views.TransactionDetailView.as_view(), name="transaction-detail"),
     path("transactions/<uuid:id>/update/", views.TransactionUpdateView.as_view(), name="transaction-update"),
     path("transactions/<uuid:id>/delete/", views.TransactionDeleteView.as_view(), name="transaction-delete"),
     path("transactions/summary/", views.TransactionSummaryView.as_view(), name="transaction-summary"),
+    path("transactions/timeseries/", views.TransactionTimeSeriesView.as_view(), name="transaction-timeseries"),
+    path("transactions/by-category/", views.TransactionByCategoryView.as_view(), name="transaction-by-category"),
 
     # -------------------------
     # Goals
     # -------------------------
     path("goals/", views.BudgetGoalListView.as_view(), name="goal-list"),
+    path("goals/progress/", views.BudgetGoalProgressView.as_view(), name="goal-progress"),
     path("goals/upsert/", views.BudgetGoalUpsertView.as_view(), name="goal-upsert"),
     path("goals/<uuid:id>/", views.BudgetGoalDetailView.as_view(), name="goal-detail"),
     path("goals/<uuid:id>/delete/", views.BudgetGoalDeleteView.as_view(), name="goal-delete"),
+
+    # -------------------------
+    # Dashboard
+    # -------------------------
+    path("dashboard/", views.DashboardView.as_view(), name="dashboard"),
+
+    # -------------------------
+    # Batch
+    # -------------------------
+    path("batch/", views.BatchView.as_view(), name="batch"),
+
+    # -------------------------
+    # Sync
+    # -------------------------
+    path("sync/", views.SyncView.as_view(), name="sync"),
+
+    # -------------------------
+    # Async (ASGI) reads
+    # -------------------------
+    path("async/transactions/", async_views.TransactionListAsyncView.as_view(), name="async-transaction-list"),
+    path("async/transactions/summary/", async_views.TransactionSummaryAsyncView.as_view(), name="async-transaction-summary"),
+    path("async/transactions/by-category/", async_views.TransactionByCategoryAsyncView.as_view(), name="async-transaction-by-category"),
+    path("async/goals/", async_views.BudgetGoalListAsyncView.as_view(), name="async-goal-list"),
 ]
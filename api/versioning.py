@@ -0,0 +1,111 @@
+# app/versioning.py
+"""
+Per-user data versions and conditional GET.
+
+Writes call `bump(user, LEDGER)` / `bump(user, GOALS)` in the same DB
+transaction as the change. Reads derive a strong ETag from the versions
+they depend on plus the request path and params, and answer a matching
+If-None-Match with 304 right after authentication, before any queryset
+or serializer runs.
+"""
+import hashlib
+
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils.http import parse_etags, quote_etag
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.response import Response
+
+from .models import DataVersion
+
+LEDGER = "ledger"
+GOALS = "goals"
+SCOPES = (LEDGER, GOALS)
+
+
+def bump(user, *scopes):
+    updates = {scope: F(scope) + 1 for scope in scopes}
+    rows = DataVersion.objects.filter(user=user)
+    if rows.update(**updates):
+        return
+    try:
+        with transaction.atomic():
+            DataVersion.objects.create(user=user, **{scope: 1 for scope in scopes})
+    except IntegrityError:
+        rows.update(**updates)
+
+
+def current(user):
+    """{scope: version} for the user; one primary-key lookup."""
+    row = DataVersion.objects.filter(user=user).values_list(*SCOPES).first() or (0,) * len(SCOPES)
+    return dict(zip(SCOPES, row))
+
+
+async def acurrent(user):
+    row = await DataVersion.objects.filter(user=user).values_list(*SCOPES).afirst() or (0,) * len(SCOPES)
+    return dict(zip(SCOPES, row))
+
+
+def make_etag(user, versions, *parts):
+    raw = "|".join([str(user.pk)] + [f"{scope}={versions[scope]}" for scope in sorted(versions)] + [str(p) for p in parts])
+    return quote_etag(hashlib.sha256(raw.encode("utf-8")).hexdigest()[:40])
+
+
+def request_etag(request, versions, *extra):
+    """ETag of a read: data versions + path + query params + response format (+ `extra`)."""
+    params = sorted(request.query_params.lists())
+    renderer = getattr(request, "accepted_renderer", None)
+    return make_etag(request.user, versions, request.path, params, getattr(renderer, "format", ""), *extra)
+
+
+def etag_matches(request, etag):
+    if_none_match = request.META.get("HTTP_IF_NONE_MATCH")
+    if not if_none_match:
+        return False
+    tags = parse_etags(if_none_match)
+    return "*" in tags or etag in tags
+
+
+class NotModified(APIException):
+    status_code = status.HTTP_304_NOT_MODIFIED
+    default_detail = ""
+
+
+class ConditionalGetMixin:
+    """
+    ETag / If-None-Match support for read views.
+
+    `etag_scopes` lists the DataVersion counters the response depends on.
+    """
+    etag_scopes = (LEDGER,)
+
+    def get_etag(self, request, *args, **kwargs):
+        self.data_versions = current(request.user)
+        versions = {scope: self.data_versions[scope] for scope in self.etag_scopes}
+        return request_etag(request, versions, *self.get_etag_extra(request))
+
+    def get_etag_extra(self, request):
+        """Inputs besides versions and params that the response depends on (e.g. today's date)."""
+        return ()
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if request.method not in ("GET", "HEAD"):
+            return
+
+        self.etag = self.get_etag(request, *args, **kwargs)
+        if etag_matches(request, self.etag):
+            raise NotModified()
+
+    def handle_exception(self, exc):
+        if isinstance(exc, NotModified):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": self.etag})
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        etag = getattr(self, "etag", None)
+        if etag and response.status_code == status.HTTP_200_OK and not response.has_header("ETag"):
+            response["ETag"] = etag
+        return response
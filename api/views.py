@@ -1,38 +1,118 @@
 # app/views.py
-from rest_framework import generics, status
+import io
+import json
+
+from rest_framework import generics, serializers, status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.exceptions import ValidationError
+from rest_framework.parsers import MultiPartParser
 from django.shortcuts import get_object_or_404
-from django.db.models import Sum, Q
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from bugettracker.streaming import CSVRenderer, NDJSONRenderer, streaming_response
 
+from . import aggregates, batch, ledger, sync
+from .cache import CachedAggregateMixin
+from .filters import filter_transactions
+from .exporters import iter_csv, iter_ndjson
+from .importers import TransactionCSVImporter
 from .models import Category, Transaction, BudgetGoal
-from .serializers import CategorySerializer, TransactionSerializer, BudgetGoalSerializer
+from .serializers import (
+    CategorySerializer, CategoryStatsSerializer, TransactionSerializer, BudgetGoalSerializer, TransactionBulkItemSerializer,
+    TransactionBulkUpdateSerializer, TransactionFilterSerializer, CategoryMergeSerializer, BatchSerializer,
+)
+from .pagination import TransactionCursorPagination
+from .renderers import FastJSONRenderer
+from .versioning import ConditionalGetMixin, bump, GOALS, LEDGER
+from .fieldsets import SparseQuerysetMixin
+from .fastpath import FastListMixin, FastRowSerializer
+
+
+# =========================
+# Sparse fieldsets (?fields= / ?omit=)
+# =========================
+class CategoryFieldsMixin(SparseQuerysetMixin):
+    sparse_sources = {
+        "id": ["id"],
+        "name": ["name"],
+        "icon": ["icon"],
+        "created_at": ["created_at"],
+        "updated_at": ["updated_at"],
+    }
+
+
+class TransactionFieldsMixin(SparseQuerysetMixin):
+    sparse_sources = {
+        "id": ["id"],
+        "type": ["type"],
+        "amount": ["amount"],
+        "date": ["date"],
+        "category": ["category"],
+        "category_name": ["category__name"],
+        "category_icon": ["category__icon"],
+        "note": ["note"],
+        "created_at": ["created_at"],
+        "updated_at": ["updated_at"],
+    }
+    # keyset pagination reads these from every row
+    sparse_required = ("id", "date", "created_at")
+    sparse_related = ("category",)
+
+
+class BudgetGoalFieldsMixin(SparseQuerysetMixin):
+    sparse_sources = {
+        "id": ["id"],
+        "user": ["user"],
+        "month": ["month"],
+        "target_amount": ["target_amount"],
+        "gold_amount": ["gold_amount"],
+        "created_at": ["created_at"],
+        "updated_at": ["updated_at"],
+    }
 
 
 # =========================
 # Category
 # =========================
-class CategoryListView(generics.ListAPIView):
+class CategoryListView(ConditionalGetMixin, CategoryFieldsMixin, FastListMixin, generics.ListAPIView):
+    """?with_stats=1 adds transaction_count, income, expense and last_used (window: ?from= / ?to=)."""
     serializer_class = CategorySerializer
     permission_classes = [IsAuthenticated]
 
+    def with_stats(self):
+        return self.request.query_params.get("with_stats") in ["1", "true"]
+
+    def get_serializer_class(self):
+        return CategoryStatsSerializer if self.with_stats() else CategorySerializer
+
     def get_queryset(self):
-        return Category.objects.filter(user=self.request.user).order_by("-created_at")
+        qs = self.narrow_queryset(Category.objects.filter(user=self.request.user).order_by("-created_at"))
+        if self.with_stats():
+            qs = aggregates.with_category_stats(qs, self.request.query_params)
+        return qs
 
 
 class CategoryCreateView(generics.CreateAPIView):
     serializer_class = CategorySerializer
     permission_classes = [IsAuthenticated]
 
+    def perform_create(self, serializer):
+        with transaction.atomic():
+            serializer.save()
+            bump(self.request.user, LEDGER)
+
 
-class CategoryDetailView(generics.RetrieveAPIView):
+class CategoryDetailView(ConditionalGetMixin, CategoryFieldsMixin, generics.RetrieveAPIView):
     serializer_class = CategorySerializer
     permission_classes = [IsAuthenticated]
     lookup_field = "id"
 
     def get_queryset(self):
-        return Category.objects.filter(user=self.request.user)
+        return self.narrow_queryset(Category.objects.filter(user=self.request.user))
 
 
 class CategoryUpdateView(generics.UpdateAPIView):
@@ -43,6 +123,11 @@ class CategoryUpdateView(generics.UpdateAPIView):
     def get_queryset(self):
         return Category.objects.filter(user=self.request.user)
 
+    def perform_update(self, serializer):
+        with transaction.atomic():
+            serializer.save()
+            bump(self.request.user, LEDGER)
+
 
 class CategoryDeleteView(generics.DestroyAPIView):
     permission_classes = [IsAuthenticated]
@@ -51,61 +136,99 @@ class CategoryDeleteView(generics.DestroyAPIView):
     def get_queryset(self):
         return Category.objects.filter(user=self.request.user)
 
+    def perform_destroy(self, instance):
+        with transaction.atomic():
+            sync.record_deletions(self.request.user, sync.CATEGORY, [instance.id])
+            instance.delete()
+            bump(self.request.user, LEDGER)
 
-# =========================
-# Transaction
-# =========================
-class TransactionListView(generics.ListAPIView):
-    serializer_class = TransactionSerializer
+
+class CategoryMergeView(APIView):
+    """
+    POST {"sources": [...], "target": "<id>"}
+
+    Moves every transaction of the source categories to the target with one
+    UPDATE, then deletes the sources. All or nothing.
+    """
     permission_classes = [IsAuthenticated]
 
-    def get_queryset(self):
-        qs = Transaction.objects.select_related("category").filter(user=self.request.user).order_by("-date", "-created_at")
+    def post(self, request):
+        serializer = CategoryMergeSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        sources = serializer.validated_data["sources"]
+        target = serializer.validated_data["target"]
+
+        owned = set(
+            Category.objects.filter(user=request.user, id__in=sources + [target]).values_list("id", flat=True)
+        )
+        missing = [str(pk) for pk in sources + [target] if pk not in owned]
+        if missing:
+            raise ValidationError({"detail": f"Unknown category id(s): {', '.join(missing)}"})
 
-        tx_type = self.request.query_params.get("type")
-        category = self.request.query_params.get("category")
-        min_amount = self.request.query_params.get("min")
-        max_amount = self.request.query_params.get("max")
-        date_from = self.request.query_params.get("from")
-        date_to = self.request.query_params.get("to")
-        search = (self.request.query_params.get("search") or "").strip()
+        with transaction.atomic():
+            # TransactionSerializer accepts any category pk, so other users' rows may point here too
+            if Transaction.objects.filter(category_id__in=sources).exclude(user=request.user).exists():
+                raise ValidationError({"detail": "A source category is used by another account's transactions."})
 
-        if tx_type and tx_type != "all":
-            qs = qs.filter(type=tx_type)
+            qs = Transaction.objects.filter(user=request.user, category_id__in=sources)
+            removed = ledger.add_queryset(ledger.new_deltas(), qs, sign=-1)
+            moved_count = qs.update(category_id=target, updated_at=timezone.now())
+            ledger.apply(ledger.moved(removed, category_id=target))
 
-        if category:
-            qs = qs.filter(category_id=category)
+            sync.record_deletions(request.user, sync.CATEGORY, sources)
+            Category.objects.filter(id__in=sources).delete()
+            bump(request.user, LEDGER)
 
-        if min_amount not in [None, ""]:
-            qs = qs.filter(amount__gte=min_amount)
+        return Response({
+            "success": True,
+            "target": str(target),
+            "merged_count": len(sources),
+            "moved_count": moved_count,
+            "message": f"{len(sources)} categor{'y' if len(sources) == 1 else 'ies'} merged, {moved_count} transaction(s) moved",
+        })
 
-        if max_amount not in [None, ""]:
-            qs = qs.filter(amount__lte=max_amount)
 
-        if date_from:
-            qs = qs.filter(date__gte=date_from)
+# =========================
+# Transaction
+# =========================
+class TransactionListView(ConditionalGetMixin, TransactionFieldsMixin, FastListMixin, generics.ListAPIView):
+    serializer_class = TransactionSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = TransactionCursorPagination
+    fast_required_paths = ("id", "date", "created_at")
 
-        if date_to:
-            qs = qs.filter(date__lte=date_to)
+    def get_queryset(self):
+        qs = self.narrow_queryset(Transaction.objects.filter(user=self.request.user).order_by("-date", "-created_at", "-id"))
+        return filter_transactions(qs, self.request.query_params, rank=self.order_by_relevance())
 
-        if search:
-            qs = qs.filter(Q(note__icontains=search) | Q(category__name__icontains=search))
+    def order_by_relevance(self):
+        params = self.request.query_params
+        return params.get("order") == "relevance" and bool((params.get("search") or "").strip())
 
-        return qs
+    def paginate_queryset(self, queryset):
+        if self.order_by_relevance():
+            return self.paginator.paginate_ranked(queryset, self.request, view=self)
+        return super().paginate_queryset(queryset)
 
 
 class TransactionCreateView(generics.CreateAPIView):
     serializer_class = TransactionSerializer
     permission_classes = [IsAuthenticated]
 
+    def perform_create(self, serializer):
+        with transaction.atomic():
+            tx = serializer.save()
+            ledger.record([tx])
+            bump(self.request.user, LEDGER)
 
-class TransactionDetailView(generics.RetrieveAPIView):
+
+class TransactionDetailView(ConditionalGetMixin, TransactionFieldsMixin, generics.RetrieveAPIView):
     serializer_class = TransactionSerializer
     permission_classes = [IsAuthenticated]
     lookup_field = "id"
 
     def get_queryset(self):
-        return Transaction.objects.select_related("category").filter(user=self.request.user)
+        return self.narrow_queryset(Transaction.objects.filter(user=self.request.user))
 
 
 class TransactionUpdateView(generics.UpdateAPIView):
@@ -114,7 +237,22 @@ class TransactionUpdateView(generics.UpdateAPIView):
     lookup_field = "id"
 
     def get_queryset(self):
-        return Transaction.objects.filter(user=self.request.user)
+        qs = Transaction.objects.filter(user=self.request.user)
+        if self.request.method in ("PUT", "PATCH"):
+            # the ledger delta is taken from this row, keep it locked until it is recorded
+            qs = qs.select_for_update()
+        return qs
+
+    def update(self, request, *args, **kwargs):
+        with transaction.atomic():
+            return super().update(request, *args, **kwargs)
+
+    def perform_update(self, serializer):
+        with transaction.atomic():
+            before = ledger.snapshot(serializer.instance)
+            tx = serializer.save()
+            ledger.record_change(before, tx)
+            bump(self.request.user, LEDGER)
 
 
 class TransactionDeleteView(generics.DestroyAPIView):
@@ -122,64 +260,294 @@ class TransactionDeleteView(generics.DestroyAPIView):
     lookup_field = "id"
 
     def get_queryset(self):
-        return Transaction.objects.filter(user=self.request.user)
+        qs = Transaction.objects.filter(user=self.request.user)
+        if self.request.method == "DELETE":
+            qs = qs.select_for_update()
+        return qs
+
+    def destroy(self, request, *args, **kwargs):
+        with transaction.atomic():
+            return super().destroy(request, *args, **kwargs)
+
+    def perform_destroy(self, instance):
+        with transaction.atomic():
+            ledger.record([instance], sign=-1)
+            sync.record_deletions(self.request.user, sync.TRANSACTION, [instance.id])
+            instance.delete()
+            bump(self.request.user, LEDGER)
+
 
+class TransactionBulkCreateView(APIView):
+    """
+    POST {"transactions": [...], "atomic": false}
 
-class TransactionSummaryView(APIView):
+    Rows are validated independently. With atomic=false the valid rows are
+    inserted and the invalid ones reported by index; with atomic=true any
+    error rejects the whole batch.
+    """
     permission_classes = [IsAuthenticated]
+    max_items = 5000
 
-    def get(self, request):
-        qs = Transaction.objects.filter(user=request.user)
+    def post(self, request):
+        items = request.data.get("transactions") if isinstance(request.data, dict) else request.data
+        atomic = isinstance(request.data, dict) and str(request.data.get("atomic", "")).lower() in ["1", "true"]
+
+        if not isinstance(items, list) or not items:
+            raise ValidationError({"transactions": "Must be a non-empty list."})
+        if len(items) > self.max_items:
+            raise ValidationError({"transactions": f"At most {self.max_items} transactions per request."})
+
+        errors = []
+        valid = []
+        for index, item in enumerate(items):
+            serializer = TransactionBulkItemSerializer(data=item)
+            if serializer.is_valid():
+                valid.append((index, serializer.validated_data))
+            else:
+                errors.append({"index": index, "errors": serializer.errors})
+
+        wanted = {data["category"] for _, data in valid}
+        owned = set(
+            Category.objects.filter(user=request.user, id__in=wanted).values_list("id", flat=True)
+        )
+
+        rows = []
+        for index, data in valid:
+            if data["category"] not in owned:
+                errors.append({
+                    "index": index,
+                    "errors": {"category": [f'Invalid pk "{data["category"]}" - object does not exist.']},
+                })
+                continue
+            rows.append(Transaction(
+                user=request.user,
+                type=data["type"],
+                amount=data["amount"],
+                date=data["date"],
+                category_id=data["category"],
+                note=data["note"],
+            ))
+
+        errors.sort(key=lambda e: e["index"])
+
+        if (atomic and errors) or not rows:
+            return Response({"created": 0, "ids": [], "errors": errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        with transaction.atomic():
+            created = Transaction.objects.bulk_create(rows, batch_size=500)
+            ledger.record(created)
+            bump(request.user, LEDGER)
+
+        return Response(
+            {"created": len(created), "ids": [str(tx.id) for tx in created], "errors": errors},
+            status=status.HTTP_201_CREATED,
+        )
 
-        tx_type = request.query_params.get("type")
-        category = request.query_params.get("category")
-        min_amount = request.query_params.get("min")
-        max_amount = request.query_params.get("max")
-        date_from = request.query_params.get("from")
-        date_to = request.query_params.get("to")
-        search = (request.query_params.get("search") or "").strip()
 
-        if tx_type and tx_type != "all":
-            qs = qs.filter(type=tx_type)
+class TransactionBulkTargetMixin:
+    """
+    Resolves the rows a bulk operation applies to, always scoped to request.user:
+    either {"ids": [...]} or {"filter": {...}} with the transaction list params.
+    """
+    max_ids = 5000
 
-        if category:
-            qs = qs.filter(category_id=category)
+    def get_target_queryset(self, request):
+        qs = Transaction.objects.filter(user=request.user)
+        ids = request.data.get("ids")
+        filters = request.data.get("filter")
+
+        if ids is not None:
+            if not isinstance(ids, list) or not ids:
+                raise ValidationError({"ids": "ids must be a non-empty list"})
+            if len(ids) > self.max_ids:
+                raise ValidationError({"ids": f"At most {self.max_ids} ids per request."})
+            field = serializers.ListField(child=serializers.UUIDField())
+            return qs.filter(id__in=field.run_validation(ids))
+
+        if not isinstance(filters, dict) or not filters:
+            raise ValidationError({"detail": "Provide ids (non-empty list) or filter (non-empty object)."})
+        serializer = TransactionFilterSerializer(data=filters)
+        if not serializer.is_valid():
+            raise ValidationError({"filter": serializer.errors})
+        return filter_transactions(qs, serializer.validated_data)
+
+
+class TransactionBulkUpdateView(TransactionBulkTargetMixin, APIView):
+    """POST {"ids": [...] | "filter": {...}, "set": {"category"?, "type"?, "note"?}}"""
+    permission_classes = [IsAuthenticated]
 
-        if min_amount not in [None, ""]:
-            qs = qs.filter(amount__gte=min_amount)
+    def post(self, request):
+        if not isinstance(request.data, dict):
+            raise ValidationError({"detail": "Expected a JSON object."})
 
-        if max_amount not in [None, ""]:
-            qs = qs.filter(amount__lte=max_amount)
+        serializer = TransactionBulkUpdateSerializer(data=request.data.get("set") or {})
+        serializer.is_valid(raise_exception=True)
+        changes = dict(serializer.validated_data)
+
+        category_id = changes.pop("category", None)
+        if category_id is not None:
+            if not Category.objects.filter(user=request.user, id=category_id).exists():
+                raise ValidationError({"set": {"category": [f'Invalid pk "{category_id}" - object does not exist.']}})
+            changes["category_id"] = category_id
+
+        with transaction.atomic():
+            qs = self.get_target_queryset(request)
+            rekeyed = "category_id" in changes or "type" in changes
+            if rekeyed:
+                removed = ledger.add_queryset(ledger.new_deltas(), qs, sign=-1)
+            updated = qs.update(**changes, updated_at=timezone.now())
+            if rekeyed:
+                ledger.apply(ledger.moved(removed, category_id=category_id, tx_type=changes.get("type")))
+            if updated:
+                bump(request.user, LEDGER)
 
-        if date_from:
-            qs = qs.filter(date__gte=date_from)
+        return Response({
+            "success": True,
+            "updated_count": updated,
+            "message": f"{updated} transaction(s) updated successfully",
+        })
 
-        if date_to:
-            qs = qs.filter(date__lte=date_to)
 
-        if search:
-            qs = qs.filter(Q(note__icontains=search) | Q(category__name__icontains=search))
+class TransactionBulkDeleteView(TransactionBulkTargetMixin, APIView):
+    """POST {"ids": [...]} or {"filter": {...}}"""
+    permission_classes = [IsAuthenticated]
 
-        income = qs.filter(type="income").aggregate(total=Sum("amount"))["total"] or 0
-        expense = qs.filter(type="expense").aggregate(total=Sum("amount"))["total"] or 0
+    def post(self, request):
+        if not isinstance(request.data, dict):
+            raise ValidationError({"detail": "Expected a JSON object."})
+
+        with transaction.atomic():
+            qs = self.get_target_queryset(request)
+            removed = ledger.add_queryset(ledger.new_deltas(), qs, sign=-1)
+            sync.record_deletions(request.user, sync.TRANSACTION, qs.values_list("id", flat=True).iterator())
+            deleted_count, _ = qs.delete()
+            ledger.apply(removed)
+            if deleted_count:
+                bump(request.user, LEDGER)
+
+        if not deleted_count:
+            return Response(
+                {"success": False, "message": "No transactions found to delete"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
 
         return Response({
-            "income": income,
-            "expense": expense,
-            "balance": income - expense,
-            "count": qs.count()
+            "success": True,
+            "deleted_count": deleted_count,
+            "message": f"{deleted_count} transaction(s) deleted successfully",
         })
 
 
+class TransactionImportView(APIView):
+    """
+    POST multipart `file` (CSV). Returns the import report; with ?stream=1
+    the response is NDJSON with one progress line per imported chunk.
+    """
+    permission_classes = [IsAuthenticated]
+    parser_classes = [MultiPartParser]
+
+    def post(self, request):
+        upload = request.FILES.get("file")
+        if upload is None:
+            raise ValidationError({"file": "A CSV file is required."})
+
+        stream = io.TextIOWrapper(upload.file, encoding="utf-8-sig", newline="")
+        importer = TransactionCSVImporter(request.user)
+        progress = importer.run(stream)
+
+        if request.query_params.get("stream") in ["1", "true"]:
+            def lines():
+                try:
+                    for report in progress:
+                        yield json.dumps(report) + "\n"
+                except (ValueError, UnicodeDecodeError) as exc:
+                    yield json.dumps({"done": True, "error": str(exc)}) + "\n"
+
+            return streaming_response(request, lines(), "application/x-ndjson", batch_size=1)
+
+        try:
+            for report in progress:
+                pass
+        except (ValueError, UnicodeDecodeError) as exc:
+            raise ValidationError({"file": str(exc)})
+
+        return Response(report, status=status.HTTP_201_CREATED)
+
+
+class TransactionExportView(APIView):
+    """GET with the list filters; ?format=csv (default) or ?format=ndjson."""
+    permission_classes = [IsAuthenticated]
+    renderer_classes = [FastJSONRenderer, CSVRenderer, NDJSONRenderer]
+
+    def get(self, request):
+        export_format = request.query_params.get("format") or "csv"
+        if export_format not in ["csv", "ndjson"]:
+            raise ValidationError({"format": "Must be csv or ndjson."})
+
+        qs = filter_transactions(Transaction.objects.filter(user=request.user), request.query_params)
+        qs = qs.order_by("-date", "-created_at", "-id")
+
+        if export_format == "ndjson":
+            response = streaming_response(request, iter_ndjson(qs), "application/x-ndjson")
+        else:
+            response = streaming_response(request, iter_csv(qs), "text/csv")
+        response["Content-Disposition"] = f'attachment; filename="transactions.{export_format}"'
+        return response
+
+
+class TransactionSummaryView(ConditionalGetMixin, CachedAggregateMixin, APIView):
+    permission_classes = [IsAuthenticated]
+    cache_kind = "summary"
+
+    def get(self, request):
+        return Response(self.cached(lambda: aggregates.summary(request.user, request.query_params)))
+
+
+class TransactionTimeSeriesView(ConditionalGetMixin, CachedAggregateMixin, APIView):
+    permission_classes = [IsAuthenticated]
+    cache_kind = "timeseries"
+
+    def get(self, request):
+        interval = request.query_params.get("interval") or "month"
+        if interval not in aggregates.INTERVALS:
+            raise ValidationError({"interval": f"Must be one of: {', '.join(aggregates.INTERVALS)}."})
+
+        results = self.cached(lambda: aggregates.timeseries(request.user, request.query_params, interval))
+        return Response({"interval": interval, "results": results})
+
+
+class TransactionByCategoryView(ConditionalGetMixin, CachedAggregateMixin, APIView):
+    permission_classes = [IsAuthenticated]
+    cache_kind = "by-category"
+
+    @staticmethod
+    def get_limit(params):
+        limit = params.get("limit")
+        if limit in [None, ""]:
+            return None
+        try:
+            limit = int(limit)
+        except ValueError:
+            raise ValidationError({"limit": "Must be an integer."})
+        if limit < 1:
+            raise ValidationError({"limit": "Must be a positive integer."})
+        return limit
+
+    def get(self, request):
+        limit = self.get_limit(request.query_params)
+        return Response(self.cached(lambda: aggregates.by_category(request.user, request.query_params, limit=limit)))
+
+
 # =========================
 # Goals
 # =========================
-class BudgetGoalListView(generics.ListAPIView):
+class BudgetGoalListView(ConditionalGetMixin, BudgetGoalFieldsMixin, FastListMixin, generics.ListAPIView):
     serializer_class = BudgetGoalSerializer
     permission_classes = [IsAuthenticated]
+    etag_scopes = (GOALS,)
 
     def get_queryset(self):
-        return BudgetGoal.objects.filter(user=self.request.user).order_by("-month")
+        return self.narrow_queryset(BudgetGoal.objects.filter(user=self.request.user).order_by("-month"))
 
 
 class BudgetGoalUpsertView(APIView):
@@ -191,25 +559,28 @@ class BudgetGoalUpsertView(APIView):
 
         month = serializer.validated_data["month"].replace(day=1)
 
-        obj, _ = BudgetGoal.objects.update_or_create(
-            user=request.user,   # ✅ IMPORTANT
-            month=month,
-            defaults={
-                "target_amount": serializer.validated_data["target_amount"],
-                "gold_amount": serializer.validated_data["gold_amount"],
-            }
-        )
+        with transaction.atomic():
+            obj, _ = BudgetGoal.objects.update_or_create(
+                user=request.user,   # ✅ IMPORTANT
+                month=month,
+                defaults={
+                    "target_amount": serializer.validated_data["target_amount"],
+                    "gold_amount": serializer.validated_data["gold_amount"],
+                }
+            )
+            bump(request.user, GOALS)
 
         return Response(BudgetGoalSerializer(obj).data, status=status.HTTP_201_CREATED)
 
 
-class BudgetGoalDetailView(generics.RetrieveAPIView):
+class BudgetGoalDetailView(ConditionalGetMixin, BudgetGoalFieldsMixin, generics.RetrieveAPIView):
     serializer_class = BudgetGoalSerializer
     permission_classes = [IsAuthenticated]
+    etag_scopes = (GOALS,)
     lookup_field = "id"
 
     def get_queryset(self):
-        return BudgetGoal.objects.filter(user=self.request.user)
+        return self.narrow_queryset(BudgetGoal.objects.filter(user=self.request.user))
 
 
 class BudgetGoalDeleteView(generics.DestroyAPIView):
@@ -218,3 +589,181 @@ class BudgetGoalDeleteView(generics.DestroyAPIView):
 
     def get_queryset(self):
         return BudgetGoal.objects.filter(user=self.request.user)
+
+    def perform_destroy(self, instance):
+        with transaction.atomic():
+            sync.record_deletions(self.request.user, sync.GOAL, [instance.id])
+            instance.delete()
+            bump(self.request.user, GOALS)
+
+
+class BudgetGoalProgressView(ConditionalGetMixin, APIView):
+    """
+    Goals with the month's actual totals: spent, remaining, percent_used,
+    over_budget (spent > target_amount) and goal_reached (income - spent >= gold_amount).
+    Optional ?from= / ?to= limit the goal months.
+    """
+    permission_classes = [IsAuthenticated]
+    etag_scopes = (LEDGER, GOALS)
+
+    def get(self, request):
+        goals = BudgetGoal.objects.filter(user=request.user).order_by("-month")
+        if request.query_params.get("from"):
+            goals = goals.filter(month__gte=request.query_params["from"])
+        if request.query_params.get("to"):
+            goals = goals.filter(month__lte=request.query_params["to"])
+
+        data = []
+        for item in aggregates.goal_progress(request.user, goals):
+            row = BudgetGoalSerializer(item.pop("goal")).data
+            row.update(item)
+            data.append(row)
+        return Response(data)
+
+
+# =========================
+# Dashboard
+# =========================
+class DashboardView(ConditionalGetMixin, CachedAggregateMixin, APIView):
+    """
+    GET ?month=YYYY-MM&top=5&recent=5
+
+    Everything the home screen needs in one document: the month's summary,
+    its top spending categories, its goal with progress and the latest
+    transactions. Without ?month= the current month is used.
+    """
+    permission_classes = [IsAuthenticated]
+    etag_scopes = (LEDGER, GOALS)
+    cache_kind = "dashboard"
+    max_items = 50
+
+    def get_month(self):
+        raw = self.request.query_params.get("month")
+        if not raw:
+            return timezone.localdate().replace(day=1)
+        month = parse_date(raw + "-01" if len(raw) == 7 else raw)
+        if month is None:
+            raise ValidationError({"month": "Use YYYY-MM."})
+        return month.replace(day=1)
+
+    def get_count(self, name, default):
+        raw = self.request.query_params.get(name)
+        if raw in [None, ""]:
+            return default
+        try:
+            value = int(raw)
+        except ValueError:
+            raise ValidationError({name: "Must be an integer."})
+        if not 0 <= value <= self.max_items:
+            raise ValidationError({name: f"Must be between 0 and {self.max_items}."})
+        return value
+
+    def get_etag_extra(self, request):
+        # the default month moves with the calendar, not with the data
+        return (self.get_month().isoformat(),)
+
+    def get(self, request):
+        month = self.get_month()
+        top = self.get_count("top", 5)
+        recent = self.get_count("recent", 5)
+
+        overview = self.cached(
+            lambda: aggregates.month_overview(request.user, month, top=top),
+            params={"from": month.isoformat(), "limit": str(top)},
+        )
+
+        goal = BudgetGoal.objects.filter(user=request.user, month=month).first()
+        if goal is not None:
+            progress = aggregates.progress_of(goal, overview["summary"])
+            goal = BudgetGoalSerializer(progress.pop("goal")).data
+            goal.update(progress)
+
+        fast = FastRowSerializer(TransactionSerializer(context={}))
+        latest = []
+        if recent:
+            rows = (
+                Transaction.objects.filter(user=request.user)
+                .order_by("-date", "-created_at", "-id")
+                .values(*fast.paths)[:recent]
+            )
+            latest = fast.serialize(rows)
+
+        return Response({
+            "month": month,
+            "summary": overview["summary"],
+            "top_categories": overview["top_categories"],
+            "goal": goal,
+            "recent_transactions": latest,
+        })
+
+
+# =========================
+# Batch
+# =========================
+class BatchView(APIView):
+    """
+    POST {"requests": [{"id"?, "method", "path", "body"?, "headers"?}, ...],
+          "parallel": false, "atomic": false}
+
+    Runs up to 20 sub-requests against the /api/ routes as the current user
+    and returns {"responses": [{"id", "status", "headers", "body"}, ...]} in
+    request order. parallel=true runs a GET/HEAD-only batch concurrently;
+    atomic=true runs a write-only batch in one DB transaction, stopping and
+    rolling everything back at the first 4xx/5xx.
+    """
+    permission_classes = [IsAuthenticated]
+    max_workers = 8
+
+    def post(self, request):
+        serializer = BatchSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        items = serializer.validated_data["requests"]
+
+        if serializer.validated_data["parallel"]:
+            return Response({"responses": batch.run_parallel(request, items, self.max_workers)})
+
+        if not serializer.validated_data["atomic"]:
+            return Response({"responses": [batch.dispatch(request, item) for item in items]})
+
+        responses = []
+        with transaction.atomic():
+            for item in items:
+                responses.append(batch.dispatch(request, item))
+                if responses[-1]["status"] >= 400:
+                    transaction.set_rollback(True)
+                    break
+        rolled_back = responses[-1]["status"] >= 400
+
+        skipped = items[len(responses):]
+        responses += [
+            batch.envelope(item, status.HTTP_424_FAILED_DEPENDENCY, {"detail": "Not run: an earlier sub-request failed."})
+            for item in skipped
+        ]
+        return Response({"rolled_back": rolled_back, "responses": responses})
+
+
+# =========================
+# Sync
+# =========================
+class SyncView(APIView):
+    """
+    GET ?token=<sync_token>&page_size=<n>
+
+    Changed and deleted categories, transactions and goals since the token
+    was issued (no token: full sync). Keep requesting with the returned
+    sync_token while has_more is true, then store it for the next sync.
+    """
+    permission_classes = [IsAuthenticated]
+    default_page_size = 500
+    max_page_size = 2000
+
+    def get(self, request):
+        page_size = request.query_params.get("page_size") or self.default_page_size
+        try:
+            page_size = min(int(page_size), self.max_page_size)
+        except ValueError:
+            raise ValidationError({"page_size": "Must be an integer."})
+        if page_size < 1:
+            raise ValidationError({"page_size": "Must be a positive integer."})
+
+        return Response(sync.changes(request.user, request.query_params.get("token"), page_size))
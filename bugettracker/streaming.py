@@ -0,0 +1,70 @@
+"""
+Streaming responses that stream under both WSGI and ASGI.
+
+Under ASGI, Django cannot send a StreamingHttpResponse fed by a synchronous
+iterator incrementally: it consumes the whole iterator with
+sync_to_async(list) first, so the body ends up in memory before the first
+byte goes out. `streaming_response()` hands ASGI an async generator instead,
+which pulls from the same synchronous iterator in the request's sync
+thread, where the iterator's database connection lives.
+
+The CSV / NDJSON renderers only let those formats through DRF's content
+negotiation; the views build the streamed body themselves.
+"""
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+
+
+class Echo:
+    """File-like object whose write() hands the line back to the caller (csv.writer target)."""
+    def write(self, value):
+        return value
+
+
+async def _pull(iterator, batch_size):
+    next_batch = sync_to_async(lambda: list(islice(iterator, batch_size)), thread_sensitive=True)
+    while True:
+        batch = await next_batch()
+        if not batch:
+            return
+        yield "".join(batch)
+
+
+def streaming_response(request, lines, content_type, batch_size=100):
+    """
+    StreamingHttpResponse over an iterator of str. Under ASGI the lines are
+    sent `batch_size` at a time; use 1 when each line must go out as soon
+    as it is produced (progress reports).
+    """
+    django_request = getattr(request, "_request", request)
+    if isinstance(django_request, ASGIRequest):
+        lines = _pull(iter(lines), batch_size)
+    return StreamingHttpResponse(lines, content_type=content_type)
+
+
+class StreamingFormatRenderer(BaseRenderer):
+    """
+    Lets `?format=<fmt>` pass DRF content negotiation for views that build
+    their own (streaming) response body. Anything DRF renders through it,
+    e.g. an error response, is encoded as JSON.
+    """
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if isinstance(data, (bytes, str)):
+            return data
+        return JSONRenderer().render(data, renderer_context=renderer_context)
+
+
+class CSVRenderer(StreamingFormatRenderer):
+    media_type = "text/csv"
+    format = "csv"
+
+
+class NDJSONRenderer(StreamingFormatRenderer):
+    media_type = "application/x-ndjson"
+    format = "ndjson"